@@ -44,7 +44,13 @@ from .exceptions import (
     UwacommError,
 )
 from .fragmentation import fragment_message, iter_fragments, reassemble_fragments
-from .framing import frame_message, frame_with_id, unframe_message, unframe_with_id
+from .framing import (
+    encode_framed,
+    frame_message,
+    frame_with_id,
+    unframe_message,
+    unframe_with_id,
+)
 from .models import BaseMessage, BoundedInt, FixedBytes, FixedStr, VarBytes, VarList, VarStr
 from .models.fields import BoundedFloat
 from .protobuf import proto_conversion_notes, to_proto_schema
@@ -53,14 +59,19 @@ from .routing import (
     RoutingHeader,
     decode_by_id,
     decode_with_routing,
+    encode_routing_batch,
     encode_with_routing,
+    pack_routing_batch,
     register_message,
+    unpack_routing_batch,
 )
 from .utils import (
     crc16,
     crc16_bytes,
+    crc16_update,
     crc32,
     crc32_bytes,
+    crc32_update,
     encoded_bits,
     encoded_size,
     field_sizes,
@@ -90,6 +101,9 @@ __all__ = [
     "RoutingHeader",
     "encode_with_routing",
     "decode_with_routing",
+    "pack_routing_batch",
+    "unpack_routing_batch",
+    "encode_routing_batch",
     # Modem Drivers (Hardware-in-the-Loop simulation)
     "modem",
     # Exceptions
@@ -105,6 +119,7 @@ __all__ = [
     "unframe_message",
     "frame_with_id",
     "unframe_with_id",
+    "encode_framed",
     # Fragmentation
     "fragment_message",
     "reassemble_fragments",
@@ -112,8 +127,10 @@ __all__ = [
     # CRC
     "crc16",
     "crc16_bytes",
+    "crc16_update",
     "crc32",
     "crc32_bytes",
+    "crc32_update",
     "verify_crc16",
     "verify_crc32",
     # Sizing
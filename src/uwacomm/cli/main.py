@@ -6,12 +6,13 @@ import argparse
 import sys
 from pathlib import Path
 
-from ..cli.analyze import analyze_file
 
-
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point for the uwacomm CLI.
 
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+
     Returns:
         Exit code (0 for success, non-zero for error)
     """
@@ -40,7 +41,7 @@ For more information, see: https://github.com/patel999jay/uwacomm
         version="uwacomm 0.1.0",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle --analyze
     if args.analyze:
@@ -49,6 +50,9 @@ For more information, see: https://github.com/patel999jay/uwacomm
             print(f"Error: File not found: {file_path}", file=sys.stderr)
             return 1
 
+        # Imported here so --help/--version do not load the schema machinery
+        from .analyze import analyze_file
+
         try:
             analyze_file(file_path)
             return 0
@@ -6,12 +6,16 @@ All operations are deterministic and big-endian by default.
 
 from __future__ import annotations
 
+# BitPacker moves whole bytes out of its accumulator once it holds this many bits,
+# keeping the shifts on a small int regardless of message size
+_FLUSH_BITS = 64
+
 
 class BitPacker:
     """Packs values bit-by-bit into a byte buffer.
 
-    This class maintains an internal bit buffer and provides methods to write
-    individual bits, integers of arbitrary bit width, and other primitives.
+    Values are shifted into an integer accumulator (one shift-and-or per value, not
+    one step per bit); complete bytes are moved to a byte buffer as it fills.
 
     Example:
         >>> packer = BitPacker()
@@ -21,9 +25,20 @@ class BitPacker:
         >>> data = packer.to_bytes()
     """
 
+    __slots__ = ("_out", "_acc", "_nbits")
+
     def __init__(self) -> None:
         """Initialize an empty bit packer."""
-        self._bits: list[int] = []  # List of 0s and 1s
+        self._out = bytearray()  # Completed bytes
+        self._acc = 0  # Pending bits not yet moved to _out (MSB first)
+        self._nbits = 0  # Number of pending bits in _acc
+
+    def _flush(self) -> None:
+        """Move all complete bytes from the accumulator to the output buffer."""
+        rem = self._nbits & 7
+        self._out += (self._acc >> rem).to_bytes(self._nbits >> 3, "big")
+        self._acc &= (1 << rem) - 1
+        self._nbits = rem
 
     def write_bool(self, value: bool) -> None:
         """Write a boolean as a single bit.
@@ -31,7 +46,10 @@ class BitPacker:
         Args:
             value: Boolean value to write (True=1, False=0)
         """
-        self._bits.append(1 if value else 0)
+        self._acc = (self._acc << 1) | (1 if value else 0)
+        self._nbits += 1
+        if self._nbits >= _FLUSH_BITS:
+            self._flush()
 
     def write_uint(self, value: int, num_bits: int) -> None:
         """Write an unsigned integer using the specified number of bits.
@@ -48,14 +66,15 @@ class BitPacker:
         if num_bits < 1 or num_bits > 64:
             raise ValueError(f"num_bits must be 1-64, got {num_bits}")
 
-        max_value = (1 << num_bits) - 1
-        if value > max_value:
+        if value >> num_bits:
+            max_value = (1 << num_bits) - 1
             raise ValueError(f"Value {value} requires more than {num_bits} bits (max: {max_value})")
 
-        # Write bits from most significant to least significant (big-endian)
-        for i in range(num_bits - 1, -1, -1):
-            bit = (value >> i) & 1
-            self._bits.append(bit)
+        # Big-endian: earlier values occupy the more significant bits
+        self._acc = (self._acc << num_bits) | value
+        self._nbits += num_bits
+        if self._nbits >= _FLUSH_BITS:
+            self._flush()
 
     def write_int(self, value: int, num_bits: int) -> None:
         """Write a signed integer using two's complement encoding.
@@ -70,21 +89,14 @@ class BitPacker:
         if num_bits < 2 or num_bits > 64:
             raise ValueError(f"num_bits must be 2-64 for signed integers, got {num_bits}")
 
-        min_value = -(1 << (num_bits - 1))
-        max_value = (1 << (num_bits - 1)) - 1
-
-        if value < min_value or value > max_value:
+        half = 1 << (num_bits - 1)
+        if not -half <= value < half:
             raise ValueError(
-                f"Value {value} doesn't fit in {num_bits} bits (range: {min_value} to {max_value})"
+                f"Value {value} doesn't fit in {num_bits} bits (range: {-half} to {half - 1})"
             )
 
-        # Convert to unsigned representation using two's complement
-        if value < 0:
-            unsigned_value = (1 << num_bits) + value
-        else:
-            unsigned_value = value
-
-        self.write_uint(unsigned_value, num_bits)
+        # Masking yields the two's complement representation for either sign
+        self.write_uint(value & ((half << 1) - 1), num_bits)
 
     def write_bytes(self, data: bytes) -> None:
         """Write raw bytes (byte-aligned).
@@ -92,8 +104,13 @@ class BitPacker:
         Args:
             data: Bytes to write
         """
-        for byte in data:
-            self.write_uint(byte, 8)
+        if not self._nbits:
+            # Aligned: copy straight into the output buffer
+            self._out += data
+            return
+        self._acc = (self._acc << (len(data) * 8)) | int.from_bytes(data, "big")
+        self._nbits += len(data) * 8
+        self._flush()
 
     def bit_length(self) -> int:
         """Return the current number of bits written.
@@ -101,7 +118,7 @@ class BitPacker:
         Returns:
             Number of bits in the buffer
         """
-        return len(self._bits)
+        return len(self._out) * 8 + self._nbits
 
     def to_bytes(self) -> bytes:
         """Convert the bit buffer to bytes.
@@ -112,28 +129,21 @@ class BitPacker:
         Returns:
             Packed bytes
         """
-        if not self._bits:
-            return b""
+        if not self._nbits:
+            return bytes(self._out)
 
-        # Pad to byte boundary with zeros
-        padded_bits = self._bits + [0] * ((-len(self._bits)) % 8)
-
-        # Convert to bytes
-        result = bytearray()
-        for i in range(0, len(padded_bits), 8):
-            byte = 0
-            for j in range(8):
-                byte = (byte << 1) | padded_bits[i + j]
-            result.append(byte)
-
-        return bytes(result)
+        # Pad the pending bits to a byte boundary with zeros
+        padding = (-self._nbits) % 8
+        tail = (self._acc << padding).to_bytes((self._nbits + padding) // 8, "big")
+        return b"".join((self._out, tail))  # One allocation for buffer + tail
 
 
 class BitUnpacker:
     """Unpacks values bit-by-bit from a byte buffer.
 
-    This class reads from a byte buffer and provides methods to extract
-    individual bits, integers of arbitrary bit width, and other primitives.
+    Each read converts only the bytes spanning the requested bits into an integer
+    and shifts/masks the value out, so reads cost the same regardless of where in
+    the buffer they fall.
 
     Example:
         >>> unpacker = BitUnpacker(data)
@@ -142,18 +152,45 @@ class BitUnpacker:
         >>> another_flag = unpacker.read_bool()
     """
 
-    def __init__(self, data: bytes) -> None:
+    __slots__ = ("_data", "_total_bits", "_position")
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
         """Initialize a bit unpacker with the given data.
 
         Args:
-            data: Byte buffer to unpack
+            data: Byte buffer to unpack. Buffers other than ``bytes`` are read through
+                a memoryview rather than copied, so they must not be resized while
+                the unpacker is in use.
         """
-        self._bits: list[int] = []
-        for byte in data:
-            for i in range(7, -1, -1):
-                self._bits.append((byte >> i) & 1)
+        self._data: bytes | memoryview = (
+            data if isinstance(data, bytes) else memoryview(data).cast("B")
+        )
+        self._total_bits = len(self._data) * 8
         self._position = 0
 
+    def _extract(self, start: int, num_bits: int) -> int:
+        """Return ``num_bits`` bits starting at bit ``start`` as an unsigned int."""
+        end = start + num_bits
+        first_byte = start >> 3
+        last_byte = (end + 7) >> 3
+        data = self._data
+        span = last_byte - first_byte
+        # Most fields sit within one or two bytes: index directly instead of slicing
+        if span == 1:
+            window = data[first_byte]
+        elif span == 2:
+            window = (data[first_byte] << 8) | data[first_byte + 1]
+        else:
+            window = int.from_bytes(data[first_byte:last_byte], "big")
+        return (window >> ((last_byte << 3) - end)) & ((1 << num_bits) - 1)
+
+    def _check_available(self, num_bits: int) -> None:
+        """Raise IndexError if fewer than ``num_bits`` bits remain."""
+        if self._position + num_bits > self._total_bits:
+            raise IndexError(
+                f"Not enough bits: need {num_bits}, have {self._total_bits - self._position}"
+            )
+
     def read_bool(self) -> bool:
         """Read a single bit as a boolean.
 
@@ -163,12 +200,12 @@ class BitUnpacker:
         Raises:
             IndexError: If no more bits are available
         """
-        if self._position >= len(self._bits):
+        pos = self._position
+        if pos >= self._total_bits:
             raise IndexError("Attempted to read past end of bit buffer")
 
-        value = self._bits[self._position] == 1
-        self._position += 1
-        return value
+        self._position = pos + 1
+        return bool((self._data[pos >> 3] >> (7 - (pos & 7))) & 1)
 
     def read_uint(self, num_bits: int) -> int:
         """Read an unsigned integer of the specified bit width.
@@ -186,16 +223,9 @@ class BitUnpacker:
         if num_bits < 1 or num_bits > 64:
             raise ValueError(f"num_bits must be 1-64, got {num_bits}")
 
-        if self._position + num_bits > len(self._bits):
-            raise IndexError(
-                f"Not enough bits: need {num_bits}, have {len(self._bits) - self._position}"
-            )
-
-        value = 0
-        for _ in range(num_bits):
-            value = (value << 1) | self._bits[self._position]
-            self._position += 1
-
+        self._check_available(num_bits)
+        value = self._extract(self._position, num_bits)
+        self._position += num_bits
         return value
 
     def peek_uint(self, num_bits: int) -> int:
@@ -217,18 +247,8 @@ class BitUnpacker:
         if num_bits < 1 or num_bits > 64:
             raise ValueError(f"num_bits must be 1-64, got {num_bits}")
 
-        if self._position + num_bits > len(self._bits):
-            raise IndexError(
-                f"Not enough bits: need {num_bits}, have {len(self._bits) - self._position}"
-            )
-
-        value = 0
-        pos = self._position  # Use temporary position
-        for _ in range(num_bits):
-            value = (value << 1) | self._bits[pos]
-            pos += 1
-
-        return value
+        self._check_available(num_bits)
+        return self._extract(self._position, num_bits)
 
     def read_int(self, num_bits: int) -> int:
         """Read a signed integer using two's complement encoding.
@@ -246,15 +266,10 @@ class BitUnpacker:
         if num_bits < 2 or num_bits > 64:
             raise ValueError(f"num_bits must be 2-64 for signed integers, got {num_bits}")
 
-        unsigned_value = self.read_uint(num_bits)
-
-        # Check sign bit (MSB)
+        # Sign-extend from two's complement: flipping the sign bit and subtracting its
+        # weight maps 0..2^n-1 onto -2^(n-1)..2^(n-1)-1 without branching on the sign
         sign_bit = 1 << (num_bits - 1)
-        if unsigned_value & sign_bit:
-            # Negative number: convert from two's complement
-            return unsigned_value - (1 << num_bits)
-        else:
-            return unsigned_value
+        return (self.read_uint(num_bits) ^ sign_bit) - sign_bit
 
     def read_bytes(self, num_bytes: int) -> bytes:
         """Read raw bytes (byte-aligned).
@@ -268,10 +283,17 @@ class BitUnpacker:
         Raises:
             IndexError: If not enough bytes are available
         """
-        result = bytearray()
-        for _ in range(num_bytes):
-            result.append(self.read_uint(8))
-        return bytes(result)
+        if num_bytes <= 0:
+            return b""
+
+        num_bits = num_bytes * 8
+        self._check_available(num_bits)
+        pos = self._position
+        self._position = pos + num_bits
+        if not pos & 7:
+            # Aligned: slice straight out of the buffer (bytes(bytes) is not a copy)
+            return bytes(self._data[pos >> 3 : (pos >> 3) + num_bytes])
+        return self._extract(pos, num_bits).to_bytes(num_bytes, "big")
 
     def bits_remaining(self) -> int:
         """Return the number of bits remaining in the buffer.
@@ -279,7 +301,7 @@ class BitUnpacker:
         Returns:
             Number of unread bits
         """
-        return len(self._bits) - self._position
+        return self._total_bits - self._position
 
     def position(self) -> int:
         """Return the current bit position.
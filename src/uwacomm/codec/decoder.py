@@ -6,19 +6,38 @@ back to a Pydantic message instance.
 
 from __future__ import annotations
 
-from typing import Any, TypeVar
+import enum
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
 
 from pydantic import BaseModel
 
+from ..codegen import CompiledDecoder, compile_decoder
 from ..exceptions import DecodeError
+from ._fast import BytesLike, byte_view, check_message_id, construct
 from .bitpack import BitUnpacker
-from .schema import FieldSchema, MessageSchema  # MessageSchema used in nested decode
+from .schema import (
+    KIND_BOOL,
+    KIND_BOUNDED_FLOAT,
+    KIND_BOUNDED_INT,
+    KIND_ENUM,
+    KIND_FIXED_BYTES,
+    KIND_FIXED_STR,
+    KIND_NESTED,
+    KIND_UNSUPPORTED,
+    KIND_VAR_BYTES,
+    KIND_VAR_LIST,
+    KIND_VAR_STR,
+    FieldSchema,
+    MessageSchema,
+    enum_members,
+)
 
 T = TypeVar("T", bound=BaseModel)
 
 
 def decode(
-    message_class: type[T], data: bytes, include_id: bool = False, routing: bool = False
+    message_class: type[T], data: BytesLike, include_id: bool = False, routing: bool = False
 ) -> T | tuple[Any, T]:
     """Decode compact binary data to a Pydantic message.
 
@@ -27,7 +46,7 @@ def decode(
 
     Args:
         message_class: Pydantic message class to decode to
-        data: Binary data to decode
+        data: Binary data to decode (bytes, bytearray or memoryview; read in place)
         include_id: If True, expect message ID prefix for self-describing messages (Mode 2)
         routing: If True, expect routing header prefix (Mode 3)
 
@@ -61,6 +80,30 @@ def decode(
         print(f"From vehicle {routing.source_id}")
         ```
     """
+    # Fast path: per-class compiled decoder (None means "use the generic path").
+    # The Mode 2 ID prefix is byte-aligned, so it is peeked here and the body after it
+    # decoded exactly like a Mode 1 payload.
+    data = byte_view(data)
+    compiled = compile_decoder(message_class)
+    if compiled is not None:
+        fast: dict[str, Any] | None = None
+        if routing:
+            routed = _decode_routed(message_class, compiled, data)
+            if routed is not None:
+                return routed
+        elif not include_id:
+            fast = compiled(data)
+        else:
+            id_len = 2 if data and data[0] & 0x80 else 1
+            # Too short for the ID: the generic path reports the truncation
+            if len(data) >= id_len:
+                b0 = data[0]
+                check_message_id(message_class, b0 if id_len == 1 else (b0 & 0x7F) << 8 | data[1])
+                # The body is read in place, after the ID
+                fast = compiled(data, id_len)
+        if fast is not None:
+            return construct(message_class, compiled, fast)
+
     # Introspect the schema
     schema = MessageSchema.from_model(message_class)
 
@@ -72,15 +115,13 @@ def decode(
     # Mode 3: Decode routing header
     if routing:
         try:
-            source_id = unpacker.read_uint(8)
-            dest_id = unpacker.read_uint(8)
-            priority = unpacker.read_uint(2)
-            ack_requested = unpacker.read_bool()
+            # One 19-bit read: source(8) dest(8) priority(2) ack(1)
+            word = unpacker.read_uint(19)
 
             # Import here to avoid circular dependency
-            from ..routing import RoutingHeader
+            from ..routing import _routing_header_from_word
 
-            routing_header = RoutingHeader(source_id, dest_id, priority, ack_requested)
+            routing_header = _routing_header_from_word(word)
 
             # Routing always includes message ID
             include_id = True
@@ -96,13 +137,7 @@ def decode(
             high_bit = unpacker.read_bool()
             decoded_id = unpacker.read_uint(7) if not high_bit else unpacker.read_uint(15)
 
-            # Validate against expected message class ID
-            expected_id = getattr(message_class, "uwacomm_id", None)
-            if expected_id is not None and decoded_id != expected_id:
-                raise DecodeError(
-                    f"Message ID mismatch: decoded {decoded_id}, expected {expected_id} "
-                    f"for {message_class.__name__}"
-                )
+            check_message_id(message_class, decoded_id)
         except IndexError as e:
             raise DecodeError(f"Truncated data while decoding message ID: {e}") from e
 
@@ -132,9 +167,44 @@ def decode(
         raise DecodeError(f"Failed to construct {message_class.__name__}: {e}") from e
 
 
+def _decode_routed(
+    message_class: type[T], compiled: CompiledDecoder, data: BytesLike
+) -> tuple[Any, T] | None:
+    """Mode 3 through the compiled decoder, or None to defer to the generic path.
+
+    The 19-bit routing header leaves the ID and body unaligned, so the frame is read
+    as one integer and the header, ID and body are split off it with shifts.
+    """
+    total_bits = len(data) << 3
+    if total_bits < 27:  # Header plus a 1-byte ID
+        return None
+    value = int.from_bytes(data, "big")
+    id_bits = 16 if (value >> (total_bits - 20)) & 1 else 8
+    body_bits = compiled.body_bits
+    used_bits = 19 + id_bits + body_bits
+    if total_bits < used_bits:
+        return None  # Truncated: the generic path reports where
+    value >>= total_bits - used_bits  # Drop padding (and any trailing bytes)
+    check_message_id(message_class, (value >> body_bits) & ((1 << (id_bits - 1)) - 1))
+
+    body_bytes = (body_bits + 7) >> 3
+    body = value & ((1 << body_bits) - 1)
+    fields = compiled((body << ((body_bytes << 3) - body_bits)).to_bytes(body_bytes, "big"))
+    if fields is None:
+        return None
+
+    # Import here to avoid circular dependency
+    from ..routing import _routing_header_from_word
+
+    routing_header = _routing_header_from_word(value >> (id_bits + body_bits))
+    return routing_header, construct(message_class, compiled, fields)
+
+
 def _decode_field(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
     """Decode a single field value.
 
+    Dispatches on the field kind resolved once at schema construction.
+
     Args:
         unpacker: BitUnpacker to read from
         field_schema: Schema information for the field
@@ -146,114 +216,133 @@ def _decode_field(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
         DecodeError: If data is invalid
         IndexError: If data is truncated
     """
-    # Nested BaseMessage: decode each field inline and construct instance
-    if field_schema.is_nested and field_schema.nested_class is not None:
-        nested_schema = MessageSchema.from_model(field_schema.nested_class)
-        nested_values: dict[str, Any] = {}
-        for nested_field in nested_schema.fields:
-            nested_values[nested_field.name] = _decode_field(unpacker, nested_field)
-        try:
-            return field_schema.nested_class(**nested_values)
-        except Exception as e:
-            raise DecodeError(
-                f"Field {field_schema.name}: failed to construct nested "
-                f"{field_schema.nested_class.__name__}: {e}"
-            ) from e
+    return _FIELD_DECODERS[field_schema.kind](unpacker, field_schema)
 
-    # Variable-length bytes
-    if field_schema.is_varlen and field_schema.is_bytes:
-        max_len = field_schema.max_length or 0
-        length_bits = FieldSchema._bits_for_bounded_int(0, max_len) if max_len > 0 else 1
-        actual_len = unpacker.read_uint(length_bits)
-        return unpacker.read_bytes(actual_len)
-
-    # Variable-length string (ASCII)
-    if field_schema.is_varlen and field_schema.is_str:
-        max_len = field_schema.max_length or 0
-        length_bits = FieldSchema._bits_for_bounded_int(0, max_len) if max_len > 0 else 1
-        actual_len = unpacker.read_uint(length_bits)
-        raw = unpacker.read_bytes(actual_len)
-        try:
-            return raw.decode("ascii")
-        except UnicodeDecodeError as e:
-            raise DecodeError(f"Field {field_schema.name}: invalid ASCII in VarStr: {e}") from e
-
-    # Variable-length list
-    if field_schema.is_varlen and field_schema.is_list:
-        max_len = field_schema.max_length or 0
-        length_bits = FieldSchema._bits_for_bounded_int(0, max_len) if max_len > 0 else 1
-        count = unpacker.read_uint(length_bits)
-        return _decode_list_items(unpacker, field_schema, count)
-
-    # Boolean
-    if field_schema.python_type is bool:
-        return unpacker.read_bool()
-
-    # Enum
-    if field_schema.enum_type is not None:
-        num_bits = field_schema.bits_required()
-        ordinal = unpacker.read_uint(num_bits)
-        enum_values = list(field_schema.enum_type)
-        if ordinal >= len(enum_values):
-            raise DecodeError(
-                f"Field {field_schema.name}: invalid enum ordinal {ordinal} "
-                f"(only {len(enum_values)} values)"
-            )
-        return enum_values[ordinal]
-
-    # Bounded integer
-    if (
-        field_schema.python_type is int
-        and field_schema.min_value is not None
-        and field_schema.max_value is not None
-    ):
-        num_bits = field_schema.bits_required()
-        offset = unpacker.read_uint(num_bits)
-        min_val = int(field_schema.min_value)
-        value = min_val + offset
-        max_val = int(field_schema.max_value)
-        if value > max_val:
-            raise DecodeError(
-                f"Field {field_schema.name}: decoded value {value} exceeds max {max_val}"
-            )
-        return value
-
-    # Bounded float (DCCL-style: descale from integer)
-    if field_schema.python_type is float:
-        if field_schema.min_value is None or field_schema.max_value is None:
-            raise DecodeError(f"Field {field_schema.name}: float requires min/max bounds")
-        precision = field_schema.precision or 0
-        min_float = float(field_schema.min_value)
-        max_float = float(field_schema.max_value)
-        max_scaled = round((max_float - min_float) * (10**precision))
-        num_bits = field_schema._bits_for_bounded_int(0, max_scaled)
-        scaled = unpacker.read_uint(num_bits)
-        value_f = min_float + (scaled / (10**precision))
-        if value_f < min_float or value_f > max_float:
-            raise DecodeError(
-                f"Field {field_schema.name}: decoded value {value_f} out of bounds "
-                f"[{min_float}, {max_float}]"
-            )
-        return value_f
-
-    # Fixed-length bytes
-    if field_schema.is_bytes and field_schema.max_length is not None:
-        return unpacker.read_bytes(field_schema.max_length)
-
-    # Fixed-length string
-    if field_schema.is_str and field_schema.max_length is not None:
-        raw_bytes = unpacker.read_bytes(field_schema.max_length)
-        try:
-            return raw_bytes.decode("utf-8")
-        except UnicodeDecodeError as e:
-            raise DecodeError(f"Field {field_schema.name}: invalid UTF-8 encoding: {e}") from e
 
+def _decode_nested(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Nested BaseMessage: decode each field inline and construct instance."""
+    nested_schema = MessageSchema.from_model(field_schema.nested_class)
+    nested_values: dict[str, Any] = {}
+    for nested_field in nested_schema.fields:
+        nested_values[nested_field.name] = _decode_field(unpacker, nested_field)
+    try:
+        return field_schema.nested_class(**nested_values)
+    except Exception as e:
+        raise DecodeError(
+            f"Field {field_schema.name}: failed to construct nested "
+            f"{field_schema.nested_class.__name__}: {e}"
+        ) from e
+
+
+def _read_length_prefix(unpacker: BitUnpacker, field_schema: FieldSchema) -> int:
+    """Read the length/count prefix of a variable-length field."""
+    max_len = field_schema.max_length or 0
+    length_bits = FieldSchema._bits_for_bounded_int(0, max_len) if max_len > 0 else 1
+    return unpacker.read_uint(length_bits)
+
+
+def _decode_var_bytes(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Variable-length bytes."""
+    return unpacker.read_bytes(_read_length_prefix(unpacker, field_schema))
+
+
+def _decode_var_str(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Variable-length string (ASCII)."""
+    raw = unpacker.read_bytes(_read_length_prefix(unpacker, field_schema))
+    try:
+        return raw.decode("ascii")
+    except UnicodeDecodeError as e:
+        raise DecodeError(f"Field {field_schema.name}: invalid ASCII in VarStr: {e}") from e
+
+
+def _decode_var_list(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Variable-length list."""
+    count = _read_length_prefix(unpacker, field_schema)
+    return _decode_list_items(unpacker, field_schema, count)
+
+
+def _decode_bool(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:  # noqa: ARG001
+    """Boolean: a single bit."""
+    return unpacker.read_bool()
+
+
+def _decode_enum(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Enum: member at the decoded ordinal."""
+    ordinal = unpacker.read_uint(field_schema.bits_required())
+    members = enum_members(cast("type[enum.Enum]", field_schema.enum_type))
+    try:
+        return members[ordinal]
+    except IndexError:
+        raise DecodeError(
+            f"Field {field_schema.name}: invalid enum ordinal {ordinal} "
+            f"(only {len(members)} values)"
+        ) from None
+
+
+def _decode_bounded_int(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Bounded integer: offset from the lower bound."""
+    offset = unpacker.read_uint(field_schema.bits_required())
+    value = int(cast(int, field_schema.min_value)) + offset
+    max_val = int(cast(int, field_schema.max_value))
+    if value > max_val:
+        raise DecodeError(f"Field {field_schema.name}: decoded value {value} exceeds max {max_val}")
+    return value
+
+
+def _decode_bounded_float(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Bounded float (DCCL-style: descale from integer)."""
+    if field_schema.min_value is None or field_schema.max_value is None:
+        raise DecodeError(f"Field {field_schema.name}: float requires min/max bounds")
+    min_float = float(field_schema.min_value)
+    max_float = float(field_schema.max_value)
+    scale = field_schema.scale or 10 ** (field_schema.precision or 0)
+    scaled = unpacker.read_uint(field_schema.bits_required())
+    value_f = min_float + (scaled / scale)
+    if value_f < min_float or value_f > max_float:
+        raise DecodeError(
+            f"Field {field_schema.name}: decoded value {value_f} out of bounds "
+            f"[{min_float}, {max_float}]"
+        )
+    return value_f
+
+
+def _decode_fixed_bytes(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Fixed-length bytes."""
+    return unpacker.read_bytes(cast(int, field_schema.max_length))
+
+
+def _decode_fixed_str(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:
+    """Fixed-length string (UTF-8)."""
+    raw_bytes = unpacker.read_bytes(cast(int, field_schema.max_length))
+    try:
+        return raw_bytes.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise DecodeError(f"Field {field_schema.name}: invalid UTF-8 encoding: {e}") from e
+
+
+def _decode_unsupported(unpacker: BitUnpacker, field_schema: FieldSchema) -> Any:  # noqa: ARG001
+    """Fields without a compact encoding."""
     raise DecodeError(
         f"Field {field_schema.name}: unsupported type {field_schema.python_type} "
         f"or missing constraints"
     )
 
 
+_FIELD_DECODERS: dict[int, Callable[[BitUnpacker, FieldSchema], Any]] = {
+    KIND_BOOL: _decode_bool,
+    KIND_ENUM: _decode_enum,
+    KIND_BOUNDED_INT: _decode_bounded_int,
+    KIND_FIXED_BYTES: _decode_fixed_bytes,
+    KIND_FIXED_STR: _decode_fixed_str,
+    KIND_UNSUPPORTED: _decode_unsupported,
+    KIND_BOUNDED_FLOAT: _decode_bounded_float,
+    KIND_NESTED: _decode_nested,
+    KIND_VAR_BYTES: _decode_var_bytes,
+    KIND_VAR_STR: _decode_var_str,
+    KIND_VAR_LIST: _decode_var_list,
+}
+
+
 def _decode_list_items(unpacker: BitUnpacker, field_schema: FieldSchema, count: int) -> list[Any]:
     """Decode `count` elements of a VarList field."""
     if field_schema.item_is_bool:
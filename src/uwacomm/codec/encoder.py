@@ -6,13 +6,32 @@ instance to compact binary format using DCCL-inspired bounded field optimization
 
 from __future__ import annotations
 
-from typing import Any
+import enum
+from collections.abc import Callable
+from typing import Any, cast
 
 from pydantic import BaseModel
 
+from ..codegen import compile_encoder
 from ..exceptions import EncodeError
+from ._fast import check_max_bytes, encode_routed, message_id_prefix
 from .bitpack import BitPacker
-from .schema import FieldSchema, MessageSchema  # MessageSchema used in nested encode
+from .schema import (
+    KIND_BOOL,
+    KIND_BOUNDED_FLOAT,
+    KIND_BOUNDED_INT,
+    KIND_ENUM,
+    KIND_FIXED_BYTES,
+    KIND_FIXED_STR,
+    KIND_NESTED,
+    KIND_UNSUPPORTED,
+    KIND_VAR_BYTES,
+    KIND_VAR_LIST,
+    KIND_VAR_STR,
+    FieldSchema,
+    MessageSchema,
+    enum_ordinals,
+)
 
 
 def encode(message: BaseModel, include_id: bool = False, routing: Any = None) -> bytes:
@@ -32,7 +51,7 @@ def encode(message: BaseModel, include_id: bool = False, routing: Any = None) ->
 
     Raises:
         SchemaError: If message schema is invalid
-        EncodeError: If a field value is invalid or out of bounds
+        EncodeError: If a field value or routing header field is invalid or out of bounds
 
     Examples:
         ```python
@@ -56,6 +75,40 @@ def encode(message: BaseModel, include_id: bool = False, routing: Any = None) ->
         data = encode(msg, routing=RoutingHeader(3, 0, 2))
         ```
     """
+    # Mode 1/2 fast path: per-class compiled encoder (None means "use the generic path").
+    # The Mode 2 ID is byte-aligned, so it is passed in as a prefix of the body.
+    if routing is None:
+        compiled = compile_encoder(type(message))
+        if compiled is not None:
+            if not include_id:
+                fast = compiled(message)
+                if fast is not None:
+                    return fast
+            else:
+                id_prefix, id_bits = message_id_prefix(type(message))
+                fast = compiled(message, id_prefix, id_bits >> 3)
+                if fast is not None:
+                    return check_max_bytes(message, fast)
+        return _encode_generic(message, include_id, None)
+
+    # Mode 3: Routing header as one 19-bit word: source(8) dest(8) priority(2) ack(1).
+    # ``routing`` need not be a RoutingHeader, so check the ranges here: out-of-range
+    # fields would otherwise overlap and silently corrupt the header.
+    source_id, dest_id, priority = routing.source_id, routing.dest_id, routing.priority
+    if (source_id | dest_id) & ~0xFF or priority & ~0x3:
+        raise EncodeError(
+            f"Routing header out of range: source_id={source_id}, dest_id={dest_id} "
+            f"(0-255), priority={priority} (0-3)"
+        )
+    header = (
+        (source_id << 11) | (dest_id << 3) | (priority << 1) | (1 if routing.ack_requested else 0)
+    )
+    fast = encode_routed(message, header)
+    return fast if fast is not None else _encode_generic(message, True, header)
+
+
+def _encode_generic(message: BaseModel, include_id: bool, header: int | None) -> bytes:
+    """Encode with the schema-walking BitPacker; reports every validation error."""
     # Introspect the schema
     schema = MessageSchema.from_model(type(message))
 
@@ -63,61 +116,27 @@ def encode(message: BaseModel, include_id: bool = False, routing: Any = None) ->
     packer = BitPacker()
 
     # Mode 3: Routing header (includes source/dest/priority/ack)
-    if routing is not None:
-        # Encode routing header
-        packer.write_uint(routing.source_id, 8)
-        packer.write_uint(routing.dest_id, 8)
-        packer.write_uint(routing.priority, 2)
-        packer.write_bool(routing.ack_requested)
-        # Routing always includes message ID
-        include_id = True
+    if header is not None:
+        packer.write_uint(header, 19)
 
     # Mode 2: Include message ID for self-describing messages
     if include_id:
-        msg_id = getattr(type(message), "uwacomm_id", None)
-        if msg_id is None:
-            raise EncodeError(
-                f"{type(message).__name__} has no uwacomm_id attribute. "
-                f"Self-describing messages require uwacomm_id."
-            )
-        if not isinstance(msg_id, int) or msg_id < 0 or msg_id > 32767:
-            raise EncodeError(f"uwacomm_id must be an integer 0-32767, got {msg_id}")
-
-        # Variable-length ID encoding (varint-style):
-        # - IDs 0-127: 1 byte with high bit = 0 (0xxxxxxx)
-        # - IDs 128-32767: 2 bytes with high bit = 1 (1xxxxxxx xxxxxxxx)
-        if msg_id < 128:
-            # 1 byte: 0xxxxxxx (high bit = 0)
-            packer.write_bool(False)  # High bit = 0
-            packer.write_uint(msg_id, 7)  # 7 bits for ID
-        elif msg_id < 32768:
-            # 2 bytes: 1xxxxxxx xxxxxxxx (high bit = 1)
-            packer.write_bool(True)  # High bit = 1
-            packer.write_uint(msg_id, 15)  # 15 bits for ID
-        else:
-            raise EncodeError(f"uwacomm_id must be 0-32767, got {msg_id}")
+        packer.write_uint(*message_id_prefix(type(message)))
 
     # Encode each field
     for field_schema in schema.fields:
         field_value = getattr(message, field_schema.name)
         _encode_field(packer, field_schema, field_value)
 
-    # Convert to bytes
-    encoded = packer.to_bytes()
-
-    # Check max_bytes constraint if present
-    max_bytes = getattr(type(message), "uwacomm_max_bytes", None)
-    if max_bytes is not None and len(encoded) > max_bytes:
-        raise EncodeError(
-            f"Encoded message size ({len(encoded)} bytes) exceeds " f"uwacomm_max_bytes={max_bytes}"
-        )
-
-    return encoded
+    return check_max_bytes(message, packer.to_bytes())
 
 
 def _encode_field(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
     """Encode a single field value.
 
+    Dispatches on the field kind resolved once at schema construction, so no type
+    inspection of the schema happens per message.
+
     Args:
         packer: BitPacker to write to
         field_schema: Schema information for the field
@@ -132,179 +151,179 @@ def _encode_field(packer: BitPacker, field_schema: FieldSchema, value: Any) -> N
             raise EncodeError(f"Field {field_schema.name} is required but got None")
         raise EncodeError(f"Optional fields not yet supported: {field_schema.name}")
 
-    # Nested BaseMessage: encode each field inline (no ID, no size prefix)
-    if field_schema.is_nested and field_schema.nested_class is not None:
-        from pydantic import BaseModel
-
-        if not isinstance(value, BaseModel):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected {field_schema.nested_class.__name__}, "
-                f"got {type(value).__name__}"
-            )
-        nested_schema = MessageSchema.from_model(field_schema.nested_class)
-        for nested_field in nested_schema.fields:
-            _encode_field(packer, nested_field, getattr(value, nested_field.name))
-        return
+    _FIELD_ENCODERS[field_schema.kind](packer, field_schema, value)
 
-    # Variable-length bytes
-    if field_schema.is_varlen and field_schema.is_bytes:
-        if not isinstance(value, bytes):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected bytes, got {type(value).__name__}"
-            )
-        max_len = field_schema.max_length or 0
-        actual_len = len(value)
-        if actual_len > max_len:
-            raise EncodeError(
-                f"Field {field_schema.name}: {actual_len} bytes exceeds max_length={max_len}"
-            )
-        length_bits = FieldSchema._bits_for_bounded_int(0, max_len)
-        packer.write_uint(actual_len, length_bits)
-        packer.write_bytes(value)
-        return
-
-    # Variable-length string (ASCII only for deterministic byte-length)
-    if field_schema.is_varlen and field_schema.is_str:
-        if not isinstance(value, str):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected str, got {type(value).__name__}"
-            )
-        try:
-            encoded_str = value.encode("ascii")
-        except UnicodeEncodeError as err:
-            raise EncodeError(
-                f"Field {field_schema.name}: VarStr only supports ASCII characters"
-            ) from err
-        max_len = field_schema.max_length or 0
-        actual_len = len(encoded_str)
-        if actual_len > max_len:
-            raise EncodeError(
-                f"Field {field_schema.name}: {actual_len} chars exceeds max_length={max_len}"
-            )
-        length_bits = FieldSchema._bits_for_bounded_int(0, max_len)
-        packer.write_uint(actual_len, length_bits)
-        packer.write_bytes(encoded_str)
-        return
-
-    # Variable-length list
-    if field_schema.is_varlen and field_schema.is_list:
-        if not isinstance(value, list):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected list, got {type(value).__name__}"
-            )
-        max_len = field_schema.max_length or 0
-        count = len(value)
-        if count > max_len:
-            raise EncodeError(
-                f"Field {field_schema.name}: {count} items exceeds max_length={max_len}"
-            )
-        length_bits = FieldSchema._bits_for_bounded_int(0, max_len)
-        packer.write_uint(count, length_bits)
-        _encode_list_items(packer, field_schema, value)
-        return
 
-    # Boolean
-    if field_schema.python_type is bool:
-        if not isinstance(value, bool):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected bool, got {type(value).__name__}"
-            )
-        packer.write_bool(value)
-        return
+def _encode_nested(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Nested BaseMessage: encode each field inline (no ID, no size prefix)."""
+    if not isinstance(value, BaseModel):
+        raise EncodeError(
+            f"Field {field_schema.name}: expected {field_schema.nested_class.__name__}, "
+            f"got {type(value).__name__}"
+        )
+    nested_schema = MessageSchema.from_model(field_schema.nested_class)
+    for nested_field in nested_schema.fields:
+        _encode_field(packer, nested_field, getattr(value, nested_field.name))
+
+
+def _encode_var_bytes(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Variable-length bytes: length prefix, then the bytes."""
+    if not isinstance(value, bytes):
+        raise EncodeError(f"Field {field_schema.name}: expected bytes, got {type(value).__name__}")
+    max_len = field_schema.max_length or 0
+    actual_len = len(value)
+    if actual_len > max_len:
+        raise EncodeError(
+            f"Field {field_schema.name}: {actual_len} bytes exceeds max_length={max_len}"
+        )
+    length_bits = FieldSchema._bits_for_bounded_int(0, max_len)
+    packer.write_uint(actual_len, length_bits)
+    packer.write_bytes(value)
+
+
+def _encode_var_str(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Variable-length string (ASCII only for deterministic byte-length)."""
+    if not isinstance(value, str):
+        raise EncodeError(f"Field {field_schema.name}: expected str, got {type(value).__name__}")
+    try:
+        encoded_str = value.encode("ascii")
+    except UnicodeEncodeError as err:
+        raise EncodeError(
+            f"Field {field_schema.name}: VarStr only supports ASCII characters"
+        ) from err
+    max_len = field_schema.max_length or 0
+    actual_len = len(encoded_str)
+    if actual_len > max_len:
+        raise EncodeError(
+            f"Field {field_schema.name}: {actual_len} chars exceeds max_length={max_len}"
+        )
+    length_bits = FieldSchema._bits_for_bounded_int(0, max_len)
+    packer.write_uint(actual_len, length_bits)
+    packer.write_bytes(encoded_str)
+
+
+def _encode_var_list(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Variable-length list: count prefix, then each element."""
+    if not isinstance(value, list):
+        raise EncodeError(f"Field {field_schema.name}: expected list, got {type(value).__name__}")
+    max_len = field_schema.max_length or 0
+    count = len(value)
+    if count > max_len:
+        raise EncodeError(f"Field {field_schema.name}: {count} items exceeds max_length={max_len}")
+    length_bits = FieldSchema._bits_for_bounded_int(0, max_len)
+    packer.write_uint(count, length_bits)
+    _encode_list_items(packer, field_schema, value)
+
+
+def _encode_bool(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Boolean: a single bit."""
+    if not isinstance(value, bool):
+        raise EncodeError(f"Field {field_schema.name}: expected bool, got {type(value).__name__}")
+    packer.write_bool(value)
+
+
+def _encode_enum(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Enum: ordinal of the member in definition order."""
+    enum_type = cast("type[enum.Enum]", field_schema.enum_type)
+    if not isinstance(value, enum_type):
+        raise EncodeError(
+            f"Field {field_schema.name}: expected {enum_type.__name__}, "
+            f"got {type(value).__name__}"
+        )
+    try:
+        ordinal = enum_ordinals(enum_type)[value]
+    except KeyError as err:
+        raise EncodeError(
+            f"Field {field_schema.name}: {value} not in {enum_type.__name__}"
+        ) from err
+    packer.write_uint(ordinal, field_schema.bits_required())
+
+
+def _encode_bounded_int(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Bounded integer: offset from the lower bound."""
+    if not isinstance(value, int):
+        raise EncodeError(f"Field {field_schema.name}: expected int, got {type(value).__name__}")
+    min_val = int(cast(int, field_schema.min_value))
+    max_val = int(cast(int, field_schema.max_value))
+    if value < min_val or value > max_val:
+        raise EncodeError(
+            f"Field {field_schema.name}: value {value} out of bounds [{min_val}, {max_val}]"
+        )
+    packer.write_uint(value - min_val, field_schema.bits_required())
+
+
+def _encode_bounded_float(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Bounded float (DCCL-style: scale to integer)."""
+    if not isinstance(value, (int, float)):
+        raise EncodeError(f"Field {field_schema.name}: expected float, got {type(value).__name__}")
+    if field_schema.min_value is None or field_schema.max_value is None:
+        raise EncodeError(f"Field {field_schema.name}: float requires min/max bounds")
+    min_float = float(field_schema.min_value)
+    scale = field_schema.scale or 10 ** (field_schema.precision or 0)
+    scaled = round((value - min_float) * scale)
+    # BoundedFloat precomputes the scaled range; only hand-built schemas lack it
+    max_scaled = field_schema.int_max
+    if max_scaled is None:
+        max_scaled = round((float(field_schema.max_value) - min_float) * scale)
+    if scaled < 0 or scaled > max_scaled:
+        raise EncodeError(
+            f"Field {field_schema.name}: value {value} out of bounds "
+            f"[{min_float}, {float(field_schema.max_value)}]"
+        )
+    packer.write_uint(scaled, field_schema.bits_required())
 
-    # Enum
-    if field_schema.enum_type is not None:
-        if not isinstance(value, field_schema.enum_type):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected {field_schema.enum_type.__name__}, "
-                f"got {type(value).__name__}"
-            )
-        enum_values = list(field_schema.enum_type)
-        try:
-            ordinal = enum_values.index(value)
-        except ValueError as err:
-            raise EncodeError(
-                f"Field {field_schema.name}: {value} not in {field_schema.enum_type.__name__}"
-            ) from err
-        packer.write_uint(ordinal, field_schema.bits_required())
-        return
 
-    # Bounded integer
-    if (
-        field_schema.python_type is int
-        and field_schema.min_value is not None
-        and field_schema.max_value is not None
-    ):
-        if not isinstance(value, int):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected int, got {type(value).__name__}"
-            )
-        min_val = int(field_schema.min_value)
-        max_val = int(field_schema.max_value)
-        if value < min_val or value > max_val:
-            raise EncodeError(
-                f"Field {field_schema.name}: value {value} out of bounds [{min_val}, {max_val}]"
-            )
-        packer.write_uint(value - min_val, field_schema.bits_required())
-        return
+def _encode_fixed_bytes(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Fixed-length bytes: written as-is."""
+    if not isinstance(value, bytes):
+        raise EncodeError(f"Field {field_schema.name}: expected bytes, got {type(value).__name__}")
+    expected_length = field_schema.max_length
+    if len(value) != expected_length:
+        raise EncodeError(
+            f"Field {field_schema.name}: expected {expected_length} bytes, "
+            f"got {len(value)} bytes"
+        )
+    packer.write_bytes(value)
 
-    # Bounded float (DCCL-style: scale to integer)
-    if field_schema.python_type is float:
-        if not isinstance(value, (int, float)):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected float, got {type(value).__name__}"
-            )
-        if field_schema.min_value is None or field_schema.max_value is None:
-            raise EncodeError(f"Field {field_schema.name}: float requires min/max bounds")
-        precision = field_schema.precision or 0
-        min_float = float(field_schema.min_value)
-        max_float = float(field_schema.max_value)
-        scaled = round((value - min_float) * (10**precision))
-        max_scaled = round((max_float - min_float) * (10**precision))
-        if scaled < 0 or scaled > max_scaled:
-            raise EncodeError(
-                f"Field {field_schema.name}: value {value} out of bounds "
-                f"[{min_float}, {max_float}]"
-            )
-        packer.write_uint(scaled, field_schema.bits_required())
-        return
 
-    # Fixed-length bytes
-    if field_schema.is_bytes and field_schema.max_length is not None:
-        if not isinstance(value, bytes):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected bytes, got {type(value).__name__}"
-            )
-        expected_length = field_schema.max_length
-        if len(value) != expected_length:
-            raise EncodeError(
-                f"Field {field_schema.name}: expected {expected_length} bytes, "
-                f"got {len(value)} bytes"
-            )
-        packer.write_bytes(value)
-        return
+def _encode_fixed_str(packer: BitPacker, field_schema: FieldSchema, value: Any) -> None:
+    """Fixed-length string: UTF-8 bytes."""
+    if not isinstance(value, str):
+        raise EncodeError(f"Field {field_schema.name}: expected str, got {type(value).__name__}")
+    expected_length = field_schema.max_length
+    if len(value) != expected_length:
+        raise EncodeError(
+            f"Field {field_schema.name}: expected {expected_length} characters, "
+            f"got {len(value)} characters"
+        )
+    packer.write_bytes(value.encode("utf-8"))
 
-    # Fixed-length string
-    if field_schema.is_str and field_schema.max_length is not None:
-        if not isinstance(value, str):
-            raise EncodeError(
-                f"Field {field_schema.name}: expected str, got {type(value).__name__}"
-            )
-        expected_length = field_schema.max_length
-        if len(value) != expected_length:
-            raise EncodeError(
-                f"Field {field_schema.name}: expected {expected_length} characters, "
-                f"got {len(value)} characters"
-            )
-        packer.write_bytes(value.encode("utf-8"))
-        return
 
+def _encode_unsupported(
+    packer: BitPacker, field_schema: FieldSchema, value: Any  # noqa: ARG001
+) -> None:
+    """Fields without a compact encoding."""
     raise EncodeError(
         f"Field {field_schema.name}: unsupported type {field_schema.python_type} "
         f"or missing constraints"
     )
 
 
+_FIELD_ENCODERS: dict[int, Callable[[BitPacker, FieldSchema, Any], None]] = {
+    KIND_BOOL: _encode_bool,
+    KIND_ENUM: _encode_enum,
+    KIND_BOUNDED_INT: _encode_bounded_int,
+    KIND_FIXED_BYTES: _encode_fixed_bytes,
+    KIND_FIXED_STR: _encode_fixed_str,
+    KIND_UNSUPPORTED: _encode_unsupported,
+    KIND_BOUNDED_FLOAT: _encode_bounded_float,
+    KIND_NESTED: _encode_nested,
+    KIND_VAR_BYTES: _encode_var_bytes,
+    KIND_VAR_STR: _encode_var_str,
+    KIND_VAR_LIST: _encode_var_list,
+}
+
+
 def _encode_list_items(packer: BitPacker, field_schema: FieldSchema, items: list[Any]) -> None:
     """Encode the elements of a VarList field."""
     if field_schema.item_is_bool:
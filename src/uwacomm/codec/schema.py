@@ -8,14 +8,30 @@ from __future__ import annotations
 
 import enum
 import math
-from dataclasses import dataclass
-from typing import Any, Optional, get_args, get_origin
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, ClassVar, Optional, cast, get_args, get_origin
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
 from ..exceptions import SchemaError
 
+# Field kinds, resolved once per FieldSchema so hot paths can dispatch on an int
+# instead of re-running the type cascade.
+KIND_BOOL = 0
+KIND_ENUM = 1
+KIND_BOUNDED_INT = 2
+KIND_FIXED_BYTES = 3
+KIND_FIXED_STR = 4
+KIND_UNSUPPORTED = 5
+KIND_BOUNDED_FLOAT = 6
+KIND_NESTED = 7
+KIND_VAR_BYTES = 8
+KIND_VAR_STR = 9
+KIND_VAR_LIST = 10
+
 
 @dataclass(frozen=True)
 class FieldSchema:
@@ -42,6 +58,9 @@ class FieldSchema:
         item_max_value: Maximum value for VarList elements
         item_precision: Decimal precision for float VarList elements
         item_is_bool: Whether VarList elements are booleans
+        scale: Float scale factor ``10**precision`` (bounded floats only)
+        int_max: Largest scaled value ``round((max - min) * scale)`` (bounded floats only)
+        kind: Resolved field kind (one of the ``KIND_*`` constants), set at construction
     """
 
     name: str
@@ -64,6 +83,40 @@ class FieldSchema:
     item_max_value: int | float | None = None
     item_precision: int | None = None
     item_is_bool: bool = False
+    scale: int | None = None
+    int_max: int | None = None
+    kind: int = field(init=False, repr=False, compare=False)
+    _bits: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the field kind once so bits_required() is a single table lookup."""
+        object.__setattr__(self, "kind", self._resolve_kind())
+
+    def _resolve_kind(self) -> int:
+        """Classify the field, mirroring the precedence used by the encoder/decoder."""
+        if self.is_nested and self.nested_class is not None:
+            return KIND_NESTED
+        if self.is_varlen:
+            if self.is_bytes:
+                return KIND_VAR_BYTES
+            if self.is_str:
+                return KIND_VAR_STR
+            if self.is_list:
+                return KIND_VAR_LIST
+        if self.python_type is bool:
+            return KIND_BOOL
+        if self.enum_type is not None:
+            return KIND_ENUM
+        if self.python_type is int and self.min_value is not None and self.max_value is not None:
+            return KIND_BOUNDED_INT
+        if self.python_type is float:
+            return KIND_BOUNDED_FLOAT
+        if self.max_length is not None:
+            if self.is_bytes:
+                return KIND_FIXED_BYTES
+            if self.is_str:
+                return KIND_FIXED_STR
+        return KIND_UNSUPPORTED
 
     def bits_required(self) -> int:
         """Calculate the number of bits required to encode this field.
@@ -77,62 +130,70 @@ class FieldSchema:
         Raises:
             SchemaError: If field type is not supported or constraints are missing
         """
-        # Nested message: sum the nested schema's bits inline
-        if self.is_nested and self.nested_class is not None:
-            nested_schema = MessageSchema.from_model(self.nested_class)
-            return nested_schema.total_bits()
-
-        # Variable-length bytes/str: length-prefix bits + max payload bits
-        if self.is_varlen and (self.is_bytes or self.is_str):
-            max_len = self.max_length or 0
-            if max_len == 0:
-                return 1
-            length_bits = self._bits_for_bounded_int(0, max_len)
-            return length_bits + max_len * 8
-
-        # Variable-length list: length-prefix bits + max element bits
-        if self.is_varlen and self.is_list:
-            max_len = self.max_length or 0
-            if max_len == 0:
-                return 1
-            length_bits = self._bits_for_bounded_int(0, max_len)
-            element_bits = self._item_bits()
-            return length_bits + max_len * element_bits
-
-        # Boolean: 1 bit
-        if self.python_type is bool:
+        bits = self._bits
+        if bits is None:
+            bits = self._BITS_BY_KIND[self.kind](self)
+            object.__setattr__(self, "_bits", bits)
+        return bits
+
+    def _bits_nested(self) -> int:
+        """Nested message: sum the nested schema's bits inline."""
+        return MessageSchema.from_model(self.nested_class).total_bits()
+
+    def _bits_var_bytes(self) -> int:
+        """Variable-length bytes/str: length-prefix bits + max payload bits."""
+        max_len = self.max_length or 0
+        if max_len == 0:
             return 1
+        return self._bits_for_bounded_int(0, max_len) + max_len * 8
 
-        # Enum: log2(num_values) bits
-        if self.enum_type is not None:
-            num_values = len(self.enum_type)
-            if num_values == 0:
-                raise SchemaError(f"Enum {self.enum_type} has no values")
-            if num_values == 1:
-                return 1
-            return math.ceil(math.log2(num_values))
-
-        # Bounded integer: calculate bits from range
-        if self.python_type is int and self.min_value is not None and self.max_value is not None:
-            return self._bits_for_bounded_int(int(self.min_value), int(self.max_value))
-
-        # Bounded float: scale to int and calculate bits (DCCL-style)
-        if self.python_type is float:
-            if self.min_value is None or self.max_value is None:
-                raise SchemaError(
-                    f"Field {self.name}: float requires ge= and le= constraints "
-                    f"(e.g., Field(ge=-100.0, le=100.0))"
-                )
-            precision = self.precision or 0
-            min_val = float(self.min_value)
-            max_val = float(self.max_value)
-            max_scaled = round((max_val - min_val) * (10**precision))
-            return self._bits_for_bounded_int(0, max_scaled)
+    def _bits_var_list(self) -> int:
+        """Variable-length list: length-prefix bits + max element bits."""
+        max_len = self.max_length or 0
+        if max_len == 0:
+            return 1
+        return self._bits_for_bounded_int(0, max_len) + max_len * self._item_bits()
+
+    def _bits_bool(self) -> int:
+        """Boolean: 1 bit."""
+        return 1
+
+    def _bits_enum(self) -> int:
+        """Enum: log2(num_values) bits."""
+        num_values = len(cast(type[enum.Enum], self.enum_type))
+        if num_values == 0:
+            raise SchemaError(f"Enum {self.enum_type} has no values")
+        if num_values == 1:
+            return 1
+        return math.ceil(math.log2(num_values))
 
-        # Fixed-length bytes/str: length * 8 bits
-        if (self.is_bytes or self.is_str) and self.max_length is not None:
-            return self.max_length * 8
+    def _bits_bounded_int(self) -> int:
+        """Bounded integer: calculate bits from range."""
+        min_val = cast(float, self.min_value)
+        max_val = cast(float, self.max_value)
+        return self._bits_for_bounded_int(int(min_val), int(max_val))
 
+    def _bits_bounded_float(self) -> int:
+        """Bounded float: scale to int and calculate bits (DCCL-style)."""
+        if self.min_value is None or self.max_value is None:
+            raise SchemaError(
+                f"Field {self.name}: float requires ge= and le= constraints "
+                f"(e.g., Field(ge=-100.0, le=100.0))"
+            )
+        if self.int_max is not None:
+            return self._bits_for_bounded_int(0, self.int_max)
+        precision = self.precision or 0
+        min_val = float(self.min_value)
+        max_val = float(self.max_value)
+        max_scaled = round((max_val - min_val) * (10**precision))
+        return self._bits_for_bounded_int(0, max_scaled)
+
+    def _bits_fixed(self) -> int:
+        """Fixed-length bytes/str: length * 8 bits."""
+        return (self.max_length or 0) * 8
+
+    def _bits_unsupported(self) -> int:
+        """Unsupported type or missing constraints."""
         # List without VarList helper: error
         if self.is_list:
             raise SchemaError(
@@ -140,7 +201,6 @@ class FieldSchema:
                 f"max_length and item constraints (item_ge, item_le)."
             )
 
-        # Unsupported or missing constraints
         if self.python_type is int:
             raise SchemaError(
                 f"Field {self.name}: integer fields require ge= and le= constraints "
@@ -153,6 +213,20 @@ class FieldSchema:
             f"variable list, nested BaseMessage."
         )
 
+    _BITS_BY_KIND: ClassVar[dict[int, Callable[[FieldSchema], int]]] = {
+        KIND_BOOL: _bits_bool,
+        KIND_ENUM: _bits_enum,
+        KIND_BOUNDED_INT: _bits_bounded_int,
+        KIND_FIXED_BYTES: _bits_fixed,
+        KIND_FIXED_STR: _bits_fixed,
+        KIND_UNSUPPORTED: _bits_unsupported,
+        KIND_BOUNDED_FLOAT: _bits_bounded_float,
+        KIND_NESTED: _bits_nested,
+        KIND_VAR_BYTES: _bits_var_bytes,
+        KIND_VAR_STR: _bits_var_bytes,
+        KIND_VAR_LIST: _bits_var_list,
+    }
+
     def _item_bits(self) -> int:
         """Bits required per VarList element."""
         if self.item_is_bool:
@@ -199,6 +273,36 @@ class FieldSchema:
         return math.ceil(math.log2(range_size))
 
 
+@lru_cache(maxsize=256)
+def enum_members(enum_type: type[enum.Enum]) -> tuple[enum.Enum, ...]:
+    """Return the members of an enum in definition order (ordinal -> member).
+
+    Args:
+        enum_type: Enum class
+
+    Returns:
+        Tuple indexed by wire ordinal; aliases are excluded, as in ``list(enum_type)``
+    """
+    return tuple(enum_type)
+
+
+@lru_cache(maxsize=256)
+def enum_ordinals(enum_type: type[enum.Enum]) -> dict[enum.Enum, int]:
+    """Return the wire ordinal of each enum member (member -> ordinal).
+
+    Args:
+        enum_type: Enum class
+
+    Returns:
+        Mapping from member to its position in :func:`enum_members`
+    """
+    return {member: i for i, member in enumerate(enum_members(enum_type))}
+
+
+#: Class attribute under which :meth:`MessageSchema.from_model` caches schemas
+_SCHEMA_ATTR = "__uwacomm_schema__"
+
+
 class MessageSchema:
     """Schema information for an entire message.
 
@@ -219,19 +323,29 @@ class MessageSchema:
         """
         self.model_class = model_class
         self.fields: list[FieldSchema] = []
+        self._total_bits: int | None = None
         self._introspect()
 
     @classmethod
     def from_model(cls, model_class: type[BaseModel]) -> MessageSchema:
         """Create a schema from a Pydantic model.
 
+        The schema is a pure function of the class, so it is built once and cached
+        on the class as ``__uwacomm_schema__``. Only the class's own ``__dict__`` is
+        consulted so subclasses get their own schema.
+
         Args:
             model_class: Pydantic model class
 
         Returns:
             MessageSchema instance
         """
-        return cls(model_class)
+        cached = model_class.__dict__.get(_SCHEMA_ATTR)
+        if isinstance(cached, cls):
+            return cached
+        schema = cls(model_class)
+        setattr(model_class, _SCHEMA_ATTR, schema)
+        return schema
 
     def _introspect(self) -> None:
         """Introspect the model and populate field schemas."""
@@ -307,6 +421,14 @@ class MessageSchema:
             else:
                 precision = 0
 
+        # Scale and scaled range for bounded floats, computed once per class here so the
+        # encoder, decoder and compiled encoder do not recompute them per message.
+        scale: int | None = None
+        int_max: int | None = None
+        if annotation is float and min_value is not None and max_value is not None:
+            scale = 10 ** (precision or 0)
+            int_max = round((float(max_value) - float(min_value)) * scale)
+
         # Determine field type characteristics
         enum_type = None
         is_list = False
@@ -394,6 +516,8 @@ class MessageSchema:
             item_max_value=item_max_value,
             item_precision=item_precision,
             item_is_bool=item_is_bool,
+            scale=scale,
+            int_max=int_max,
         )
 
     def total_bits(self) -> int:
@@ -405,7 +529,9 @@ class MessageSchema:
         Raises:
             SchemaError: If any field has invalid schema
         """
-        return sum(field.bits_required() for field in self.fields)
+        if self._total_bits is None:
+            self._total_bits = sum(field.bits_required() for field in self.fields)
+        return self._total_bits
 
     def total_bytes(self) -> int:
         """Calculate total bytes required (rounded up).
@@ -0,0 +1,518 @@
+"""Runtime code generation of per-model encoders and decoders.
+
+The generic encoder walks the :class:`MessageSchema` of a message on every call and
+dispatches on each field's type. For a given model class that work is always the
+same, so this module compiles it away: :func:`compile_encoder` emits a straight-line
+Python function with each field's bounds, offset, and bit width inlined as
+constants, and packs everything into a single integer accumulator.
+
+The compiled encoder produces byte-for-byte the same output as
+``encode(message)`` (Mode 1). It only performs the checks needed to decide whether
+a value can be packed; when a value is invalid it returns ``None`` so the caller can
+fall back to the generic encoder, which raises the descriptive error.
+
+:func:`compile_decoder` is the mirror image: it converts the whole payload to one
+integer and extracts every field at a constant shift, returning the field values
+for ``decode(message_class, data)`` (Mode 1), or ``None`` to defer to the generic
+decoder for truncated or invalid data.
+
+Set the environment variable ``UWACOMM_DISABLE_JIT=1`` before importing uwacomm to
+turn code generation off, so every message goes through the generic (interpreted)
+encoder and decoder. This is meant for debugging; the wire format is unchanged.
+"""
+
+from __future__ import annotations
+
+import enum
+import os
+from collections.abc import Callable
+from typing import Any, Protocol, cast
+
+from annotated_types import Ge, Le, MaxLen, MinLen
+from pydantic import BaseModel
+
+from .codec.schema import (
+    KIND_BOOL,
+    KIND_BOUNDED_FLOAT,
+    KIND_BOUNDED_INT,
+    KIND_ENUM,
+    KIND_FIXED_BYTES,
+    KIND_FIXED_STR,
+    KIND_NESTED,
+    FieldSchema,
+    MessageSchema,
+    enum_members,
+    enum_ordinals,
+)
+from .exceptions import SchemaError
+
+
+class CompiledEncoder(Protocol):
+    """Signature of a compiled encoder.
+
+    Returns the encoded bytes, or None if the generic encoder must handle the message
+    (e.g. to report a validation error). ``prefix`` is a whole-byte value of
+    ``prefix_bytes`` bytes emitted ahead of the body, such as the Mode 2 message ID.
+
+    ``body_bits`` is the body's length before padding, for callers that place it at
+    a bit offset that is not byte-aligned (the Mode 3 routing header is 19 bits).
+    """
+
+    body_bits: int
+
+    def __call__(
+        self, message: BaseModel, prefix: int = 0, prefix_bytes: int = 0, /
+    ) -> bytes | None: ...
+
+
+class CompiledDecoder(Protocol):
+    """Signature of a compiled decoder.
+
+    Returns the decoded field values, or None if the generic decoder must handle the
+    data (e.g. to report truncation). The body starts ``offset`` bytes into ``data``,
+    so a byte-aligned prefix such as the Mode 2 message ID is skipped without a copy.
+
+    ``construct`` builds the message from those values without revalidating them, or
+    is None when the class must be constructed normally (see :func:`compile_decoder`).
+    """
+
+    construct: Callable[[dict[str, Any]], BaseModel] | None
+    body_bits: int  # Body length before padding, as for CompiledEncoder
+
+    def __call__(
+        self, data: bytes | bytearray | memoryview, offset: int = 0, /
+    ) -> dict[str, Any] | None: ...
+
+
+_ENCODER_ATTR = "__uwacomm_encoder__"
+_DECODER_ATTR = "__uwacomm_decoder__"
+_MISSING = object()
+
+# Debugging escape hatch, read once at import: compile_* then cache None for every class
+_DISABLED = os.environ.get("UWACOMM_DISABLE_JIT", "") not in ("", "0")
+
+# BitPacker.write_uint rejects widths above 64 bits; leave such fields to the
+# generic path so the error behaviour stays identical.
+_MAX_UINT_BITS = 64
+
+
+class _Unsupported(Exception):
+    """Raised while generating code for a field the compiler does not handle."""
+
+
+# Field constraints the compiled decoder already enforces on every value it returns
+_GUARANTEED_METADATA = (Ge, Le, MinLen, MaxLen)
+_PLAIN_TYPES = (bool, int, float, bytes, str)
+
+# model_config keys that cannot change or reject a decoded value, with any setting...
+_PASSIVE_CONFIG_KEYS = frozenset(
+    {
+        "title",
+        "arbitrary_types_allowed",
+        "validate_assignment",
+        "frozen",
+        "populate_by_name",
+        "protected_namespaces",
+        "json_schema_extra",
+        "use_attribute_docstrings",
+        "defer_build",
+    }
+)
+# ...and keys that are only passive at these settings. Anything else (str_to_upper,
+# str_strip_whitespace, use_enum_values, strict=True, ...) keeps validated construction.
+_PASSIVE_CONFIG_VALUES: dict[str, tuple[Any, ...]] = {
+    "strict": (False, None),
+    "extra": ("forbid", "ignore", None),
+    "revalidate_instances": ("never",),
+}
+
+
+def _skips_validation(model_cls: type[BaseModel]) -> bool:
+    """Whether decoded values can be stored without running pydantic validation.
+
+    True only when validation could neither reject nor change a value the compiled
+    decoder produces: no custom ``__init__``, validators, post-init hook or private
+    attributes, only passive ``model_config`` settings, and every field is a plain type
+    (or enum, or nested message) constrained only by bounds and lengths.
+    """
+    decorators = model_cls.__pydantic_decorators__
+    if (
+        model_cls.__init__ is not BaseModel.__init__
+        or decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+        or model_cls.__pydantic_post_init__ is not None
+        or model_cls.__private_attributes__
+    ):
+        return False
+    for key, value in model_cls.model_config.items():
+        if key not in _PASSIVE_CONFIG_KEYS and value not in _PASSIVE_CONFIG_VALUES.get(key, ()):
+            return False
+    for info in model_cls.model_fields.values():
+        annotation = info.annotation
+        if not isinstance(annotation, type) or not (
+            annotation in _PLAIN_TYPES or issubclass(annotation, (enum.Enum, BaseModel))
+        ):
+            return False
+        if not all(isinstance(item, _GUARANTEED_METADATA) for item in info.metadata):
+            return False
+    return True
+
+
+def _unvalidated_constructor(model_cls: type[BaseModel]) -> Callable[[dict[str, Any]], BaseModel]:
+    """Return a function building ``model_cls`` from a field dict, as model_construct does.
+
+    ``model_construct`` itself is slower than a validated ``__init__`` (it resolves
+    defaults and aliases in Python), so only the four instance slots are set here.
+    """
+    new = object.__new__
+    set_slot = object.__setattr__
+
+    def construct(values: dict[str, Any]) -> BaseModel:
+        obj = new(model_cls)
+        set_slot(obj, "__dict__", values)
+        set_slot(obj, "__pydantic_fields_set__", set(values))
+        set_slot(obj, "__pydantic_extra__", None)
+        set_slot(obj, "__pydantic_private__", None)
+        return obj
+
+    return construct
+
+
+def _bound(value: int | float | None) -> int | float:
+    """Return a bound that the schema guarantees to be present for this field kind."""
+    if value is None:  # pragma: no cover - kinds are only resolved with both bounds
+        raise _Unsupported("missing bound")
+    return value
+
+
+class _EncoderBuilder:
+    """Accumulates source lines and constants for one compiled encoder."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {}
+        self.total_bits = 0
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def const(self, value: Any) -> str:
+        """Bind a non-literal constant into the function namespace."""
+        name = self._name("_c")
+        self.namespace[name] = value
+        return name
+
+    def emit(self, line: str) -> None:
+        self.lines.append("    " + line)
+
+    def add_fields(self, fields: list[FieldSchema], owner: str) -> None:
+        # Pydantic keeps field values in the instance __dict__; subscripting it skips
+        # the attribute lookup through the class MRO
+        values = self._name("d")
+        self.emit(f"{values} = {owner}.__dict__")
+        for field_schema in fields:
+            var = self._name("v")
+            self.emit(f"{var} = {values}[{field_schema.name!r}]")
+            self.add_field(field_schema, var)
+
+    def add_field(self, fs: FieldSchema, var: str) -> None:
+        kind = fs.kind
+        if kind == KIND_NESTED and fs.nested_class is not None:
+            self.emit(f"if {var}.__class__ is not {self.const(fs.nested_class)}: return None")
+            self.add_fields(MessageSchema.from_model(fs.nested_class).fields, var)
+            return
+
+        if kind == KIND_BOOL:
+            self.emit(f"if {var} is True: acc = (acc << 1) | 1")
+            self.emit(f"elif {var} is False: acc <<= 1")
+            self.emit("else: return None")
+            self.total_bits += 1
+            return
+
+        if kind == KIND_FIXED_BYTES:
+            length = fs.max_length or 0
+            self.emit(f"if {var}.__class__ is not bytes or len({var}) != {length}: return None")
+            self.emit(f"acc = (acc << {length * 8}) | int.from_bytes({var}, 'big')")
+            self.total_bits += length * 8
+            return
+
+        if kind == KIND_FIXED_STR:
+            length = fs.max_length or 0
+            self.emit(f"if {var}.__class__ is not str or len({var}) != {length}: return None")
+            # Non-ASCII text encodes to more bytes than characters; let the generic
+            # encoder handle that rather than making the layout dynamic.
+            self.emit(f"{var} = {var}.encode('utf-8')")
+            self.emit(f"if len({var}) != {length}: return None")
+            self.emit(f"acc = (acc << {length * 8}) | int.from_bytes({var}, 'big')")
+            self.total_bits += length * 8
+            return
+
+        bits = fs.bits_required()
+        if bits > _MAX_UINT_BITS:
+            raise _Unsupported(fs.name)
+
+        if kind == KIND_ENUM and fs.enum_type is not None:
+            enum_cls = self.const(fs.enum_type)
+            ordinals = self.const(enum_ordinals(fs.enum_type))
+            self.emit(f"if type({var}) is not {enum_cls}: return None")
+            self.emit(f"acc = (acc << {bits}) | {ordinals}[{var}]")
+        elif kind == KIND_BOUNDED_INT:
+            lo = int(_bound(fs.min_value))
+            hi = int(_bound(fs.max_value))
+            self.emit(f"if {var}.__class__ is not int or not {lo} <= {var} <= {hi}: return None")
+            self.emit(f"acc = (acc << {bits}) | ({var} - {lo})")
+        elif kind == KIND_BOUNDED_FLOAT:
+            lo_f = float(_bound(fs.min_value))
+            scale = fs.scale or 10 ** (fs.precision or 0)
+            max_scaled = fs.int_max
+            if max_scaled is None:
+                max_scaled = round((float(_bound(fs.max_value)) - lo_f) * scale)
+            self.emit(
+                f"if {var}.__class__ is not float and {var}.__class__ is not int: return None"
+            )
+            # round() keeps the wire format's ties-to-even; int(x + 0.5) is no faster
+            self.emit(f"{var} = round(({var} - {lo_f!r}) * {scale})")
+            self.emit(f"if not 0 <= {var} <= {max_scaled}: return None")
+            self.emit(f"acc = (acc << {bits}) | {var}")
+        else:
+            raise _Unsupported(fs.name)
+        self.total_bits += bits
+
+    def build(self, model_cls: type[BaseModel]) -> CompiledEncoder | None:
+        padding = (-self.total_bits) % 8
+        num_bytes = (self.total_bits + padding) // 8
+
+        max_bytes = getattr(model_cls, "uwacomm_max_bytes", None)
+        if max_bytes is not None and num_bytes > max_bytes:
+            # Always oversize: the generic encoder raises the size error.
+            return None
+
+        if padding:
+            self.emit(f"acc <<= {padding}")
+        self.emit(f"return acc.to_bytes({num_bytes} + prefix_bytes, 'big')")
+
+        func_name = f"_encode_{model_cls.__name__}"
+        # The prefix seeds the accumulator, so it ends up ahead of the body. A field
+        # missing from __dict__ (e.g. after model_construct) defers to the generic path.
+        source = "\n".join(
+            [
+                f"def {func_name}(m, acc=0, prefix_bytes=0):",
+                "    try:",
+                *["    " + line for line in self.lines],
+                "    except KeyError:",
+                "        return None",
+            ]
+        )
+        code = compile(source, f"<uwacomm encoder {model_cls.__qualname__}>", "exec")
+        exec(code, self.namespace)  # noqa: S102 - source is generated from the schema
+        func: CompiledEncoder = self.namespace[func_name]
+        func.__uwacomm_source__ = source  # type: ignore[attr-defined]
+        func.body_bits = self.total_bits
+        return func
+
+
+def compile_encoder(model_cls: type[BaseModel]) -> CompiledEncoder | None:
+    """Compile (or fetch the cached) specialized encoder for a message class.
+
+    The generated function is cached on the class as ``__uwacomm_encoder__``; only
+    the class's own ``__dict__`` is consulted so subclasses get their own encoder.
+    :func:`~uwacomm.routing.register_message` compiles eagerly; other classes are
+    compiled on their first ``encode()``. Always None when ``UWACOMM_DISABLE_JIT`` is set.
+
+    Args:
+        model_cls: Message class to compile an encoder for
+
+    Returns:
+        A function ``f(message[, prefix, prefix_bytes]) -> bytes | None`` producing
+        Mode 1 output (optionally after a byte-aligned prefix), or None if
+        the model has fields the compiler does not specialize (variable-length
+        fields, unbounded types), in which case the generic encoder should be used.
+
+    Examples:
+        ```python
+        from uwacomm import BaseMessage, BoundedInt
+        from uwacomm.codegen import compile_encoder
+
+        class Ping(BaseMessage):
+            seq: int = BoundedInt(ge=0, le=255)
+
+        enc = compile_encoder(Ping)
+        assert enc is not None and enc(Ping(seq=7)) == b"\\x07"
+        ```
+    """
+    cached = model_cls.__dict__.get(_ENCODER_ATTR, _MISSING)
+    if cached is not _MISSING:
+        return cast("CompiledEncoder | None", cached)
+
+    encoder: CompiledEncoder | None = None
+    if not _DISABLED:
+        builder = _EncoderBuilder()
+        try:
+            builder.add_fields(MessageSchema.from_model(model_cls).fields, "m")
+            encoder = builder.build(model_cls)
+        except _Unsupported:
+            encoder = None
+
+    setattr(model_cls, _ENCODER_ATTR, encoder)
+    return encoder
+
+
+class _DecoderBuilder:
+    """Accumulates source lines and constants for one compiled decoder."""
+
+    def __init__(self, total_bits: int) -> None:
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {}
+        self.total_bits = total_bits  # Padded to a whole number of bytes
+        self._position = 0
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def const(self, value: Any) -> str:
+        """Bind a non-literal constant into the function namespace."""
+        name = self._name("_c")
+        self.namespace[name] = value
+        return name
+
+    def emit(self, line: str) -> None:
+        self.lines.append("        " + line)
+
+    def extract(self, bits: int) -> str:
+        """Return an expression for the next ``bits`` bits of the accumulator."""
+        self._position += bits
+        shift = self.total_bits - self._position
+        shifted = f"(acc >> {shift})" if shift else "acc"
+        return f"({shifted} & {(1 << bits) - 1})"
+
+    def add_fields(self, fields: list[FieldSchema]) -> list[tuple[str, str]]:
+        return [(fs.name, self.add_field(fs)) for fs in fields]
+
+    def add_field(self, fs: FieldSchema) -> str:
+        var = self._name("v")
+        kind = fs.kind
+        if kind == KIND_NESTED and fs.nested_class is not None:
+            nested = fs.nested_class
+            values = self.add_fields(MessageSchema.from_model(nested).fields)
+            if _skips_validation(nested):
+                items = ", ".join(f"{name!r}: {value}" for name, value in values)
+                self.emit(f"{var} = {self.const(_unvalidated_constructor(nested))}({{{items}}})")
+            else:
+                args = ", ".join(f"{name}={value}" for name, value in values)
+                self.emit(f"{var} = {self.const(nested)}({args})")
+            return var
+
+        if kind == KIND_BOOL:
+            self.emit(f"{var} = {self.extract(1)} == 1")
+            return var
+
+        if kind in (KIND_FIXED_BYTES, KIND_FIXED_STR):
+            length = fs.max_length or 0
+            self.emit(f"{var} = {self.extract(length * 8)}.to_bytes({length}, 'big')")
+            if kind == KIND_FIXED_STR:
+                self.emit(f"{var} = {var}.decode('utf-8')")
+                # Multi-byte UTF-8 can leave fewer characters than min_length allows
+                if fs.min_length:
+                    self.emit(f"if len({var}) < {fs.min_length}: return None")
+            return var
+
+        bits = fs.bits_required()
+        if bits > _MAX_UINT_BITS:
+            raise _Unsupported(fs.name)
+
+        if kind == KIND_ENUM and fs.enum_type is not None:
+            members = enum_members(fs.enum_type)
+            self.emit(f"{var} = {self.extract(bits)}")
+            if len(members) < 1 << bits:
+                self.emit(f"if {var} >= {len(members)}: return None")
+            self.emit(f"{var} = {self.const(members)}[{var}]")
+        elif kind == KIND_BOUNDED_INT:
+            lo = int(_bound(fs.min_value))
+            hi = int(_bound(fs.max_value))
+            self.emit(f"{var} = {self.extract(bits)} + {lo}")
+            if (1 << bits) - 1 > hi - lo:
+                self.emit(f"if {var} > {hi}: return None")
+        elif kind == KIND_BOUNDED_FLOAT:
+            lo_f = float(_bound(fs.min_value))
+            hi_f = float(_bound(fs.max_value))
+            scale = fs.scale or 10 ** (fs.precision or 0)
+            # Same expression as the generic decoder so results are bit-identical
+            # Dividing by the integer scale is exact where multiplying by 1/scale is not
+            self.emit(f"{var} = {lo_f!r} + ({self.extract(bits)} / {scale})")
+            self.emit(f"if not {lo_f!r} <= {var} <= {hi_f!r}: return None")
+        else:
+            raise _Unsupported(fs.name)
+        return var
+
+    def build(self, model_cls: type[BaseModel], values: list[tuple[str, str]]) -> CompiledDecoder:
+        num_bytes = self.total_bits // 8
+        result = ", ".join(f"{name!r}: {value}" for name, value in values)
+        func_name = f"_decode_{model_cls.__name__}"
+        source = "\n".join(
+            [
+                f"def {func_name}(data, offset=0):",
+                f"    end = offset + {num_bytes}",
+                "    if len(data) < end: return None",
+                "    acc = int.from_bytes(data[offset:end], 'big')",
+                "    try:",
+                *(self.lines or ["        pass"]),
+                # Invalid text or nested construction: let the generic path report it
+                "    except Exception: return None",
+                f"    return {{{result}}}",
+            ]
+        )
+        code = compile(source, f"<uwacomm decoder {model_cls.__qualname__}>", "exec")
+        exec(code, self.namespace)  # noqa: S102 - source is generated from the schema
+        func: CompiledDecoder = self.namespace[func_name]
+        func.__uwacomm_source__ = source  # type: ignore[attr-defined]
+        func.construct = (
+            _unvalidated_constructor(model_cls) if _skips_validation(model_cls) else None
+        )
+        return func
+
+
+def compile_decoder(model_cls: type[BaseModel]) -> CompiledDecoder | None:
+    """Compile (or fetch the cached) specialized decoder for a message class.
+
+    The generated function is cached on the class as ``__uwacomm_decoder__``, with
+    the same per-class rules as :func:`compile_encoder`.
+
+    Args:
+        model_cls: Message class to compile a decoder for
+
+    Returns:
+        A function ``f(data[, offset]) -> dict | None`` returning the field values of a
+        Mode 1 payload that starts ``offset`` bytes into ``data``, or None if the model
+        has fields the compiler does not specialize. Nested messages are returned
+        already constructed. The function itself returns None when the data is
+        truncated or invalid, deferring to the generic decoder.
+
+    Examples:
+        ```python
+        dec = compile_decoder(Ping)
+        assert dec is not None and dec(b"\\x07") == {"seq": 7}
+        ```
+    """
+    cached = model_cls.__dict__.get(_DECODER_ATTR, _MISSING)
+    if cached is not _MISSING:
+        return cast("CompiledDecoder | None", cached)
+
+    decoder: CompiledDecoder | None = None
+    if not _DISABLED:
+        try:
+            schema = MessageSchema.from_model(model_cls)
+            total_bits = schema.total_bits()
+            builder = _DecoderBuilder(total_bits + (-total_bits) % 8)
+            decoder = builder.build(model_cls, builder.add_fields(schema.fields))
+            decoder.body_bits = total_bits
+        except (_Unsupported, SchemaError):
+            decoder = None
+
+    setattr(model_cls, _DECODER_ATTR, decoder)
+    return decoder
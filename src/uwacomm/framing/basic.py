@@ -9,11 +9,39 @@ from __future__ import annotations
 import struct
 from typing import Literal
 
+from pydantic import BaseModel
+
+from ..codec.encoder import encode
 from ..exceptions import FramingError
-from ..utils.crc import crc16_bytes, crc32_bytes, verify_crc16, verify_crc32
+from ..utils.crc import crc16, crc32
 
 CRCType = Literal["crc16", "crc32"]
 
+# Precompiled fixed-width header fields (big-endian)
+_LENGTH = struct.Struct(">I")  # Payload length
+_CRC16 = struct.Struct(">H")  # CRC-16 trailer
+_CRC32 = struct.Struct(">I")  # CRC-32 trailer
+_LENGTH_ID = struct.Struct(">IH")  # Payload length + message ID (frame_with_id)
+_MESSAGE_ID = struct.Struct(">H")
+
+
+def _append_crc(crc: CRCType | None, body: bytes) -> bytes:
+    """Return ``body`` followed by its CRC trailer (``body`` itself if ``crc`` is None).
+
+    Frames are small, so checksumming the already-joined body in one CRC call and
+    appending the trailer beats chaining the CRC over the parts and joining them.
+
+    Raises:
+        ValueError: If ``crc`` is not a supported CRC type
+    """
+    if crc == "crc16":
+        return body + _CRC16.pack(crc16(body))
+    if crc == "crc32":
+        return body + _CRC32.pack(crc32(body))
+    if crc is not None:
+        raise ValueError(f"Invalid CRC type: {crc}. Must be 'crc16', 'crc32', or None")
+    return body
+
 
 def frame_message(
     payload: bytes,
@@ -40,26 +68,20 @@ def frame_message(
         >>> len(framed) > len(payload)
         True
     """
-    result = bytearray()
+    if not length_prefix and crc is None:
+        # Framing disabled: bytes are immutable, so the payload is the frame
+        return payload if type(payload) is bytes else bytes(payload)
 
-    # Length prefix (payload length only, not including length field or CRC)
+    # Length prefix (payload length only, not including length field or CRC).
+    # Two concatenations beat filling a preallocated bytearray with pack_into(),
+    # which measured ~1.5x slower for typical frame sizes.
     if length_prefix:
-        result.extend(struct.pack(">I", len(payload)))
-
-    # Payload
-    result.extend(payload)
+        body = _LENGTH.pack(len(payload)) + payload
+    else:
+        body = payload if type(payload) is bytes else bytes(payload)
 
     # CRC (computed over length + payload if length prefix is present)
-    if crc == "crc16":
-        crc_value = crc16_bytes(bytes(result))
-        result.extend(crc_value)
-    elif crc == "crc32":
-        crc_value = crc32_bytes(bytes(result))
-        result.extend(crc_value)
-    elif crc is not None:
-        raise ValueError(f"Invalid CRC type: {crc}. Must be 'crc16', 'crc32', or None")
-
-    return bytes(result)
+    return _append_crc(crc, body)
 
 
 def unframe_message(
@@ -89,6 +111,29 @@ def unframe_message(
         >>> payload
         b'Hello'
     """
+    if not length_prefix and crc is None:
+        # Framing disabled: nothing to validate beyond non-emptiness
+        if not framed:
+            raise FramingError("Cannot unframe empty data")
+        return framed if type(framed) is bytes else bytes(framed)
+
+    return bytes(
+        _unframe_view(framed, length_prefix=length_prefix, crc=crc, validate_length=validate_length)
+    )
+
+
+def _unframe_view(
+    framed: bytes,
+    *,
+    length_prefix: bool,
+    crc: CRCType | None,
+    validate_length: bool,
+) -> memoryview:
+    """Validate a frame and return its payload as a view into ``framed`` (no copies).
+
+    Raises:
+        FramingError: If frame is malformed, CRC fails, or length mismatch
+    """
     if not framed:
         raise FramingError("Cannot unframe empty data")
 
@@ -100,7 +145,7 @@ def unframe_message(
         if len(framed) < 4:
             raise FramingError(f"Frame too short for length prefix: {len(framed)} bytes")
 
-        expected_payload_length = struct.unpack(">I", framed[0:4])[0]
+        (expected_payload_length,) = _LENGTH.unpack_from(framed)
         position = 4
 
     # Determine CRC size
@@ -120,7 +165,8 @@ def unframe_message(
         )
 
     payload_end = len(framed) - crc_size
-    payload = framed[position:payload_end]
+    view = memoryview(framed)
+    payload = view[position:payload_end]
 
     # Validate length if length prefix present
     if (
@@ -135,16 +181,16 @@ def unframe_message(
         )
 
     # Verify CRC (computed over everything except the CRC itself)
-    if crc is not None:
-        data_with_length = framed[:payload_end]
-        crc_bytes = framed[payload_end:]
-
-        if crc == "crc16":
-            if not verify_crc16(data_with_length, crc_bytes):
-                raise FramingError("CRC-16 verification failed")
-        elif crc == "crc32":
-            if not verify_crc32(data_with_length, crc_bytes):
-                raise FramingError("CRC-32 verification failed")
+    if crc == "crc16":
+        # CRC-16/CCITT-FALSE has no final XOR, so running it over the data followed by
+        # its big-endian CRC leaves a zero remainder: one pass over the whole frame.
+        if crc16(view) != 0:
+            raise FramingError("CRC-16 verification failed")
+    elif crc == "crc32":
+        # zlib's CRC-32 has a final XOR, so there is no zero-remainder shortcut; compare
+        # against the trailer read in place instead of packing the computed CRC.
+        if crc32(view[:payload_end]) != _CRC32.unpack_from(framed, payload_end)[0]:
+            raise FramingError("CRC-32 verification failed")
 
     return payload
 
@@ -182,20 +228,52 @@ def frame_with_id(
 
     # Build frame: length (4) + id (2) + payload
     total_payload_length = 2 + len(payload)
-    result = bytearray()
-    result.extend(struct.pack(">I", total_payload_length))  # Length includes ID
-    result.extend(struct.pack(">H", message_id))  # Message ID
-    result.extend(payload)
+    header = _LENGTH_ID.pack(total_payload_length, message_id)  # Length includes ID
 
     # Add CRC
-    if crc == "crc16":
-        result.extend(crc16_bytes(bytes(result)))
-    elif crc == "crc32":
-        result.extend(crc32_bytes(bytes(result)))
-    elif crc is not None:
-        raise ValueError(f"Invalid CRC type: {crc}")
+    return _append_crc(crc, header + payload)
+
+
+def encode_framed(
+    message: BaseModel,
+    message_id: int | None = None,
+    *,
+    crc: CRCType | None = None,
+) -> bytes:
+    """Encode a message and frame it with its message ID in one step.
+
+    Produces exactly ``frame_with_id(encode(message), message_id, crc=crc)``, but
+    validates the ID before encoding, so an invalid ID fails before any encoding work.
+
+    Args:
+        message: Message to encode (Mode 1 body)
+        message_id: Message type ID (0-65535); defaults to the class's ``uwacomm_id``
+        crc: CRC type to append
+
+    Returns:
+        Framed message with ID
+
+    Raises:
+        ValueError: If message_id is missing or out of range
+        EncodeError: If the message cannot be encoded
+
+    Example:
+        >>> from uwacomm import BaseMessage, BoundedInt
+        >>> class Ping(BaseMessage):
+        ...     seq: int = BoundedInt(ge=0, le=255)
+        >>> framed = encode_framed(Ping(seq=7), 42, crc="crc16")
+        >>> framed == frame_with_id(b"\\x07", 42, crc="crc16")
+        True
+    """
+    if message_id is None:
+        message_id = getattr(type(message), "uwacomm_id", None)
+        if message_id is None:
+            raise ValueError(f"{type(message).__name__} has no uwacomm_id; pass message_id")
+    if not 0 <= message_id <= 65535:
+        raise ValueError(f"Message ID must be 0-65535, got {message_id}")
 
-    return bytes(result)
+    payload = encode(message)
+    return _append_crc(crc, _LENGTH_ID.pack(2 + len(payload), message_id) + payload)
 
 
 def unframe_with_id(
@@ -223,14 +301,14 @@ def unframe_with_id(
         >>> payload
         b'Hello'
     """
-    # Unframe with length prefix
-    full_payload = unframe_message(framed, length_prefix=True, crc=crc, validate_length=True)
+    # Unframe with length prefix, keeping a view so the ID is not sliced off a copy
+    full_payload = _unframe_view(framed, length_prefix=True, crc=crc, validate_length=True)
 
     # Extract message ID
     if len(full_payload) < 2:
         raise FramingError(f"Payload too short for message ID: {len(full_payload)} bytes")
 
-    message_id = struct.unpack(">H", full_payload[0:2])[0]
-    payload = full_payload[2:]
+    (message_id,) = _MESSAGE_ID.unpack_from(full_payload)
+    payload = bytes(full_payload[2:])
 
     return message_id, payload
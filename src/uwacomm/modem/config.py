@@ -6,10 +6,10 @@ enabling realistic Hardware-in-the-Loop (HITL) testing without physical hardware
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockModemConfig:
     """Configuration for mock acoustic modem simulation.
 
@@ -17,6 +17,9 @@ class MockModemConfig:
     with configurable delays, packet loss, and bit errors. Use this to test
     your application logic before deploying to real hardware.
 
+    Instances are immutable (and hashable); use ``dataclasses.replace()`` to derive
+    a modified configuration and ``MockModemDriver.reset(config)`` to apply it.
+
     Attributes:
         transmission_delay: Round-trip acoustic delay in seconds (default 1.0).
             Typical values:
@@ -90,6 +93,10 @@ class MockModemConfig:
     enable_broadcast: bool = True
     enable_routing: bool = True
 
+    # Derived flags so the send path can skip channel effects that are switched off
+    _has_loss: bool = field(init=False, repr=False, compare=False)
+    _has_ber: bool = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Validate configuration parameters."""
         if self.transmission_delay < 0:
@@ -108,3 +115,6 @@ class MockModemConfig:
 
         if self.data_rate <= 0:
             raise ValueError(f"data_rate must be > 0, got {self.data_rate}")
+
+        object.__setattr__(self, "_has_loss", self.packet_loss_probability > 0.0)
+        object.__setattr__(self, "_has_ber", self.bit_error_rate > 0.0)
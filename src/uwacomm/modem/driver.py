@@ -17,7 +17,7 @@ The abstraction is intentionally NOT tied to any specific modem vendor.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 
 class ModemDriver(ABC):
@@ -64,6 +64,9 @@ class ModemDriver(ABC):
         ```
     """
 
+    # No per-instance state here; lets slotted drivers drop their __dict__
+    __slots__ = ()
+
     @abstractmethod
     def connect(self, port: str, baudrate: int = 19200) -> None:
         """Connect to acoustic modem (real or simulated).
@@ -119,6 +122,28 @@ class ModemDriver(ABC):
         """
         pass
 
+    def send_batch(self, frames: Sequence[tuple[bytes, int]]) -> None:
+        """Send several data frames in order.
+
+        The default implementation calls send_frame() for each frame. Drivers can
+        override it to amortize per-frame overhead (validation, locking,
+        packetization) across the batch.
+
+        Args:
+            frames: Sequence of (data, dest_id) pairs, sent in order
+
+        Raises:
+            ValueError: If a dest_id is out of range or a frame is too large
+            RuntimeError: If modem not connected or transmission fails
+
+        Examples:
+            ```python
+            modem.send_batch([(b"\\x01", 3), (b"\\x02", 4)])
+            ```
+        """
+        for data, dest_id in frames:
+            self.send_frame(data, dest_id)
+
     @abstractmethod
     def attach_rx_callback(self, callback: Callable[[bytes, int], None]) -> None:
         """Register callback for received frames.
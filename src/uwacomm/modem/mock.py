@@ -11,20 +11,45 @@ testing and development without physical hardware. It simulates:
 Design Patterns:
 - Queue-based decoupling: Producer-consumer pattern for async I/O
 - Background threads: Non-blocking RX processing
+- Delay scheduler: One thread drains a heap of (deliver_at, frame) events
 - Channel simulation: Probabilistic packet loss and delay injection
+
+Diagnostics are emitted on the ``uwacomm.modem.mock`` logger (connect/disconnect at
+INFO, per-frame events at DEBUG) rather than printed.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import logging
+import math
 import random
-from collections.abc import Callable
-from queue import Queue
-from threading import Thread
-from time import sleep
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from threading import Condition, Lock, Thread, current_thread
+
+# Float seconds: monotonic() is cheaper than monotonic_ns() (no big-int result) and
+# Condition.wait() takes float seconds anyway
+from time import monotonic
 
 from uwacomm.modem.config import MockModemConfig
 from uwacomm.modem.driver import ModemDriver
 
+logger = logging.getLogger(__name__)
+
+# Above this many expected errors per frame, _bulk_error_mask() (a fixed number of
+# wide getrandbits() words) beats geometric skip sampling (one draw per error).
+_BULK_MASK_MIN_ERRORS = 32
+# Binary digits of the BER honoured by _bulk_error_mask()
+_BULK_MASK_PRECISION = 32
+# Worker threads shared by all RX callbacks of one modem
+_CALLBACK_WORKERS = 4
+# Maximum frames the RX thread takes from rx_queue per wake-up
+_RX_BATCH_SIZE = 32
+
 
 class MockModemDriver(ModemDriver):
     """Simulated acoustic modem for testing without hardware.
@@ -43,9 +68,22 @@ class MockModemDriver(ModemDriver):
 
     Attributes:
         config: Mock modem configuration (channel parameters)
-        rx_queue: Queue for received frames (producer-consumer pattern)
-        rx_callbacks: List of registered RX callbacks
+        rx_queue: SimpleQueue of received frames (producer-consumer pattern); each item
+            is one bytes object: the source ID byte followed by the frame
+        rx_callbacks: List of registered RX callbacks (register with attach_rx_callback())
+        _rx_callbacks_tuple: Snapshot of rx_callbacks rebuilt by attach_rx_callback()
         _running: Background thread control flag
+        _rx_thread: Background RX processing thread (None when disconnected)
+        _max_frame_size: config.max_frame_size, cached for send_frame()
+        _delay: config.transmission_delay, cached for send_frame()
+        _sched_heap: Pending deliveries as (deliver_at, seq, rx_item)
+        _sched_cv: Condition guarding _sched_heap and waking the scheduler
+        _sched_thread: Delay scheduler thread (None when disconnected)
+        _rng: Per-modem random generator for loss and bit-error sampling
+        _cb_pool: Worker pool running RX callbacks (None when disconnected)
+        _cb_lanes: Pending rx_queue items per callback, in arrival order
+        _cb_lock: Lock guarding _cb_lanes, the callback snapshot and _generation
+        _generation: Reset counter; work taken before a reset() is dropped
 
     Examples:
         ```python
@@ -84,6 +122,27 @@ class MockModemDriver(ModemDriver):
         ```
     """
 
+    __slots__ = (
+        "config",
+        "rx_queue",
+        "rx_callbacks",
+        "_rx_callbacks_tuple",
+        "_running",
+        "_rx_thread",
+        "_max_frame_size",
+        "_delay",
+        "_sched_heap",
+        "_sched_cv",
+        "_sched_seq",
+        "_sched_thread",
+        "_rng",
+        "_cb_pool",
+        "_cb_lanes",
+        "_cb_lock",
+        "_generation",
+        "__weakref__",
+    )
+
     def __init__(self, config: MockModemConfig | None = None) -> None:
         """Initialize mock modem driver.
 
@@ -91,9 +150,32 @@ class MockModemDriver(ModemDriver):
             config: Mock modem configuration. If None, uses default config.
         """
         self.config = config if config is not None else MockModemConfig()
-        self.rx_queue: Queue[tuple[bytes, int]] = Queue()
+        # Config is frozen; cache the per-send bound and delay
+        self._max_frame_size = self.config.max_frame_size
+        self._delay = self.config.transmission_delay
+        # None is a wake-up sentinel pushed by disconnect()
+        # SimpleQueue is implemented in C and avoids Queue's Python-level
+        # Condition/lock round trip on every put() and get()
+        self.rx_queue: SimpleQueue[bytes | None] = SimpleQueue()
         self.rx_callbacks: list[Callable[[bytes, int], None]] = []
+        # Immutable snapshot swapped on attach; read lock-free by the RX thread
+        self._rx_callbacks_tuple: tuple[Callable[[bytes, int], None], ...] = ()
         self._running = False
+        self._rx_thread: Thread | None = None
+        # seq breaks ties so frames with equal deliver_at keep send order
+        self._sched_heap: list[tuple[float, int, bytes]] = []
+        self._sched_cv = Condition()
+        self._sched_seq = itertools.count()
+        self._sched_thread: Thread | None = None
+        # Private generator: no shared module-level state across modems
+        self._rng = random.Random()
+        # One lane per callback: a lane is drained by at most one pool task at a
+        # time, so each callback sees frames in order while callbacks run in parallel
+        self._cb_pool: ThreadPoolExecutor | None = None
+        self._cb_lanes: list[deque[bytes]] = []
+        self._cb_lock = Lock()
+        # Bumped by reset(); the RX thread and lane drains drop work from older ones
+        self._generation = 0
 
     def connect(self, port: str, baudrate: int = 19200) -> None:
         """Simulate connection to modem.
@@ -112,20 +194,30 @@ class MockModemDriver(ModemDriver):
             ```
         """
         if self._running:
-            print("[MockModem] Already connected")
+            logger.debug("Already connected")
             return
 
-        print(f"[MockModem] Connected to {port} @ {baudrate} baud (simulation mode)")
-        print(
-            f"[MockModem] Channel config: delay={self.config.transmission_delay}s, "
-            f"loss={self.config.packet_loss_probability:.1%}, "
-            f"BER={self.config.bit_error_rate:.2%}"
+        logger.info("Connected to %s @ %s baud (simulation mode)", port, baudrate)
+        logger.info(
+            "Channel config: delay=%ss, loss=%.1f%%, BER=%.2f%%",
+            self.config.transmission_delay,
+            self.config.packet_loss_probability * 100,
+            self.config.bit_error_rate * 100,
         )
 
         self._running = True
+        self._cb_pool = ThreadPoolExecutor(
+            max_workers=_CALLBACK_WORKERS, thread_name_prefix="MockModem-CB"
+        )
+        self._cb_lanes = []
         # Start background RX processing thread
-        rx_thread = Thread(target=self._rx_loop, daemon=True, name="MockModem-RX")
-        rx_thread.start()
+        self._rx_thread = Thread(target=self._rx_loop, daemon=True, name="MockModem-RX")
+        self._rx_thread.start()
+        # Start the delay scheduler that releases frames after the acoustic delay
+        self._sched_thread = Thread(
+            target=self._scheduler_loop, daemon=True, name="MockModem-Scheduler"
+        )
+        self._sched_thread.start()
 
     def send_frame(self, data: bytes, dest_id: int) -> None:
         """Simulate transmission with acoustic channel effects.
@@ -151,41 +243,97 @@ class MockModemDriver(ModemDriver):
         """
         if not self._running:
             raise RuntimeError("MockModem not connected. Call connect() before send_frame().")
+        self._validate_frame(data, dest_id)
+
+        item = self._through_channel(data, dest_id)
+        if item is None:
+            return
+
+        # Schedule delayed reception (loopback with acoustic delay)
+        deliver_at = monotonic() + self._delay
+        heap = self._sched_heap
+        with self._sched_cv:
+            # The scheduler is already waiting for an earlier (or equal) head
+            wake = not heap or deliver_at < heap[0][0]
+            heapq.heappush(heap, (deliver_at, next(self._sched_seq), item))
+            if wake:
+                self._sched_cv.notify()
+
+    def send_batch(self, frames: Sequence[tuple[bytes, int]]) -> None:
+        """Simulate transmission of several frames at once.
+
+        Every frame is validated before any is sent, so an invalid frame leaves
+        the channel untouched. Surviving frames share one delivery time and are
+        scheduled under a single lock acquisition; they arrive in batch order.
+
+        Args:
+            frames: Sequence of (data, dest_id) pairs
+
+        Raises:
+            ValueError: If a dest_id is out of range or a frame exceeds max_frame_size
+            RuntimeError: If modem not connected
 
-        # Validate destination ID
-        if not 0 <= dest_id <= 255:
+        Examples:
+            ```python
+            modem.send_batch([(b"\\x01", 3), (b"\\x02", 4)])
+            ```
+        """
+        if not self._running:
+            raise RuntimeError("MockModem not connected. Call connect() before send_batch().")
+        for data, dest_id in frames:
+            self._validate_frame(data, dest_id)
+
+        items = [self._through_channel(data, dest_id) for data, dest_id in frames]
+
+        deliver_at = monotonic() + self._delay
+        heap = self._sched_heap
+        seq = self._sched_seq
+        with self._sched_cv:
+            wake = not heap or deliver_at < heap[0][0]
+            for item in items:
+                if item is not None:
+                    heapq.heappush(heap, (deliver_at, next(seq), item))
+            if wake and heap:
+                self._sched_cv.notify()
+
+    def _validate_frame(self, data: bytes, dest_id: int) -> None:
+        """Check a frame against the destination range and max_frame_size."""
+        # For ints, any bit above the low 8 (including the sign) puts dest_id out of
+        # range; other numeric types (e.g. 3.0) are range-checked by comparison
+        if (dest_id & ~0xFF) if type(dest_id) is int else not 0 <= dest_id <= 255:
             raise ValueError(f"dest_id must be 0-255, got {dest_id}")
+        if len(data) > self._max_frame_size:
+            raise ValueError(f"Data size {len(data)} exceeds max_frame_size {self._max_frame_size}")
 
-        # Validate frame size
-        if len(data) > self.config.max_frame_size:
-            raise ValueError(
-                f"Data size {len(data)} exceeds max_frame_size " f"{self.config.max_frame_size}"
-            )
+    def _through_channel(self, data: bytes, dest_id: int) -> bytes | None:
+        """Apply loss and bit errors to a validated frame.
+
+        Returns:
+            The rx_queue item (source ID byte + frame), or None if the frame was lost
+        """
+        config = self.config
 
         # Simulate packet loss
-        if random.random() < self.config.packet_loss_probability:
-            print(f"[MockModem] Frame lost in channel " f"({len(data)} bytes to ID {dest_id})")
-            return
+        if config._has_loss and self._rng.random() < config.packet_loss_probability:
+            logger.debug("Frame lost in channel (%d bytes to ID %d)", len(data), dest_id)
+            return None
 
         # Simulate bit errors (if BER > 0)
-        if self.config.bit_error_rate > 0:
+        if config._has_ber:
             data = self._inject_bit_errors(data)
 
-        print(f"[MockModem] Sent {len(data)} bytes to ID {dest_id}")
-
-        # Schedule delayed reception (loopback with acoustic delay)
-        def delayed_rx() -> None:
-            sleep(self.config.transmission_delay)
-            self.rx_queue.put((data, dest_id))
-
-        rx_thread = Thread(target=delayed_rx, daemon=True, name="MockModem-Delayed-RX")
-        rx_thread.start()
+        logger.debug("Sent %d bytes to ID %d", len(data), dest_id)
+        # dest_id is validated to 0-255, so it fits the one-byte item header (int() for
+        # integral non-int IDs such as 3.0)
+        return bytes((int(dest_id),)) + data
 
     def attach_rx_callback(self, callback: Callable[[bytes, int], None]) -> None:
         """Register callback for received frames.
 
         Multiple callbacks can be registered - all will be invoked when
-        a frame is received.
+        a frame is received. This is the only supported way to register: callbacks
+        appended to ``rx_callbacks`` directly are not seen until the next
+        attach_rx_callback() call.
 
         Args:
             callback: Function(data: bytes, src_id: int) -> None
@@ -198,8 +346,51 @@ class MockModemDriver(ModemDriver):
             modem.attach_rx_callback(my_callback)
             ```
         """
-        self.rx_callbacks.append(callback)
-        print(f"[MockModem] Registered RX callback (total: {len(self.rx_callbacks)})")
+        with self._cb_lock:
+            self.rx_callbacks.append(callback)
+            # Rebuilt from the list under the lock, so concurrent attaches cannot lose one
+            self._rx_callbacks_tuple = tuple(self.rx_callbacks)
+            count = len(self._rx_callbacks_tuple)
+        logger.debug("Registered RX callback (total: %d)", count)
+
+    def reset(self, config: MockModemConfig | None = None) -> None:
+        """Drop callbacks and pending frames, optionally switching configuration.
+
+        The background threads keep running, so a connected modem can be reused
+        (e.g. between test cases) without reconnecting. Frames already handed to a
+        callback finish, but nothing sent before the reset reaches a callback after it.
+
+        Args:
+            config: New configuration to apply, or None to keep the current one
+
+        Examples:
+            ```python
+            modem.reset(MockModemConfig(transmission_delay=0.1))
+            ```
+        """
+        # From here on, batches the RX thread took earlier and lanes still draining
+        # are stale: _dispatch() and _drain_lane() drop them
+        with self._cb_lock:
+            self._generation += 1
+            self.rx_callbacks = []
+            self._rx_callbacks_tuple = ()
+            self._cb_lanes = []
+        with self._sched_cv:
+            self._sched_heap.clear()
+            if config is not None:
+                self.config = config
+                self._max_frame_size = config.max_frame_size
+                self._delay = config.transmission_delay
+        # Drain frames released but not yet picked up by the RX thread
+        while True:
+            try:
+                self.rx_queue.get_nowait()
+            except Empty:
+                break
+        # Wake an RX thread blocked in get() so it picks up the new generation before
+        # taking any frame sent after the reset
+        self.rx_queue.put(None)
+        logger.debug("Reset (config %s)", "replaced" if config is not None else "kept")
 
     def disconnect(self) -> None:
         """Stop simulation and disconnect.
@@ -212,35 +403,137 @@ class MockModemDriver(ModemDriver):
             ```
         """
         if not self._running:
-            print("[MockModem] Already disconnected")
+            logger.debug("Already disconnected")
             return
 
         self._running = False
-        print("[MockModem] Disconnected")
+        # Drop frames still "in the channel" and wake the scheduler so it exits
+        with self._sched_cv:
+            self._sched_heap.clear()
+            self._sched_cv.notify()
+        # Wake the RX thread immediately instead of waiting for its get() timeout
+        self.rx_queue.put(None)
+        for thread in (self._sched_thread, self._rx_thread):
+            if thread is not None and thread is not current_thread():
+                thread.join()
+        self._sched_thread = None
+        self._rx_thread = None
+        # Callbacks already running finish on their own; queued ones are dropped
+        if self._cb_pool is not None:
+            self._cb_pool.shutdown(wait=False, cancel_futures=True)
+            self._cb_pool = None
+        logger.info("Disconnected")
 
     def _rx_loop(self) -> None:
         """Background thread processes received frames.
 
-        This runs continuously while modem is connected, checking the RX queue
-        for new frames and invoking registered callbacks.
+        This runs continuously while modem is connected, blocking on the RX queue
+        for new frames and handing them to the registered callbacks. Frames that
+        arrive in a burst are drained and dispatched together (up to
+        ``_RX_BATCH_SIZE`` at a time). disconnect() and reset() push a None sentinel
+        so the thread wakes up without waiting for the timeout.
+
+        The reset generation is read before each get(): a batch taken across a reset()
+        is stale and dropped, while reset()'s sentinel ends the batch so frames sent
+        after the reset are taken under the new generation.
         """
-        print("[MockModem] RX processing thread started")
+        logger.debug("RX processing thread started")
+        queue = self.rx_queue
         while self._running:
-            if not self.rx_queue.empty():
-                data, src_id = self.rx_queue.get()
-                print(f"[MockModem] Received {len(data)} bytes from ID {src_id}")
-
-                # Invoke all registered callbacks
-                for callback in self.rx_callbacks:
-                    try:
-                        callback(data, src_id)
-                    except Exception as e:
-                        print(f"[MockModem] RX callback error: {e}")
-
-            # Small sleep to avoid busy-waiting
-            sleep(0.01)
+            generation = self._generation
+            try:
+                item = queue.get(timeout=0.5)
+            except Empty:
+                continue
+
+            # Drain whatever else already arrived so a burst is dispatched at once
+            batch: list[bytes] = []
+            while True:
+                # None is the disconnect/reset sentinel: end the batch, then the loop
+                # re-checks _running and re-reads the generation
+                if item is None:
+                    break
+                batch.append(item)
+                if len(batch) >= _RX_BATCH_SIZE:
+                    break
+                try:
+                    item = queue.get_nowait()
+                except Empty:
+                    break
+
+            if batch:
+                if logger.isEnabledFor(logging.DEBUG):
+                    for frame in batch:
+                        logger.debug("Received %d bytes from ID %d", len(frame) - 1, frame[0])
+                self._dispatch(batch, generation)
+
+        logger.debug("RX processing thread stopped")
+
+    def _dispatch(self, batch: list[bytes], generation: int) -> None:
+        """Queue received frames for every registered callback on the worker pool."""
+        pool = self._cb_pool
+        if pool is None:
+            return
 
-        print("[MockModem] RX processing thread stopped")
+        idle: list[tuple[Callable[[bytes, int], None], deque[bytes]]] = []
+        with self._cb_lock:
+            if generation != self._generation:
+                return  # Taken before a reset(): not for the current callbacks
+            callbacks = self._rx_callbacks_tuple
+            lanes = self._cb_lanes
+            while len(lanes) < len(callbacks):
+                lanes.append(deque())
+            for callback, lane in zip(callbacks, lanes):
+                was_idle = not lane
+                lane.extend(batch)
+                if was_idle:
+                    # No task is draining this lane yet
+                    idle.append((callback, lane))
+
+        for callback, lane in idle:
+            pool.submit(self._drain_lane, callback, lane, generation)
+
+    def _drain_lane(
+        self, callback: Callable[[bytes, int], None], lane: deque[bytes], generation: int
+    ) -> None:
+        """Deliver a callback's pending frames in order (runs on the worker pool)."""
+        while True:
+            item = lane[0]
+            # reset() abandoned this lane (and its callback): stop delivering
+            if self._generation != generation:
+                return
+            try:
+                callback(item[1:], item[0])
+            except Exception:
+                logger.exception("RX callback error")
+            with self._cb_lock:
+                lane.popleft()
+                if not lane:
+                    return
+
+    def _scheduler_loop(self) -> None:
+        """Background thread releases frames once their acoustic delay has elapsed.
+
+        Sleeps on the condition variable until the earliest pending delivery is
+        due (or until a send pushes a new earliest one), then moves every delivery
+        that is due by then to rx_queue in one pass.
+        """
+        cv = self._sched_cv
+        heap = self._sched_heap
+        put = self.rx_queue.put
+        with cv:
+            while self._running:
+                if not heap:
+                    cv.wait()
+                    continue
+                now = monotonic()
+                delay = heap[0][0] - now
+                if delay > 0:
+                    cv.wait(timeout=delay)
+                    continue
+                # A send_batch() shares one deliver_at, so it is released together
+                while heap and heap[0][0] <= now:
+                    put(heapq.heappop(heap)[2])
 
     def _inject_bit_errors(self, data: bytes) -> bytes:
         """Inject random bit errors based on configured BER.
@@ -254,22 +547,88 @@ class MockModemDriver(ModemDriver):
         if self.config.bit_error_rate == 0:
             return data
 
-        # Convert to mutable bytearray
-        corrupted = bytearray(data)
         num_bits = len(data) * 8
-        num_errors = 0
-
-        # Flip bits with probability = BER
-        for byte_idx in range(len(corrupted)):
-            for bit_idx in range(8):
-                if random.random() < self.config.bit_error_rate:
-                    corrupted[byte_idx] ^= 1 << bit_idx  # Flip bit
-                    num_errors += 1
-
-        if num_errors > 0:
-            print(
-                f"[MockModem] Injected {num_errors} bit errors "
-                f"({num_errors / num_bits:.2%} BER)"
-            )
-
-        return bytes(corrupted)
+        ber = self.config.bit_error_rate
+
+        if ber >= 1.0 or ber * num_bits > _BULK_MASK_MIN_ERRORS:
+            # Dense errors: build one frame-wide mask and XOR the frame as an integer
+            mask = self._bulk_error_mask(num_bits, ber)
+            if not mask:
+                return data
+            self._log_bit_errors(bin(mask).count("1"), num_bits)
+            return (int.from_bytes(data, "big") ^ mask).to_bytes(len(data), "big")
+
+        # Sparse errors: flip the few affected bytes in a single copy of the frame
+        # rather than materialising a frame-wide mask bit by bit.
+        positions = self._sparse_error_positions(num_bits, ber)
+        if not positions:
+            return data
+        self._log_bit_errors(len(positions), num_bits)
+        buf = bytearray(data)
+        last = len(buf) - 1
+        for pos in positions:
+            # pos counts from the least significant bit of the big-endian frame
+            buf[last - (pos >> 3)] ^= 1 << (pos & 7)
+        return bytes(buf)
+
+    def _sparse_error_positions(self, num_bits: int, ber: float) -> list[int]:
+        """Pick bit-error positions by geometric skip sampling.
+
+        Instead of one Bernoulli draw per bit, jump straight to the next flipped bit.
+        The gap between flips is geometric with parameter BER, so this costs
+        O(errors) draws rather than O(bits).
+
+        Args:
+            num_bits: Frame length in bits
+            ber: Bit error rate in (0, 1)
+
+        Returns:
+            Increasing bit positions (0 = least significant bit of the frame)
+        """
+        rand = self._rng.random
+        log_q = math.log1p(-ber)
+        positions: list[int] = []
+        pos = -1
+        while True:
+            pos += 1 + int(math.log(1.0 - rand()) / log_q)
+            if pos >= num_bits:
+                return positions
+            positions.append(pos)
+
+    @staticmethod
+    def _log_bit_errors(num_errors: int, num_bits: int) -> None:
+        """Log the number of injected bit errors (DEBUG only)."""
+        logger.debug("Injected %d bit errors (%.2f%% BER)", num_errors, 100 * num_errors / num_bits)
+
+    def _bulk_error_mask(self, num_bits: int, ber: float) -> int:
+        """Draw a whole-frame error mask from a few wide random words.
+
+        Each ``getrandbits(num_bits)`` word sets every bit with probability 1/2.
+        Folding words together along the binary expansion of ``ber`` (OR for a 1
+        digit, AND for a 0 digit, least significant digit first) leaves each bit set
+        with probability ``ber`` truncated to ``_BULK_MASK_PRECISION`` binary digits,
+        at a cost independent of the number of errors.
+
+        Args:
+            num_bits: Frame length in bits
+            ber: Bit error rate in (0, 1]
+
+        Returns:
+            Integer mask with bit errors set
+        """
+        if ber >= 1.0:
+            return (1 << num_bits) - 1
+        digits = int(ber * (1 << _BULK_MASK_PRECISION))
+        if not digits:
+            return 0
+        # Trailing zero digits AND into an all-zero mask, so start at the lowest 1
+        skip = (digits & -digits).bit_length() - 1
+        digits >>= skip
+
+        getrandbits = self._rng.getrandbits
+        mask = 0
+        for _ in range(_BULK_MASK_PRECISION - skip):
+            word = getrandbits(num_bits)
+            mask = mask | word if digits & 1 else mask & word
+            digits >>= 1
+        return mask
@@ -7,13 +7,21 @@ and document conversion strategies between Pydantic and Protobuf.
 from __future__ import annotations
 
 import enum
-from typing import cast
+from collections.abc import Iterator
 
 from pydantic import BaseModel
 
-from ..codec.schema import MessageSchema
+from ..codec.schema import FieldSchema, MessageSchema
 from ..exceptions import SchemaError
 
+# Python types that map directly to a single Protobuf scalar type
+_SCALAR_PROTO_TYPES: dict[type, str] = {
+    bool: "bool",
+    bytes: "bytes",
+    str: "string",
+    float: "double",
+}
+
 
 def to_proto_schema(
     message_class: type[BaseModel],
@@ -58,11 +66,10 @@ def to_proto_schema(
         lines.append(f"package {package};")
     lines.append("")
 
-    # Generate enum definitions first
-    enum_types = set()
-    for field in schema.fields:
-        if field.enum_type is not None:
-            enum_types.add(field.enum_type)
+    # Generate enum definitions first, in field order so output is reproducible
+    enum_types = dict.fromkeys(
+        field.enum_type for field in schema.fields if field.enum_type is not None
+    )
 
     for enum_type in enum_types:
         lines.extend(_enum_to_proto(enum_type))
@@ -86,7 +93,7 @@ def to_proto_schema(
     return "\n".join(lines)
 
 
-def _python_type_to_proto(field_schema) -> str:  # type: ignore[no-untyped-def]
+def _python_type_to_proto(field_schema: FieldSchema) -> str:
     """Convert a Python type to Protobuf type.
 
     Args:
@@ -98,13 +105,14 @@ def _python_type_to_proto(field_schema) -> str:  # type: ignore[no-untyped-def]
     Raises:
         SchemaError: If type is not supported
     """
-    # Boolean
-    if field_schema.python_type is bool:
-        return "bool"
+    # Boolean, bytes, string, float
+    scalar = _SCALAR_PROTO_TYPES.get(field_schema.python_type)
+    if scalar is not None:
+        return scalar
 
     # Enum
     if field_schema.enum_type is not None:
-        return cast(str, field_schema.enum_type.__name__)
+        return field_schema.enum_type.__name__
 
     # Integer (use smallest matching protobuf type)
     if field_schema.python_type is int:
@@ -128,22 +136,16 @@ def _python_type_to_proto(field_schema) -> str:  # type: ignore[no-untyped-def]
         # No bounds, default to int32
         return "int32"
 
-    # Bytes
+    # Bytes / string subclasses
     if field_schema.is_bytes:
         return "bytes"
-
-    # String
     if field_schema.is_str:
         return "string"
 
-    # Float (not supported in v0.1.0, but included for future)
-    if field_schema.python_type is float:
-        return "double"
-
     raise SchemaError(f"Cannot convert type {field_schema.python_type} to Protobuf type")
 
 
-def _field_comment(field_schema) -> str:  # type: ignore[no-untyped-def]
+def _field_comment(field_schema: FieldSchema) -> str:
     """Generate a comment documenting field constraints.
 
     Args:
@@ -169,29 +171,28 @@ def _field_comment(field_schema) -> str:  # type: ignore[no-untyped-def]
     try:
         bits = field_schema.bits_required()
         comments.append(f"uwacomm: {bits} bits")
-    except:  # noqa: E722
-        pass
+    except SchemaError:
+        pass  # Unsupported for compact encoding; still documented in the .proto
 
     return " | ".join(comments)
 
 
-def _enum_to_proto(enum_type: type[enum.Enum]) -> list[str]:
+def _enum_to_proto(enum_type: type[enum.Enum]) -> Iterator[str]:
     """Convert a Python enum to Protobuf enum definition.
 
     Args:
         enum_type: Enum class to convert
 
-    Returns:
-        List of lines for the enum definition
+    Yields:
+        Lines of the enum definition
     """
-    lines = [f"enum {enum_type.__name__} {{"]
+    yield f"enum {enum_type.__name__} {{"
 
     for i, member in enumerate(enum_type):
         # Protobuf enums must start with 0
-        lines.append(f"  {member.name} = {i};")
+        yield f"  {member.name} = {i};"
 
-    lines.append("}")
-    return lines
+    yield "}"
 
 
 def proto_conversion_notes() -> str:
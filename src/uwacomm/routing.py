@@ -2,19 +2,24 @@
 
 This module provides:
 - Mode 2: Self-describing messages with MESSAGE_REGISTRY
-- Mode 3: Multi-vehicle routing with RoutingHeader (to be implemented)
+- Mode 3: Multi-vehicle routing with RoutingHeader
+- Column-wise packing of many routing headers for bulk log replay
 """
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Iterator, MutableMapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TypeVar, cast
 
 from pydantic import BaseModel
 
-from uwacomm.codec.bitpack import BitUnpacker
+from uwacomm.codec._fast import byte_view, check_message_id, construct, encode_routed
 from uwacomm.codec.decoder import decode as _decode_base
 from uwacomm.codec.encoder import encode as _encode_base
+from uwacomm.codegen import compile_decoder, compile_encoder
 from uwacomm.exceptions import DecodeError
 
 T = TypeVar("T", bound=BaseModel)
@@ -24,15 +29,95 @@ T = TypeVar("T", bound=BaseModel)
 # Mode 2: Self-Describing Messages
 # ============================================================================
 
+# Largest ID representable by the 2-byte varint prefix
+_MAX_MESSAGE_ID = 32767
+
+# IDs below this are stored in a list indexed by ID; higher ones in a dict
+_DENSE_IDS = 4096
+
+
+class _MessageTable(MutableMapping[int, type[BaseModel]]):
+    """Registry mapping message IDs to classes.
+
+    Behaves like a dict (``in``, ``[]``, ``get()``, ``clear()``, ...), but decode_by_id()
+    resolves IDs below ``_DENSE_IDS`` with one list index instead of hashing them. The
+    list only grows to the largest such ID registered; higher (typically sparse) IDs
+    go in a side dict, so one large ID does not cost 32768 slots. Iteration is in ID
+    order.
+    """
+
+    __slots__ = ("_classes", "_sparse", "_count")
+
+    def __init__(self) -> None:
+        self._classes: list[type[BaseModel] | None] = []
+        self._sparse: dict[int, type[BaseModel]] = {}
+        self._count = 0
+
+    def __getitem__(self, msg_id: int) -> type[BaseModel]:
+        classes = self._classes
+        if isinstance(msg_id, int) and 0 <= msg_id < len(classes):
+            message_class = classes[msg_id]
+            if message_class is not None:
+                return message_class
+        elif isinstance(msg_id, int) and msg_id in self._sparse:
+            return self._sparse[msg_id]
+        raise KeyError(msg_id)
+
+    def __setitem__(self, msg_id: int, message_class: type[BaseModel]) -> None:
+        if not isinstance(msg_id, int) or not 0 <= msg_id <= _MAX_MESSAGE_ID:
+            raise ValueError(f"uwacomm_id must be an integer 0-{_MAX_MESSAGE_ID}, got {msg_id}")
+        if msg_id >= _DENSE_IDS:
+            if msg_id not in self._sparse:
+                self._count += 1
+            self._sparse[msg_id] = message_class
+            return
+        classes = self._classes
+        if msg_id >= len(classes):
+            classes.extend([None] * (msg_id + 1 - len(classes)))
+        if classes[msg_id] is None:
+            self._count += 1
+        classes[msg_id] = message_class
+
+    def __delitem__(self, msg_id: int) -> None:
+        if self.get(msg_id) is None:
+            raise KeyError(msg_id)
+        if msg_id >= _DENSE_IDS:
+            del self._sparse[msg_id]
+        else:
+            self._classes[msg_id] = None
+        self._count -= 1
+
+    def __iter__(self) -> Iterator[int]:
+        yield from (i for i, c in enumerate(self._classes) if c is not None)
+        yield from sorted(self._sparse)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        # In place: decode_by_id() holds references to both containers
+        self._classes.clear()
+        self._sparse.clear()
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
 # Global registry: message_id -> message_class
-MESSAGE_REGISTRY: dict[int, type[BaseModel]] = {}
+_TABLE = _MessageTable()
+MESSAGE_REGISTRY: MutableMapping[int, type[BaseModel]] = _TABLE
+_MESSAGE_CLASSES = _TABLE._classes  # Indexed directly by decode_by_id()
+_SPARSE_CLASSES = _TABLE._sparse  # IDs >= _DENSE_IDS
 
 
 def register_message(message_class: type[BaseModel]) -> None:
     """Register a message class for auto-decode by ID.
 
     This enables decode_by_id() to automatically determine the message type
-    from the embedded message ID in the binary data (Mode 2).
+    from the embedded message ID in the binary data (Mode 2). The class's
+    specialized encoder and decoder are compiled here, so the first message
+    sent or received does not pay for code generation.
 
     Args:
         message_class: Pydantic message class with uwacomm_id attribute
@@ -56,24 +141,26 @@ def register_message(message_class: type[BaseModel]) -> None:
             f"Cannot register for auto-decode."
         )
 
-    if not isinstance(msg_id, int) or msg_id < 0 or msg_id > 32767:
-        raise ValueError(f"uwacomm_id must be an integer 0-32767, got {msg_id}")
+    if not isinstance(msg_id, int) or msg_id < 0 or msg_id > _MAX_MESSAGE_ID:
+        raise ValueError(f"uwacomm_id must be an integer 0-{_MAX_MESSAGE_ID}, got {msg_id}")
 
-    # Check for conflicts
-    if msg_id in MESSAGE_REGISTRY:
-        existing = MESSAGE_REGISTRY[msg_id]
-        if existing is not message_class:
-            raise ValueError(
-                f"Message ID {msg_id} already registered to {existing.__name__}. "
-                f"Cannot register {message_class.__name__} with the same ID."
-            )
-        # Already registered, no-op
-        return
+    # Check for conflicts with a single registry probe
+    existing = MESSAGE_REGISTRY.get(msg_id)
+    if existing is None:
+        MESSAGE_REGISTRY[msg_id] = message_class
+    elif existing is not message_class:
+        raise ValueError(
+            f"Message ID {msg_id} already registered to {existing.__name__}. "
+            f"Cannot register {message_class.__name__} with the same ID."
+        )
+    # else: already registered, no-op
 
-    MESSAGE_REGISTRY[msg_id] = message_class
+    # Compile the fast paths now rather than on the first message received
+    compile_encoder(message_class)
+    compile_decoder(message_class)
 
 
-def decode_by_id(data: bytes) -> BaseModel:
+def decode_by_id(data: bytes | bytearray | memoryview) -> BaseModel:
     """Auto-decode message using embedded message ID (Mode 2).
 
     This function peeks at the message ID in the binary data, looks up the
@@ -86,7 +173,8 @@ def decode_by_id(data: bytes) -> BaseModel:
         Decoded message (type determined by ID)
 
     Raises:
-        DecodeError: If message ID not registered or data is invalid
+        DecodeError: If data is empty or ends inside the message ID, the ID is not
+            registered, or the payload is invalid
 
     Examples:
         ```python
@@ -103,24 +191,28 @@ def decode_by_id(data: bytes) -> BaseModel:
             print(f"Heartbeat at depth {msg.depth}")
         ```
     """
+    data = byte_view(data)
     if not data:
         raise DecodeError("Cannot decode empty data")
 
-    try:
-        # Read message ID using varint-style encoding
-        unpacker = BitUnpacker(data)
-
-        # Read high bit to determine ID size
-        # 1 byte: 0xxxxxxx (7 bits for ID, range 0-127)
-        # 2 bytes: 1xxxxxxx xxxxxxxx (15 bits for ID, range 0-32767)
-        high_bit = unpacker.read_bool()
-        msg_id = unpacker.read_uint(7) if not high_bit else unpacker.read_uint(15)
-
-    except IndexError as e:
-        raise DecodeError(f"Truncated data while reading message ID: {e}") from e
-
-    # Look up message class
-    message_class = MESSAGE_REGISTRY.get(msg_id)
+    # Peek the varint-style message ID straight from the first byte(s):
+    # 1 byte: 0xxxxxxx (7 bits for ID, range 0-127)
+    # 2 bytes: 1xxxxxxx xxxxxxxx (15 bits for ID, range 0-32767)
+    # The branch is deliberate: length-table + shift and int.from_bytes
+    # variants both measured slower in CPython than this two-way test.
+    b0 = data[0]
+    if not b0 & 0x80:
+        msg_id = b0
+    elif len(data) >= 2:
+        msg_id = ((b0 & 0x7F) << 8) | data[1]
+    else:
+        raise DecodeError("Truncated data while reading message ID: need 2 bytes, got 1")
+
+    # Look up message class: one list index for dense IDs, a dict probe above them.
+    # MESSAGE_REGISTRY edits (including clear()) act on these same containers, so
+    # they cannot go stale.
+    classes = _MESSAGE_CLASSES
+    message_class = classes[msg_id] if msg_id < len(classes) else _SPARSE_CLASSES.get(msg_id)
     if message_class is None:
         registered_ids = sorted(MESSAGE_REGISTRY.keys())
         raise DecodeError(
@@ -129,7 +221,17 @@ def decode_by_id(data: bytes) -> BaseModel:
             f"Did you forget to call register_message()?"
         )
 
-    # Decode with ID validation (routing=False, so returns T not tuple)
+    # The ID is already parsed, so hand the body straight to the compiled decoder instead
+    # of having decode() peek it again. The ID check still runs: uwacomm_id may have
+    # been reassigned since registration.
+    compiled = compile_decoder(message_class)
+    if compiled is not None:
+        check_message_id(message_class, msg_id)
+        fields = compiled(data, 2 if b0 & 0x80 else 1)
+        if fields is not None:
+            return construct(message_class, compiled, fields)
+
+    # Generic path: reports truncation and invalid fields (routing=False, so returns T)
     return cast(BaseModel, _decode_base(message_class, data, include_id=True))
 
 
@@ -138,7 +240,7 @@ def decode_by_id(data: bytes) -> BaseModel:
 # ============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoutingHeader:
     """Routing header for multi-vehicle communication.
 
@@ -150,6 +252,8 @@ class RoutingHeader:
         priority: Message priority (0=low, 3=high)
         ack_requested: Whether acknowledgment is requested
 
+    Instances are immutable and slotted, so each one carries only its four fields.
+
     Encoding:
         - source_id: 8 bits
         - dest_id: 8 bits
@@ -171,6 +275,16 @@ class RoutingHeader:
 
     def __post_init__(self) -> None:
         """Validate routing header values."""
+        # Fast path: one bitwise test covers all three ranges for valid int headers.
+        # Other types (bool, float, ...) take the comparisons below, as they always have.
+        source_id, dest_id, priority = self.source_id, self.dest_id, self.priority
+        if (
+            type(source_id) is int
+            and type(dest_id) is int
+            and type(priority) is int
+            and not ((source_id | dest_id) & ~0xFF or priority & ~0x3)
+        ):
+            return
         if not 0 <= self.source_id <= 255:
             raise ValueError(f"source_id must be 0-255, got {self.source_id}")
         if not 0 <= self.dest_id <= 255:
@@ -179,6 +293,24 @@ class RoutingHeader:
             raise ValueError(f"priority must be 0-3, got {self.priority}")
 
 
+# Headers are immutable, so decoders can share one instance per wire word. A link sees
+# few distinct (source, dest, priority, ack) combinations: a hit costs ~80 ns against
+# ~1 us to build a frozen dataclass.
+@lru_cache(maxsize=1024)
+def _routing_header_from_word(word: int) -> RoutingHeader:
+    """Return the RoutingHeader for a 19-bit wire word: source(8) dest(8) priority(2) ack(1)."""
+    return RoutingHeader(word >> 11, (word >> 3) & 0xFF, (word >> 1) & 0x3, bool(word & 1))
+
+
+def _encode_routed_word(message: BaseModel, header: int) -> bytes:
+    """Encode ``message`` in Mode 3 behind an already-validated 19-bit header word."""
+    frame = encode_routed(message, header)
+    if frame is None:
+        # Not compilable: the generic encoder reports which field is invalid
+        frame = _encode_base(message, routing=_routing_header_from_word(header))
+    return frame
+
+
 def encode_with_routing(
     message: BaseModel, source_id: int, dest_id: int, priority: int = 0, ack_requested: bool = False
 ) -> bytes:
@@ -212,15 +344,17 @@ def encode_with_routing(
         # Size: 3 bytes routing + 1 byte ID + 21 bytes payload = 25 bytes
         ```
     """
-    # Create and validate routing header
-    routing = RoutingHeader(source_id, dest_id, priority, ack_requested)
-
-    # Delegate to encoder with routing parameter
+    # Build the 19-bit header word directly: a RoutingHeader here would only be unpacked
+    # again. Out-of-range values go through RoutingHeader for its error messages.
+    if (source_id | dest_id) & ~0xFF or priority & ~0x3:
+        RoutingHeader(source_id, dest_id, priority, ack_requested)
+    header = (source_id << 11) | (dest_id << 3) | (priority << 1) | (1 if ack_requested else 0)
+    return _encode_routed_word(message, header)
 
-    return _encode_base(message, routing=routing)
 
-
-def decode_with_routing(message_class: type[T], data: bytes) -> tuple[RoutingHeader, T]:
+def decode_with_routing(
+    message_class: type[T], data: bytes | bytearray | memoryview
+) -> tuple[RoutingHeader, T]:
     """Decode message with routing header (Mode 3).
 
     Args:
@@ -246,6 +380,128 @@ def decode_with_routing(message_class: type[T], data: bytes) -> tuple[RoutingHea
         ```
     """
     # Delegate to decoder with routing parameter (routing=True, so returns tuple)
-    from uwacomm.codec.decoder import decode as _decode_base
-
     return cast(tuple[RoutingHeader, T], _decode_base(message_class, data, routing=True))
+
+
+# ============================================================================
+# Batch routing headers (struct-of-arrays)
+# ============================================================================
+
+# Smallest array typecode holding a 19-bit packed header ("I" is 32-bit on all
+# mainstream platforms, but C only guarantees 16 bits)
+_PACKED_TYPECODE = "I" if array("I").itemsize >= 4 else "L"
+
+
+def _check_column(name: str, column: Sequence[int], limit: int) -> None:
+    """Range-check a whole column, matching RoutingHeader's error messages."""
+    # len(), not truthiness: array-like columns (e.g. NumPy) refuse bool()
+    if len(column) and (min(column) < 0 or max(column) > limit):
+        raise ValueError(f"{name} must be 0-{limit}")
+
+
+def pack_routing_batch(
+    source_ids: Sequence[int],
+    dest_ids: Sequence[int],
+    priorities: Sequence[int],
+    ack_requested: Sequence[bool],
+) -> array[int]:
+    """Pack many routing headers, given column-wise, into one integer each.
+
+    Each header becomes its 19-bit wire value (``source_id`` in the high bits, then
+    ``dest_id``, ``priority`` and ``ack_requested``) stored in a compact
+    :class:`array.array`, so bulk log replay does not build a :class:`RoutingHeader`
+    per message. Columns may be any sequences of integers, including ``array.array``
+    or NumPy arrays of narrow integer types; values are widened before shifting.
+
+    Args:
+        source_ids: Source vehicle IDs (0-255)
+        dest_ids: Destination vehicle IDs (0-255)
+        priorities: Message priorities (0-3)
+        ack_requested: Acknowledgment flags
+
+    Returns:
+        Array of packed 19-bit headers, one per message
+
+    Raises:
+        ValueError: If the columns differ in length or a value is out of range
+
+    Examples:
+        ```python
+        packed = pack_routing_batch([3, 4], [0, 0], [2, 0], [True, False])
+        sources, dests, prios, acks = unpack_routing_batch(packed)
+        assert sources == [3, 4] and acks == [True, False]
+        ```
+    """
+    count = len(source_ids)
+    if not len(dest_ids) == len(priorities) == len(ack_requested) == count:
+        raise ValueError("Routing columns must all have the same length")
+    _check_column("source_id", source_ids, 0xFF)
+    _check_column("dest_id", dest_ids, 0xFF)
+    _check_column("priority", priorities, 0x3)
+
+    return array(
+        _PACKED_TYPECODE,
+        [
+            (int(src) << 11) | (int(dst) << 3) | (int(prio) << 1) | (1 if ack else 0)
+            for src, dst, prio, ack in zip(source_ids, dest_ids, priorities, ack_requested)
+        ],
+    )
+
+
+def unpack_routing_batch(
+    packed: Iterable[int],
+) -> tuple[list[int], list[int], list[int], list[bool]]:
+    """Split packed routing headers back into columns.
+
+    Args:
+        packed: Packed 19-bit headers, as returned by :func:`pack_routing_batch`
+
+    Returns:
+        Tuple of (source_ids, dest_ids, priorities, ack_requested) lists
+
+    Examples:
+        ```python
+        sources, dests, prios, acks = unpack_routing_batch(packed)
+        ```
+    """
+    values = packed if isinstance(packed, Sequence) else list(packed)
+    return (
+        [(word >> 11) & 0xFF for word in values],
+        [(word >> 3) & 0xFF for word in values],
+        [(word >> 1) & 0x3 for word in values],
+        [bool(word & 1) for word in values],
+    )
+
+
+def encode_routing_batch(messages: Sequence[BaseModel], packed: Sequence[int]) -> list[bytes]:
+    """Encode many messages in Mode 3, each behind its packed routing header.
+
+    Takes the headers as produced by :func:`pack_routing_batch` and encodes the
+    messages one at a time, skipping the :class:`RoutingHeader` that
+    ``encode_with_routing()`` builds per message. Nothing is vectorized beyond the
+    header range check. Each result equals ``encode_with_routing()`` for the same
+    header.
+
+    Args:
+        messages: Messages to encode (each needs a ``uwacomm_id``)
+        packed: Packed 19-bit routing headers, one per message
+
+    Returns:
+        Encoded bytes for each message, in order
+
+    Raises:
+        ValueError: If the lengths differ or a header does not fit in 19 bits
+        EncodeError: If a message fails to encode
+
+    Examples:
+        ```python
+        packed = pack_routing_batch([3, 3], [0, 7], [2, 0], [True, False])
+        frames = encode_routing_batch([heartbeat, battery], packed)
+        ```
+    """
+    if len(messages) != len(packed):
+        raise ValueError("messages and routing headers must have the same length")
+    # len(), not truthiness: array-like inputs (e.g. NumPy) refuse bool()
+    if len(packed) and (min(packed) < 0 or max(packed) > 0x7FFFF):
+        raise ValueError("packed routing headers must be 19-bit values (0-0x7FFFF)")
+    return [_encode_routed_word(message, int(header)) for message, header in zip(messages, packed)]
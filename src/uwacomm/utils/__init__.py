@@ -5,15 +5,26 @@ This module provides CRC checksums, size calculation, and other utilities.
 
 from __future__ import annotations
 
-from .crc import crc16, crc16_bytes, crc32, crc32_bytes, verify_crc16, verify_crc32
+from .crc import (
+    crc16,
+    crc16_bytes,
+    crc16_update,
+    crc32,
+    crc32_bytes,
+    crc32_update,
+    verify_crc16,
+    verify_crc32,
+)
 from .sizing import encoded_bits, encoded_size, field_sizes
 
 __all__ = [
     # CRC functions
     "crc16",
     "crc16_bytes",
+    "crc16_update",
     "crc32",
     "crc32_bytes",
+    "crc32_update",
     "verify_crc16",
     "verify_crc32",
     # Sizing functions
@@ -6,10 +6,24 @@ error detection in underwater communications.
 
 from __future__ import annotations
 
+import binascii
 import struct
+import zlib
+from functools import lru_cache
 
+# CRC-16-CCITT polynomial (x^16 + x^12 + x^5 + 1), the crc16() default
+_CRC16_CCITT_POLY = 0x1021
 
-def crc16(data: bytes, poly: int = 0x1021, init: int = 0xFFFF) -> int:
+# Precompiled big-endian CRC codecs (avoid re-parsing the format on every call)
+_U16_BE = struct.Struct(">H")
+_U32_BE = struct.Struct(">I")
+_U16_PAIR_BE = struct.Struct(">HH")  # One 4-byte step of the slice-by-4 CRC-16 loop
+
+# Inputs accepted without copying (everything the C CRC backends take)
+_BytesLike = bytes | bytearray | memoryview
+
+
+def crc16(data: _BytesLike, poly: int = 0x1021, init: int = 0xFFFF) -> int:
     """Calculate CRC-16 checksum.
 
     Uses CRC-16-CCITT polynomial by default, which is common in telecommunications
@@ -28,7 +42,69 @@ def crc16(data: bytes, poly: int = 0x1021, init: int = 0xFFFF) -> int:
         >>> checksum = crc16(data)
         >>> hex(checksum)
         '0x...'
+
+    Note:
+        The defaults give CRC-16/CCITT-FALSE; ``init=0`` gives CRC-16/XMODEM. Both
+        run in C via the standard library's ``binascii.crc_hqx``, so no third-party
+        CRC package is needed. Other polynomials use cached lookup tables.
     """
+    if 0 <= init <= 0xFFFF:
+        if poly == _CRC16_CCITT_POLY:
+            # binascii.crc_hqx implements exactly this CRC (MSB-first, no
+            # reflection, no final XOR) in C with a lookup table.
+            return binascii.crc_hqx(data, init)
+        return _crc16_table_driven(data, poly, init)
+    return _crc16_bitwise(data, poly, init)
+
+
+# Below this length the four-byte stride's slicing overhead outweighs its savings
+_CRC16_STRIDE_MIN_LEN = 16
+
+
+# Tables are shared, immutable tuples. array("H") would be ~15x smaller, but indexing
+# it boxes a fresh int on every lookup and made the inner loops ~1.6x slower.
+@lru_cache(maxsize=8)
+def _crc16_table(poly: int) -> tuple[int, ...]:
+    """Build the 256-entry byte-at-a-time lookup table for a CRC-16 polynomial."""
+    return tuple(_crc16_bitwise(bytes((i,)), poly, 0) for i in range(256))
+
+
+@lru_cache(maxsize=8)
+def _crc16_slice_tables(poly: int) -> tuple[tuple[int, ...], ...]:
+    """Build the slice-by-4 tables: entry ``k`` advances a byte by ``k`` extra zero bytes."""
+    table = _crc16_table(poly)
+    tables = [table]
+    for _ in range(3):
+        prev = tables[-1]
+        tables.append(tuple(((t << 8) & 0xFFFF) ^ table[t >> 8] for t in prev))
+    return tuple(tables)
+
+
+def _crc16_table_driven(data: _BytesLike, poly: int, init: int) -> int:
+    """Table-driven CRC-16, consuming four bytes per iteration for longer inputs."""
+    table = _crc16_table(poly)
+    crc = init
+    n = len(data)
+    if n >= _CRC16_STRIDE_MIN_LEN:
+        # Slice-by-4: fold the first 16-bit word into the CRC, then look all four
+        # bytes up in independent tables instead of four dependent byte steps.
+        # Slice-by-2 measured ~25% slower at 1 KiB; iter_unpack("HH") also beats
+        # unpacking one 32-bit word, which needs wider shifts per step.
+        t0, t1, t2, t3 = _crc16_slice_tables(poly)
+        words = n & ~3
+        for hi, lo in _U16_PAIR_BE.iter_unpack(data[:words]):
+            x = crc ^ hi
+            crc = t3[x >> 8] ^ t2[x & 0xFF] ^ t1[lo >> 8] ^ t0[lo & 0xFF]
+        if words == n:
+            return crc
+        data = data[words:]
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+    return crc
+
+
+def _crc16_bitwise(data: _BytesLike, poly: int, init: int) -> int:
+    """Bit-at-a-time CRC-16 for arbitrary polynomials and initial values."""
     crc = init
 
     for byte in data:
@@ -45,7 +121,28 @@ def crc16(data: bytes, poly: int = 0x1021, init: int = 0xFFFF) -> int:
     return crc
 
 
-def crc16_bytes(data: bytes, poly: int = 0x1021, init: int = 0xFFFF) -> bytes:
+def crc16_update(data: _BytesLike, crc: int = 0xFFFF, poly: int = 0x1021) -> int:
+    """Continue a CRC-16 over another chunk of data.
+
+    ``crc16_update(b, crc16_update(a))`` equals ``crc16(a + b)`` without building the
+    concatenation, so headers and payloads can be checksummed in place.
+
+    Args:
+        data: Next chunk of data
+        crc: CRC of the preceding chunks (default: 0xFFFF, the initial value)
+        poly: CRC polynomial
+
+    Returns:
+        16-bit CRC value covering all chunks so far
+
+    Example:
+        >>> crc16_update(b"World", crc16_update(b"Hello, ")) == crc16(b"Hello, World")
+        True
+    """
+    return crc16(data, poly, crc)
+
+
+def crc16_bytes(data: _BytesLike, poly: int = 0x1021, init: int = 0xFFFF) -> bytes:
     """Calculate CRC-16 checksum and return as 2 bytes (big-endian).
 
     Args:
@@ -63,10 +160,10 @@ def crc16_bytes(data: bytes, poly: int = 0x1021, init: int = 0xFFFF) -> bytes:
         2
     """
     crc = crc16(data, poly, init)
-    return struct.pack(">H", crc)  # Big-endian unsigned short
+    return _U16_BE.pack(crc)  # Big-endian unsigned short
 
 
-def crc32(data: bytes) -> int:
+def crc32(data: _BytesLike) -> int:
     """Calculate CRC-32 checksum.
 
     Uses the standard CRC-32 polynomial (IEEE 802.3) compatible with
@@ -83,15 +180,37 @@ def crc32(data: bytes) -> int:
         >>> checksum = crc32(data)
         >>> hex(checksum)
         '0x...'
+
+    Note:
+        This is a thin wrapper over the standard library's ``zlib.crc32``, which runs
+        in C and, in zlib builds that include them, uses the CPU's carry-less
+        multiply instructions. No extension module is needed for fast CRC-32.
     """
-    import zlib
+    # zlib.crc32 already returns an unsigned 32-bit value on Python 3
+    return zlib.crc32(data)
 
-    # zlib.crc32 returns a signed int in Python 2, unsigned in Python 3
-    # Ensure it's unsigned
-    return zlib.crc32(data) & 0xFFFFFFFF
+
+def crc32_update(data: _BytesLike, crc: int = 0) -> int:
+    """Continue a CRC-32 over another chunk of data.
+
+    ``crc32_update(b, crc32_update(a))`` equals ``crc32(a + b)`` without building the
+    concatenation.
+
+    Args:
+        data: Next chunk of data
+        crc: CRC of the preceding chunks (default: 0, the initial value)
+
+    Returns:
+        32-bit CRC value covering all chunks so far
+
+    Example:
+        >>> crc32_update(b"World", crc32_update(b"Hello, ")) == crc32(b"Hello, World")
+        True
+    """
+    return zlib.crc32(data, crc)
 
 
-def crc32_bytes(data: bytes) -> bytes:
+def crc32_bytes(data: _BytesLike) -> bytes:
     """Calculate CRC-32 checksum and return as 4 bytes (big-endian).
 
     Args:
@@ -106,18 +225,17 @@ def crc32_bytes(data: bytes) -> bytes:
         >>> len(crc_bytes)
         4
     """
-    crc = crc32(data)
-    return struct.pack(">I", crc)  # Big-endian unsigned int
+    return _U32_BE.pack(zlib.crc32(data))  # Big-endian unsigned int
 
 
 def verify_crc16(
-    data: bytes, expected_crc: int | bytes, poly: int = 0x1021, init: int = 0xFFFF
+    data: _BytesLike, expected_crc: int | _BytesLike, poly: int = 0x1021, init: int = 0xFFFF
 ) -> bool:
     """Verify CRC-16 checksum.
 
     Args:
         data: Data to verify
-        expected_crc: Expected CRC value (int or 2 bytes)
+        expected_crc: Expected CRC value (int, or 2 bytes as bytes/bytearray/memoryview)
         poly: CRC polynomial
         init: Initial CRC value
 
@@ -130,21 +248,21 @@ def verify_crc16(
         >>> verify_crc16(data, checksum)
         True
     """
-    if isinstance(expected_crc, bytes):
-        if len(expected_crc) != 2:
-            raise ValueError(f"CRC-16 must be 2 bytes, got {len(expected_crc)}")
-        expected_crc = struct.unpack(">H", expected_crc)[0]
+    if isinstance(expected_crc, int):
+        return crc16(data, poly, init) == expected_crc
 
-    actual_crc = crc16(data, poly, init)
-    return actual_crc == expected_crc
+    # Any other bytes-like value is compared in wire form: one bytes compare, no unpack
+    if len(expected_crc) != 2:
+        raise ValueError(f"CRC-16 must be 2 bytes, got {len(expected_crc)}")
+    return _U16_BE.pack(crc16(data, poly, init)) == expected_crc
 
 
-def verify_crc32(data: bytes, expected_crc: int | bytes) -> bool:
+def verify_crc32(data: _BytesLike, expected_crc: int | _BytesLike) -> bool:
     """Verify CRC-32 checksum.
 
     Args:
         data: Data to verify
-        expected_crc: Expected CRC value (int or 4 bytes)
+        expected_crc: Expected CRC value (int, or 4 bytes as bytes/bytearray/memoryview)
 
     Returns:
         True if CRC matches, False otherwise
@@ -155,10 +273,10 @@ def verify_crc32(data: bytes, expected_crc: int | bytes) -> bool:
         >>> verify_crc32(data, checksum)
         True
     """
-    if isinstance(expected_crc, bytes):
-        if len(expected_crc) != 4:
-            raise ValueError(f"CRC-32 must be 4 bytes, got {len(expected_crc)}")
-        expected_crc = struct.unpack(">I", expected_crc)[0]
+    if isinstance(expected_crc, int):
+        return zlib.crc32(data) == expected_crc
 
-    actual_crc = crc32(data)
-    return actual_crc == expected_crc
+    # Any other bytes-like value is compared in wire form: one bytes compare, no unpack
+    if len(expected_crc) != 4:
+        raise ValueError(f"CRC-32 must be 4 bytes, got {len(expected_crc)}")
+    return _U32_BE.pack(zlib.crc32(data)) == expected_crc
@@ -11,6 +11,13 @@ from pydantic import BaseModel
 from ..codec.schema import MessageSchema
 
 
+def _schema_for(message_or_class: BaseModel | type[BaseModel]) -> MessageSchema:
+    """Return the (class-cached) schema for a message instance or class."""
+    if isinstance(message_or_class, BaseModel):
+        return MessageSchema.from_model(type(message_or_class))
+    return MessageSchema.from_model(message_or_class)
+
+
 def encoded_size(message_or_class: BaseModel | type[BaseModel]) -> int:
     """Calculate the encoded size of a message in bytes.
 
@@ -37,14 +44,7 @@ def encoded_size(message_or_class: BaseModel | type[BaseModel]) -> int:
         >>> encoded_size(msg)
         2
     """
-    # Get the class if we were passed an instance
-    if isinstance(message_or_class, BaseModel):
-        message_class = type(message_or_class)
-    else:
-        message_class = message_or_class
-
-    # Introspect schema
-    schema = MessageSchema.from_model(message_class)
+    schema = _schema_for(message_or_class)
 
     # Calculate total size
     return schema.total_bytes()
@@ -66,14 +66,7 @@ def encoded_bits(message_or_class: BaseModel | type[BaseModel]) -> int:
         >>> encoded_bits(Status)
         9  # 8 bits + 1 bit
     """
-    # Get the class if we were passed an instance
-    if isinstance(message_or_class, BaseModel):
-        message_class = type(message_or_class)
-    else:
-        message_class = message_or_class
-
-    # Introspect schema
-    schema = MessageSchema.from_model(message_class)
+    schema = _schema_for(message_or_class)
 
     # Calculate total bits
     return schema.total_bits()
@@ -96,14 +89,7 @@ def field_sizes(message_or_class: BaseModel | type[BaseModel]) -> dict[str, int]
         >>> sizes
         {'vehicle_id': 8, 'active': 1}
     """
-    # Get the class if we were passed an instance
-    if isinstance(message_or_class, BaseModel):
-        message_class = type(message_or_class)
-    else:
-        message_class = message_or_class
-
-    # Introspect schema
-    schema = MessageSchema.from_model(message_class)
+    schema = _schema_for(message_or_class)
 
     # Calculate size for each field
     return {field.name: field.bits_required() for field in schema.fields}
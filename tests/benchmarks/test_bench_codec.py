@@ -7,6 +7,7 @@ message payloads, plus full roundtrip and fragmentation/reassembly performance.
 from __future__ import annotations
 
 import pytest
+from pydantic import field_validator
 
 from uwacomm import decode, encode
 from uwacomm.fragmentation import fragment_message, reassemble_fragments
@@ -14,6 +15,15 @@ from uwacomm.fragmentation import fragment_message, reassemble_fragments
 from .conftest import LargeMessage, MediumMessage, SmallMessage
 
 
+class ValidatedSmallMessage(SmallMessage):
+    """SmallMessage with a no-op validator, which keeps pydantic validation on decode."""
+
+    @field_validator("depth_cm")
+    @classmethod
+    def _passthrough(cls, value: int) -> int:
+        return value
+
+
 class TestEncodeSpeed:
     """Benchmark encode() performance across message sizes."""
 
@@ -66,6 +76,13 @@ class TestDecodeSpeed:
         result = benchmark(decode, LargeMessage, large_encoded)
         assert isinstance(result, LargeMessage)
 
+    def test_decode_small_message_validated(
+        self, benchmark: pytest.FixtureRequest, small_encoded: bytes
+    ) -> None:
+        """Benchmark decoding when pydantic validation must run (custom validator)."""
+        result = benchmark(decode, ValidatedSmallMessage, small_encoded)
+        assert isinstance(result, ValidatedSmallMessage)
+
 
 class TestRoundtripSpeed:
     """Benchmark full encode→decode roundtrip performance."""
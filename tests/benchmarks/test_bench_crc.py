@@ -0,0 +1,70 @@
+"""Performance benchmarks for CRC computation and CRC-protected framing.
+
+The default CRC-16/CCITT polynomial and CRC-32 run in C (``binascii``/``zlib``);
+other CRC-16 polynomials use the pure-Python table path. These benchmarks keep
+both visible so a regression to a per-bit loop is caught.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from uwacomm.framing import frame_message, frame_with_id, unframe_message, unframe_with_id
+from uwacomm.utils.crc import crc16, crc32
+
+FRAME_PAYLOAD = bytes(range(64))  # Typical acoustic modem frame
+LARGE_PAYLOAD = bytes(range(256)) * 40  # ~10 kB, e.g. a reassembled sensor dump
+
+
+class TestCRC16Speed:
+    """Benchmark crc16() on the C and table-driven paths."""
+
+    def test_crc16_ccitt_frame(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark CRC-16/CCITT over a 64-byte frame."""
+        result = benchmark(crc16, FRAME_PAYLOAD)
+        assert 0 <= result <= 0xFFFF
+
+    def test_crc16_ccitt_large(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark CRC-16/CCITT over ~10 kB."""
+        result = benchmark(crc16, LARGE_PAYLOAD)
+        assert 0 <= result <= 0xFFFF
+
+    def test_crc16_custom_poly_large(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark a non-CCITT polynomial (table-driven Python path) over ~10 kB."""
+        result = benchmark(crc16, LARGE_PAYLOAD, 0x8005, 0x0000)
+        assert 0 <= result <= 0xFFFF
+
+
+class TestCRC32Speed:
+    """Benchmark crc32() performance."""
+
+    def test_crc32_large(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark CRC-32 over ~10 kB."""
+        result = benchmark(crc32, LARGE_PAYLOAD)
+        assert 0 <= result <= 0xFFFFFFFF
+
+
+class TestCRCFramingSpeed:
+    """Benchmark CRC-protected framing round trips."""
+
+    def test_frame_with_id_crc16(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark framing a 64-byte payload with ID and CRC-16."""
+        result = benchmark(frame_with_id, FRAME_PAYLOAD, 42, crc="crc16")
+        assert len(result) == 4 + 2 + len(FRAME_PAYLOAD) + 2
+
+    def test_unframe_with_id_crc16(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark unframing and verifying a 64-byte payload with CRC-16."""
+        framed = frame_with_id(FRAME_PAYLOAD, 42, crc="crc16")
+        msg_id, payload = benchmark(unframe_with_id, framed, crc="crc16")
+        assert (msg_id, payload) == (42, FRAME_PAYLOAD)
+
+    def test_frame_message_crc32_large(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark length-prefixed CRC-32 framing of ~10 kB (one copy of the payload)."""
+        result = benchmark(frame_message, LARGE_PAYLOAD, crc="crc32")
+        assert len(result) == 4 + len(LARGE_PAYLOAD) + 4
+
+    def test_unframe_message_crc32_large(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark validating and unframing ~10 kB with CRC-32 (only the payload is copied)."""
+        framed = frame_message(LARGE_PAYLOAD, crc="crc32")
+        result = benchmark(unframe_message, framed, crc="crc32")
+        assert result == LARGE_PAYLOAD
@@ -28,8 +28,16 @@ class TelemetryMsg(BaseMessage):
     uwacomm_id: ClassVar[int | None] = 300
 
 
-# Register once at module level so decode_by_id benchmark works
+class StatusMsg(BaseMessage):
+    """Small message with a 1-byte ID (< 128) for the short ID branch."""
+
+    vehicle_id: int = BoundedInt(ge=0, le=255)
+    uwacomm_id: ClassVar[int | None] = 42
+
+
+# Register once at module level so decode_by_id benchmarks work
 register_message(TelemetryMsg)
+register_message(StatusMsg)
 
 
 class TestRoutingEncodeSpeed:
@@ -67,6 +75,12 @@ class TestRoutingDecodeSpeed:
         result = benchmark(decode_by_id, encoded)
         assert result is not None
 
+    def test_decode_by_id_dispatch_short_id(self, benchmark: pytest.FixtureRequest) -> None:
+        """Benchmark the dispatch path for a 1-byte message ID."""
+        encoded = encode(StatusMsg(vehicle_id=7), include_id=True)
+        result = benchmark(decode_by_id, encoded)
+        assert isinstance(result, StatusMsg)
+
 
 class TestRoutingRoundtripSpeed:
     """Benchmark full routing encode→decode roundtrip."""
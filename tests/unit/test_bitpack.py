@@ -92,6 +92,22 @@ class TestBitPacker:
         assert packer.bit_length() == 0
         assert packer.to_bytes() == b""
 
+    def test_long_unaligned_stream(self) -> None:
+        """Test a stream long enough to flush the accumulator several times."""
+        packer = BitPacker()
+        expected = ""
+        for i in range(100):
+            packer.write_uint(i % 8, 3)
+            packer.write_bool(i % 2 == 1)
+            expected += format(i % 8, "03b") + str(i % 2)
+        packer.write_bytes(b"\xa5\x0f")  # Unaligned raw bytes
+        packer.write_uint(2**64 - 1, 64)
+        expected += "1010010100001111" + "1" * 64
+
+        assert packer.bit_length() == len(expected)
+        padded = expected + "0" * (-len(expected) % 8)
+        assert packer.to_bytes() == int(padded, 2).to_bytes(len(padded) // 8, "big")
+
 
 class TestBitUnpacker:
     """Test BitUnpacker functionality."""
@@ -148,10 +164,45 @@ class TestBitUnpacker:
         with pytest.raises(IndexError, match="past end"):
             unpacker.read_bool()
 
+    def test_unaligned_reads(self) -> None:
+        """Test reads that straddle byte boundaries, including raw bytes and peeks."""
+        unpacker = BitUnpacker(bytearray(b"\xa5\x0f\xf0\x3c"))
+
+        assert unpacker.read_uint(3) == 0b101
+        assert unpacker.peek_uint(9) == 0b001010000
+        assert unpacker.read_bytes(2) == bytes([0b00101000, 0b01111111])
+        assert unpacker.position() == 19
+        assert unpacker.read_uint(13) == 0b1000000111100
+        with pytest.raises(IndexError, match="Not enough bits"):
+            unpacker.read_bytes(1)
+
+    def test_buffer_is_not_copied(self) -> None:
+        """Test non-bytes buffers are read in place and read_bytes still returns bytes."""
+        buf = bytearray(b"\x12\x34\x56")
+        unpacker = BitUnpacker(memoryview(buf)[1:])
+
+        buf[1] = 0xAB  # Visible through the view: no copy was taken
+        assert unpacker.read_uint(4) == 0xA
+        assert unpacker.read_bytes(1) == b"\xb5"
+
+        aligned = BitUnpacker(buf)
+        result = aligned.read_bytes(2)
+        assert result == b"\x12\xab" and type(result) is bytes
+
 
 class TestRoundTrip:
     """Test round-trip encoding/decoding."""
 
+    def test_roundtrip_signed_extremes(self) -> None:
+        """Test every 4-bit signed value and the 64-bit extremes round-trip."""
+        values = [(v, 4) for v in range(-8, 8)] + [(-(2**63), 64), (2**63 - 1, 64), (-1, 64)]
+        packer = BitPacker()
+        for value, bits in values:
+            packer.write_int(value, bits)
+
+        unpacker = BitUnpacker(packer.to_bytes())
+        assert [unpacker.read_int(bits) for _, bits in values] == [v for v, _ in values]
+
     def test_roundtrip_bool(self) -> None:
         """Test bool round-trip."""
         packer = BitPacker()
@@ -8,64 +8,62 @@ from pathlib import Path
 
 import pytest
 
+from uwacomm.cli.main import main
 
-def test_cli_help() -> None:
+
+def test_cli_help(capsys: pytest.CaptureFixture[str]) -> None:
     """Test CLI --help flag."""
-    result = subprocess.run(
-        [sys.executable, "-m", "uwacomm.cli.main", "--help"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "uwacomm: Underwater Communications Codec" in result.stdout
-    assert "--analyze" in result.stdout
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--help"])
+    assert exc_info.value.code == 0
 
+    out = capsys.readouterr().out
+    assert "uwacomm: Underwater Communications Codec" in out
+    assert "--analyze" in out
 
-def test_cli_version() -> None:
+
+def test_cli_version(capsys: pytest.CaptureFixture[str]) -> None:
     """Test CLI --version flag."""
-    result = subprocess.run(
-        [sys.executable, "-m", "uwacomm.cli.main", "--version"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "uwacomm 0.1.0" in result.stdout
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--version"])
+    assert exc_info.value.code == 0
+    assert "uwacomm 0.1.0" in capsys.readouterr().out
 
 
-def test_cli_analyze_example_file() -> None:
+def test_cli_analyze_example_file(capsys: pytest.CaptureFixture[str]) -> None:
     """Test CLI --analyze with a real example file."""
     example_file = Path("examples/framing_example.py")
     if not example_file.exists():
         pytest.skip("Example file not found")
 
-    result = subprocess.run(
-        [sys.executable, "-m", "uwacomm.cli.main", "--analyze", str(example_file)],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "uwacomm: Underwater Communications Codec" in result.stdout
-    assert "messages loaded" in result.stdout
-    assert "StatusReport" in result.stdout or "CommandMessage" in result.stdout
+    assert main(["--analyze", str(example_file)]) == 0
 
+    out = capsys.readouterr().out
+    assert "uwacomm: Underwater Communications Codec" in out
+    assert "messages loaded" in out
+    assert "StatusReport" in out or "CommandMessage" in out
 
-def test_cli_analyze_missing_file() -> None:
+
+def test_cli_analyze_missing_file(capsys: pytest.CaptureFixture[str]) -> None:
     """Test CLI --analyze with missing file."""
-    result = subprocess.run(
-        [sys.executable, "-m", "uwacomm.cli.main", "--analyze", "nonexistent.py"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 1
-    assert "Error" in result.stderr or "not found" in result.stderr.lower()
+    assert main(["--analyze", "nonexistent.py"]) == 1
 
+    err = capsys.readouterr().err
+    assert "Error" in err or "not found" in err.lower()
 
-def test_cli_no_args() -> None:
+
+def test_cli_no_args(capsys: pytest.CaptureFixture[str]) -> None:
     """Test CLI with no arguments (should show help)."""
+    assert main([]) == 0
+    assert "uwacomm: Underwater Communications Codec" in capsys.readouterr().out
+
+
+def test_cli_module_entry_point() -> None:
+    """Test the CLI runs as ``python -m uwacomm.cli.main`` in a fresh interpreter."""
     result = subprocess.run(
-        [sys.executable, "-m", "uwacomm.cli.main"],
+        [sys.executable, "-m", "uwacomm.cli.main", "--version"],
         capture_output=True,
         text=True,
     )
     assert result.returncode == 0
-    assert "uwacomm: Underwater Communications Codec" in result.stdout
+    assert "uwacomm 0.1.0" in result.stdout
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import enum
+import json
 from typing import ClassVar
 
 import pytest
 from pydantic import Field
 
 from uwacomm import BaseMessage, DecodeError, EncodeError, decode, encode, encoded_size
+from uwacomm.codec import schema as schema_mod
+from uwacomm.codec.schema import MessageSchema
 
 
 class Priority(enum.Enum):
@@ -110,6 +113,46 @@ class TestEncodeDecode:
         decoded = decode(StringMessage, data)
         assert decoded.callsign == "ALPHA123"
 
+    def test_decode_buffer_inputs(self) -> None:
+        """Test bytearray and memoryview inputs (including wide-item views) decode in place."""
+        from array import array
+
+        from uwacomm.routing import decode_with_routing, encode_with_routing
+
+        class Tagged(BaseMessage):
+            vehicle_id: int = Field(ge=0, le=255)
+            active: bool
+
+            uwacomm_id: ClassVar[int | None] = 300
+
+        msg = Tagged(vehicle_id=42, active=True)
+        for data, kwargs in (
+            (encode(msg), {}),
+            (encode(msg, include_id=True), {"include_id": True}),
+        ):
+            wide = array("H")
+            wide.frombytes(data + b"\x00" * (len(data) % 2))  # 2-byte items, same bytes
+            framed = b"\xff" + data
+            for buffer in (bytearray(data), memoryview(data), memoryview(wide)):
+                assert decode(Tagged, buffer, **kwargs) == msg
+            assert decode(Tagged, memoryview(framed)[1:], **kwargs) == msg
+
+        routed = encode_with_routing(msg, source_id=3, dest_id=0)
+        assert decode_with_routing(Tagged, memoryview(bytearray(routed)))[1] == msg
+
+    def test_enum_ordinal_tables(self) -> None:
+        """Test enum ordinal tables are built once and skip aliases."""
+
+        class Aliased(enum.Enum):
+            A = 1
+            B = 2
+            ALSO_A = 1
+
+        assert schema_mod.enum_members(Aliased) == (Aliased.A, Aliased.B)
+        assert schema_mod.enum_ordinals(Aliased) == {Aliased.A: 0, Aliased.B: 1}
+        assert schema_mod.enum_ordinals(Priority) is schema_mod.enum_ordinals(Priority)
+        assert schema_mod.enum_ordinals(Priority)[Priority.HIGH] == 2
+
 
 class TestEncodeErrors:
     """Test encoding error handling."""
@@ -179,6 +222,68 @@ class TestSizeCalculation:
         size = encoded_size(BoundedMessage)
         assert size == 3  # 22 bits = 3 bytes
 
+    def test_schema_cached_per_class(self) -> None:
+        """Schemas are built once per class; subclasses get their own."""
+
+        class Extended(BoundedMessage):
+            flag: bool
+
+        schema = MessageSchema.from_model(BoundedMessage)
+        assert MessageSchema.from_model(BoundedMessage) is schema
+        assert MessageSchema.from_model(Extended) is not schema
+        assert encoded_size(Extended) == 3  # 23 bits = 3 bytes
+        assert MessageSchema.from_model(Extended).total_bits() == schema.total_bits() + 1
+
+    def test_field_bits_cached(self) -> None:
+        """Each field's bit width is computed once and then reused."""
+        field = MessageSchema.from_model(BoundedMessage).fields[0]
+        assert field.bits_required() == field.bits_required()
+        assert field._bits == field.bits_required()
+
+
+class TestFieldKind:
+    """Test that field kinds are resolved once at schema construction."""
+
+    def test_kinds_resolved(self) -> None:
+        """Each supported field type maps to its KIND_* constant."""
+        kinds = {f.name: f.kind for f in MessageSchema.from_model(EnumMessage).fields}
+        assert kinds == {"priority": schema_mod.KIND_ENUM, "id": schema_mod.KIND_BOUNDED_INT}
+
+        simple = {f.name: f.kind for f in MessageSchema.from_model(SimpleMessage).fields}
+        assert simple["active"] == schema_mod.KIND_BOOL
+
+        (payload,) = MessageSchema.from_model(BytesMessage).fields
+        assert payload.kind == schema_mod.KIND_FIXED_BYTES
+        (callsign,) = MessageSchema.from_model(StringMessage).fields
+        assert callsign.kind == schema_mod.KIND_FIXED_STR
+
+    def test_unbounded_int_is_unsupported(self) -> None:
+        """Integers without bounds resolve to KIND_UNSUPPORTED and raise on sizing."""
+        from uwacomm.exceptions import SchemaError
+
+        class Unbounded(BaseMessage):
+            value: int
+
+        (field,) = MessageSchema.from_model(Unbounded).fields
+        assert field.kind == schema_mod.KIND_UNSUPPORTED
+        with pytest.raises(SchemaError, match="require ge= and le="):
+            field.bits_required()
+
+    def test_fixed_length_metadata(self) -> None:
+        """FixedBytes/FixedStr keep the caller's json_schema_extra and a serializable schema."""
+        from uwacomm import FixedBytes, FixedStr
+
+        class Fixed(BaseMessage):
+            tag: bytes = FixedBytes(length=4, json_schema_extra={"unit": "raw"})
+            name: str = FixedStr(length=3)
+
+        assert Fixed.model_fields["tag"].json_schema_extra == {"unit": "raw"}
+        assert Fixed.model_fields["name"].json_schema_extra is None
+        json.dumps(Fixed.model_json_schema())
+
+        msg = Fixed(tag=b"\x00\x01\x02\x03", name="AUV")
+        assert decode(Fixed, encode(msg)) == msg
+
 
 class TestMaxBytesConstraint:
     """Test uwacomm_max_bytes constraint."""
@@ -0,0 +1,301 @@
+"""Unit tests for compiled per-model encoders and decoders."""
+
+from __future__ import annotations
+
+import enum
+from typing import ClassVar
+
+import pytest
+
+from uwacomm import (
+    BaseMessage,
+    BoundedFloat,
+    BoundedInt,
+    DecodeError,
+    EncodeError,
+    FixedBytes,
+    FixedStr,
+    VarBytes,
+    decode,
+    encode,
+)
+from uwacomm.codec.bitpack import BitPacker
+from uwacomm.codec.encoder import _encode_field
+from uwacomm.codec.schema import MessageSchema
+from uwacomm.codegen import compile_decoder, compile_encoder
+
+
+class Mode(enum.Enum):
+    """Test enum."""
+
+    IDLE = 0
+    SURVEY = 1
+    RETURN = 2
+
+
+class Position(BaseMessage):
+    """Nested test message."""
+
+    lat: float = BoundedFloat(min=-90.0, max=90.0, precision=4)
+    lon: float = BoundedFloat(min=-180.0, max=180.0, precision=4)
+
+
+class Telemetry(BaseMessage):
+    """Fixed-layout message covering every specialized field kind."""
+
+    vehicle_id: int = BoundedInt(ge=0, le=255)
+    depth: int = BoundedInt(ge=-10, le=5000)
+    active: bool
+    mode: Mode
+    tag: bytes = FixedBytes(length=2)
+    name: str = FixedStr(length=3)
+    position: Position
+
+    uwacomm_id: ClassVar[int] = 42
+
+
+class WithVarLen(BaseMessage):
+    """Message with a variable-length field (not specialized)."""
+
+    payload: bytes = VarBytes(max_length=8)
+
+
+def _telemetry(**overrides: object) -> Telemetry:
+    values: dict[str, object] = {
+        "vehicle_id": 7,
+        "depth": 1234,
+        "active": True,
+        "mode": Mode.RETURN,
+        "tag": b"\xab\xcd",
+        "name": "AUV",
+        "position": Position(lat=42.5, lon=-71.25),
+    }
+    values.update(overrides)
+    return Telemetry(**values)  # type: ignore[arg-type]
+
+
+class TestCompileEncoder:
+    """Test the generated encoder against the generic encoder."""
+
+    def test_matches_generic_encoder(self) -> None:
+        """Compiled output is identical to the generic bit packer."""
+        enc = compile_encoder(Telemetry)
+        assert enc is not None
+        for msg in (_telemetry(), _telemetry(active=False, mode=Mode.IDLE, depth=-10)):
+            packer = BitPacker()
+            for fs in MessageSchema.from_model(Telemetry).fields:
+                _encode_field(packer, fs, getattr(msg, fs.name))
+            assert enc(msg) == packer.to_bytes()
+            assert encode(msg, include_id=True) == bytes([42]) + enc(msg)
+            assert enc(msg, 0x8000 | 300, 2) == b"\x81\x2c" + enc(msg)
+            assert decode(Telemetry, enc(msg)) == msg  # type: ignore[arg-type]
+
+    def test_missing_field_defers_to_generic(self) -> None:
+        """A field absent from the instance __dict__ makes the compiled encoder bail out."""
+        enc = compile_encoder(Telemetry)
+        assert enc is not None
+        partial = Telemetry.model_construct(
+            **{k: v for k, v in _telemetry().__dict__.items() if k != "depth"}
+        )
+        assert enc(partial) is None
+        with pytest.raises(AttributeError, match="depth"):
+            encode(partial)
+
+    def test_cached_on_class(self) -> None:
+        """The encoder is compiled once and stored on the class itself."""
+        enc = compile_encoder(Telemetry)
+        assert compile_encoder(Telemetry) is enc
+        assert Telemetry.__dict__["__uwacomm_encoder__"] is enc
+
+    def test_subclass_gets_own_encoder(self) -> None:
+        """Subclasses with extra fields do not reuse the parent's encoder."""
+
+        class Extended(Telemetry):
+            extra: bool
+
+        compile_encoder(Telemetry)
+        msg = Extended(**_telemetry().model_dump(), extra=True)
+        assert compile_encoder(Extended) is not compile_encoder(Telemetry)
+        assert decode(Extended, encode(msg)) == msg
+
+    def test_varlen_not_specialized(self) -> None:
+        """Models with variable-length fields use the generic encoder."""
+        assert compile_encoder(WithVarLen) is None
+        assert decode(WithVarLen, encode(WithVarLen(payload=b"abc"))).payload == b"abc"
+
+    def test_invalid_value_falls_back_to_generic_error(self) -> None:
+        """Values rejected by the compiled encoder still raise the generic EncodeError."""
+        msg = Telemetry.model_construct(**{**_telemetry().__dict__, "vehicle_id": 999})
+        enc = compile_encoder(Telemetry)
+        assert enc is not None
+        assert enc(msg) is None
+        with pytest.raises(EncodeError, match="out of bounds"):
+            encode(msg)
+
+    def test_exact_types_only(self) -> None:
+        """Values of other (sub)types are left to the generic encoder, with equal output."""
+
+        class Depth(float):
+            pass
+
+        base = _telemetry()
+        odd = Telemetry.model_construct(
+            **{
+                **base.__dict__,
+                "depth": True,
+                "position": Position.model_construct(lat=Depth(42.5), lon=-71.25),
+            }
+        )
+        enc = compile_encoder(Telemetry)
+        assert enc is not None
+        assert enc(odd) is None
+        assert encode(odd) == encode(_telemetry(depth=1))
+
+        class SubPosition(Position):
+            pass
+
+        sub = Telemetry.model_construct(
+            **{**base.__dict__, "position": SubPosition(lat=42.5, lon=-71.25)}
+        )
+        assert enc(sub) is None
+        assert encode(sub) == encode(base)
+
+
+class TestCompileDecoder:
+    """Test the generated decoder against the generic decoder."""
+
+    def test_matches_generic_decoder(self) -> None:
+        """Compiled field values reconstruct the original message."""
+        dec = compile_decoder(Telemetry)
+        assert dec is not None
+        for msg in (_telemetry(), _telemetry(active=False, mode=Mode.IDLE, depth=5000)):
+            data = encode(msg)
+            assert Telemetry(**dec(data)) == msg  # type: ignore[arg-type]
+            # Mode 2 reads the same body in place, after the ID byte
+            assert dec(encode(msg, include_id=True), 1) == dec(data)
+            assert dec(data[:-1], 0) is None and dec(b"\x2a" + data[:-1], 1) is None
+            assert decode(Telemetry, encode(msg, include_id=True), include_id=True) == msg
+
+    def test_cached_on_class(self) -> None:
+        """The decoder is compiled once and stored on the class itself."""
+        dec = compile_decoder(Telemetry)
+        assert compile_decoder(Telemetry) is dec
+        assert Telemetry.__dict__["__uwacomm_decoder__"] is dec
+        assert compile_decoder(WithVarLen) is None
+
+    def test_invalid_data_falls_back_to_generic_error(self) -> None:
+        """Truncated or out-of-range data still raises the generic DecodeError."""
+        dec = compile_decoder(Telemetry)
+        assert dec is not None
+        data = encode(_telemetry())
+
+        assert dec(data[:-1]) is None
+        with pytest.raises(DecodeError, match="Truncated"):
+            decode(Telemetry, data[:-1])
+
+        # Mode ordinal 3 does not exist (2 bits: vehicle_id 8 + depth 13 + active 1)
+        bad = bytearray(data)
+        bad[2] |= 0b11
+        assert dec(bytes(bad)) is None
+        with pytest.raises(DecodeError, match="invalid enum"):
+            decode(Telemetry, bytes(bad))
+
+    def test_plain_models_skip_validation(self) -> None:
+        """Bounds-only models are built without pydantic but behave like validated ones."""
+        dec = compile_decoder(Telemetry)
+        assert dec is not None and dec.construct is not None
+
+        msg = _telemetry()
+        decoded = decode(Telemetry, encode(msg))
+        assert decoded == msg
+        assert decoded.model_fields_set == set(Telemetry.model_fields)
+        assert decoded.model_dump() == msg.model_dump()
+        with pytest.raises(ValueError):
+            decoded.vehicle_id = 256  # Assignment is still validated
+
+    def test_validators_keep_validated_construction(self) -> None:
+        """Models with custom validators are constructed through __init__."""
+        from pydantic import field_validator
+
+        class Rounded(BaseMessage):
+            depth: int = BoundedInt(ge=0, le=1000)
+
+            @field_validator("depth")
+            @classmethod
+            def _round(cls, value: int) -> int:
+                return value - value % 10
+
+        dec = compile_decoder(Rounded)
+        assert dec is not None and dec.construct is None
+        assert decode(Rounded, encode(Rounded.model_construct(depth=127))).depth == 120
+
+    def test_transforming_config_keeps_validated_construction(self) -> None:
+        """Models whose model_config rewrites or rejects values are built through __init__."""
+        from pydantic import ConfigDict
+
+        class Upper(BaseMessage):
+            model_config = ConfigDict(str_to_upper=True)
+
+            name: str = FixedStr(length=4)
+            depth: int = BoundedInt(ge=0, le=100)
+
+        dec = compile_decoder(Upper)
+        assert dec is not None and dec.construct is None
+        assert decode(Upper, b"wxyz" + bytes([42 << 1])) == Upper(name="WXYZ", depth=42)
+
+        for config in (
+            ConfigDict(str_strip_whitespace=True),
+            ConfigDict(use_enum_values=True),
+            ConfigDict(strict=True),
+        ):
+            configured = type("Configured", (Telemetry,), {"model_config": config})
+            configured_dec = compile_decoder(configured)
+            assert configured_dec is not None and configured_dec.construct is None
+
+    def test_short_utf8_string_still_rejected(self) -> None:
+        """Multi-byte text decoding to too few characters defers to the generic error."""
+
+        class Name(BaseMessage):
+            name: str = FixedStr(length=3)
+
+        data = "é".encode() + b"x"  # 3 bytes, 2 characters
+        dec = compile_decoder(Name)
+        assert dec is not None and dec(data) is None
+        with pytest.raises(DecodeError):
+            decode(Name, data)
+
+
+class TestCompileTriggers:
+    """Test when compilation happens and how to turn it off."""
+
+    def test_register_message_compiles_eagerly(self) -> None:
+        """register_message() compiles both directions before the first message."""
+        from uwacomm.routing import MESSAGE_REGISTRY, register_message
+
+        class Beacon(BaseMessage):
+            seq: int = BoundedInt(ge=0, le=255)
+
+            uwacomm_id: ClassVar[int] = 31001
+
+        assert "__uwacomm_encoder__" not in Beacon.__dict__
+        try:
+            register_message(Beacon)
+            assert Beacon.__dict__["__uwacomm_encoder__"] is not None
+            assert Beacon.__dict__["__uwacomm_decoder__"] is not None
+        finally:
+            MESSAGE_REGISTRY.pop(31001, None)
+
+    def test_disable_jit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With code generation disabled, the generic path handles everything."""
+        from uwacomm import codegen
+
+        monkeypatch.setattr(codegen, "_DISABLED", True)
+
+        class Plain(BaseMessage):
+            seq: int = BoundedInt(ge=0, le=255)
+
+        assert compile_encoder(Plain) is None
+        assert compile_decoder(Plain) is None
+        msg = Plain(seq=9)
+        assert encode(msg) == b"\x09"
+        assert decode(Plain, encode(msg)) == msg
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import pytest
+
 from uwacomm.utils.crc import (
+    _crc16_bitwise,
+    _crc16_slice_tables,
+    _crc16_table,
     crc16,
     crc16_bytes,
+    crc16_update,
     crc32,
     crc32_bytes,
+    crc32_update,
     verify_crc16,
     verify_crc32,
 )
@@ -67,6 +74,43 @@ class TestCRC16:
 
         assert verify_crc16(data, checksum_bytes) is True
 
+    def test_crc16_ccitt_check_value(self) -> None:
+        """Test the standard CRC-16/CCITT-FALSE check value."""
+        assert crc16(b"123456789") == 0x29B1
+        assert crc16(b"123456789", init=0x0000) == 0x31C3  # CRC-16/XMODEM
+        assert crc16(bytearray(b"123456789")) == crc16(memoryview(b"123456789")) == 0x29B1
+
+    def test_crc16_custom_poly_matches_reference(self) -> None:
+        """Test that non-default polynomials use the generic bitwise path."""
+        # CRC-16/UMTS: polynomial 0x8005, init 0, no reflection
+        assert crc16(b"123456789", poly=0x8005, init=0x0000) == 0xFEE8
+
+    def test_crc16_table_matches_bitwise(self) -> None:
+        """Test the table-driven path against the bit-at-a-time reference."""
+        data = bytes(range(256)) * 3
+        for poly in (0x1021, 0x8005, 0x3D65):
+            for init in (0x0000, 0xFFFF, 0x1D0F):
+                assert crc16(data, poly=poly, init=init) == _crc16_bitwise(data, poly, init)
+
+        # Short inputs use the byte loop; longer ones stride four bytes (any tail length)
+        for length in (0, 1, 15, 16, 17, 18, 19, 33, 256):
+            chunk = data[7 : 7 + length]
+            assert crc16(chunk, poly=0x8005) == _crc16_bitwise(chunk, 0x8005, 0xFFFF)
+
+    def test_crc16_tables_shared(self) -> None:
+        """Test lookup tables are built once per polynomial and are immutable."""
+        table = _crc16_table(0x8005)
+        assert _crc16_table(0x8005) is table
+        assert isinstance(table, tuple) and len(table) == 256
+        assert table[1] == 0x8005
+
+        slices = _crc16_slice_tables(0x8005)
+        assert slices[0] is table and len(slices) == 4
+        assert _crc16_slice_tables(0x8005) is slices
+        # Entry k advances by k zero bytes: a lone 1 byte followed by k zeros
+        for k, sliced in enumerate(slices):
+            assert sliced[1] == _crc16_bitwise(b"\x01" + bytes(k), 0x8005, 0)
+
 
 class TestCRC32:
     """Test CRC-32 functionality."""
@@ -79,6 +123,10 @@ class TestCRC32:
         assert isinstance(checksum, int)
         assert 0 <= checksum <= 0xFFFFFFFF
 
+    def test_crc32_check_value(self) -> None:
+        """Test the IEEE 802.3 (not Castagnoli) check value that frames rely on."""
+        assert crc32(b"123456789") == 0xCBF43926
+
     def test_crc32_deterministic(self) -> None:
         """Test CRC-32 is deterministic."""
         data = b"Test data"
@@ -123,6 +171,24 @@ class TestCRC32:
 
         assert verify_crc32(data, checksum_bytes) is True
 
+    def test_verify_bytes_mismatch_and_length(self) -> None:
+        """Test bytes verification rejects wrong CRCs and wrong lengths."""
+        data = b"Test data"
+
+        assert verify_crc32(data, b"\x12\x34\x56\x78") is False
+        assert verify_crc16(data, b"\x12\x34") is False
+        with pytest.raises(ValueError, match="4 bytes"):
+            verify_crc32(data, crc32_bytes(data)[:3])
+        with pytest.raises(ValueError, match="2 bytes"):
+            verify_crc16(data, b"\x00\x00\x00")
+
+    def test_verify_bytes_like_expected(self) -> None:
+        """Test expected CRCs given as bytearray or memoryview are compared as bytes."""
+        data = b"Test data"
+
+        assert verify_crc16(data, bytearray(crc16_bytes(data))) is True
+        assert verify_crc32(data, memoryview(crc32_bytes(data))) is True
+
 
 class TestCRCEdgeCases:
     """Test CRC edge cases."""
@@ -154,3 +220,14 @@ class TestCRCEdgeCases:
 
         assert verify_crc16(data, crc16_val)
         assert verify_crc32(data, crc32_val)
+
+    def test_incremental_update_matches_concatenation(self) -> None:
+        """Test chunked CRC updates equal the CRC of the concatenated data."""
+        header, payload = b"\x00\x00\x00\x05", b"Hello"
+
+        assert crc16_update(payload, crc16_update(header)) == crc16(header + payload)
+        assert crc16_update(payload, crc16_update(header, poly=0x8005), poly=0x8005) == crc16(
+            header + payload, poly=0x8005
+        )
+        assert crc32_update(payload, crc32_update(header)) == crc32(header + payload)
+        assert crc16_update(b"") == crc16(b"")
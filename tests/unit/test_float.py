@@ -3,6 +3,10 @@
 import pytest
 
 from uwacomm import BaseMessage, decode, encode
+from uwacomm.codec.bitpack import BitPacker
+from uwacomm.codec.encoder import _encode_field
+from uwacomm.codec.schema import MessageSchema
+from uwacomm.codegen import compile_decoder, compile_encoder
 from uwacomm.models.fields import BoundedFloat
 
 
@@ -106,3 +110,33 @@ class TestFloatEncoding:
         decoded = decode(IntegerLikeFloat, encoded)
 
         assert decoded.value == pytest.approx(43.0, abs=0.5)
+
+    def test_precomputed_scale_metadata(self):
+        """The schema precomputes scale, scaled range and width; the JSON schema is unchanged."""
+        assert FloatMessage.model_fields["depth"].json_schema_extra == {"precision": 2}
+
+        depth = MessageSchema.from_model(FloatMessage).fields[0]
+        assert (depth.scale, depth.int_max, depth.bits_required()) == (100, 10500, 14)
+
+    def test_ties_round_half_to_even(self):
+        """Scaled values exactly halfway between steps round to even on the wire."""
+
+        class Tenths(BaseMessage):
+            value: float = BoundedFloat(min=0.0, max=10.0, precision=1)
+
+        # 0.25 and 0.75 scale to exactly 2.5 and 7.5 (7 bits, padded to 1 byte)
+        assert encode(Tenths(value=0.25)) == bytes([2 << 1])
+        assert encode(Tenths(value=0.75)) == bytes([8 << 1])
+        assert decode(Tenths, bytes([8 << 1])).value == 0.8
+
+    def test_packed_as_single_integer(self):
+        """The 81-bit float message is packed through one big-int accumulator."""
+        msg = FloatMessage(depth=25.75, temperature=18.3, latitude=42.358894, longitude=-71.063611)
+        packer = BitPacker()
+        for fs in MessageSchema.from_model(FloatMessage).fields:
+            _encode_field(packer, fs, getattr(msg, fs.name))
+
+        assert "acc.to_bytes(11" in compile_encoder(FloatMessage).__uwacomm_source__
+        assert compile_decoder(FloatMessage) is not None
+        assert encode(msg) == packer.to_bytes()
+        assert decode(FloatMessage, packer.to_bytes()) == decode(FloatMessage, encode(msg))
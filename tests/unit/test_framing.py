@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 import pytest
 
+from uwacomm import BaseMessage, BoundedInt, decode, encode
 from uwacomm.exceptions import FramingError
-from uwacomm.framing import frame_message, frame_with_id, unframe_message, unframe_with_id
+from uwacomm.framing import (
+    encode_framed,
+    frame_message,
+    frame_with_id,
+    unframe_message,
+    unframe_with_id,
+)
+from uwacomm.utils.crc import crc16_bytes, crc32_bytes
 
 
 class TestBasicFraming:
@@ -16,8 +26,23 @@ class TestBasicFraming:
         payload = b"Hello, World!"
         framed = frame_message(payload, length_prefix=False, crc=None)
 
-        # No framing added
-        assert framed == payload
+        # No framing added, and nothing copied
+        assert framed is payload
+        assert unframe_message(framed, length_prefix=False, crc=None) is payload
+
+        buffer = bytearray(payload)
+        assert type(frame_message(buffer, length_prefix=False)) is bytes
+        assert unframe_message(memoryview(buffer), length_prefix=False) == payload
+
+    def test_frame_buffer_payloads(self) -> None:
+        """Test bytearray/memoryview payloads frame to the same bytes as a bytes payload."""
+        payload = b"Hello, World!"
+        for length_prefix in (False, True):
+            for crc in (None, "crc16", "crc32"):
+                expected = frame_message(payload, length_prefix=length_prefix, crc=crc)
+                for buffer in (bytearray(payload), memoryview(payload)):
+                    framed = frame_message(buffer, length_prefix=length_prefix, crc=crc)
+                    assert type(framed) is bytes and framed == expected
 
     def test_frame_with_length(self) -> None:
         """Test framing with length prefix."""
@@ -52,6 +77,13 @@ class TestBasicFraming:
         unframed = unframe_message(framed, length_prefix=False, crc="crc32")
         assert unframed == payload
 
+    def test_frame_crc_algorithms_on_wire(self) -> None:
+        """Test frames carry IEEE CRC-32 and CRC-16/CCITT-FALSE (not CRC-32C) big-endian."""
+        check = b"123456789"
+
+        assert frame_message(check, length_prefix=False, crc="crc32")[-4:] == b"\xcb\xf4\x39\x26"
+        assert frame_message(check, length_prefix=False, crc="crc16")[-2:] == b"\x29\xb1"
+
     def test_frame_with_all_options(self) -> None:
         """Test framing with all options."""
         payload = b"Complete frame test"
@@ -88,6 +120,24 @@ class TestFramingErrors:
         with pytest.raises(FramingError, match="CRC.*verification failed"):
             unframe_message(corrupted, length_prefix=False, crc="crc16")
 
+    def test_unframe_crc16_detects_every_bit_flip(self) -> None:
+        """Test any single flipped bit in a CRC-16 frame (CRC included) is rejected."""
+        framed = frame_message(b"Hello, World!", crc="crc16")
+        for bit in range(len(framed) * 8):
+            corrupted = bytearray(framed)
+            corrupted[bit >> 3] ^= 0x80 >> (bit & 7)
+            with pytest.raises(FramingError):
+                unframe_message(corrupted, crc="crc16", validate_length=False)
+
+    def test_unframe_crc32_detects_every_bit_flip(self) -> None:
+        """Test any single flipped bit in a CRC-32 frame (CRC included) is rejected."""
+        framed = frame_message(b"Hello, World!", crc="crc32")
+        for bit in range(len(framed) * 8):
+            corrupted = bytearray(framed)
+            corrupted[bit >> 3] ^= 0x80 >> (bit & 7)
+            with pytest.raises(FramingError):
+                unframe_message(corrupted, crc="crc32", validate_length=False)
+
     def test_unframe_length_mismatch(self) -> None:
         """Test error on length mismatch."""
         # Manually construct frame with wrong length
@@ -117,6 +167,7 @@ class TestFramingWithID:
 
         # 4-byte length + 2-byte ID + payload
         assert len(framed) == 4 + 2 + len(payload)
+        assert framed[:6] == b"\x00\x00\x00\x07\x00\x2a"  # Length counts the ID
 
         decoded_id, decoded_payload = unframe_with_id(framed, crc=None)
         assert decoded_id == message_id
@@ -131,6 +182,8 @@ class TestFramingWithID:
 
         # 4-byte length + 2-byte ID + payload + 4-byte CRC
         assert len(framed) == 4 + 2 + len(payload) + 4
+        assert framed[-4:] == crc32_bytes(framed[:-4])  # CRC covers length + ID + payload
+        assert frame_with_id(payload, message_id, crc="crc16")[-2:] == crc16_bytes(framed[:-4])
 
         decoded_id, decoded_payload = unframe_with_id(framed, crc="crc32")
         assert decoded_id == message_id
@@ -159,6 +212,52 @@ class TestFramingWithID:
         with pytest.raises(FramingError, match="[Ll]ength mismatch|too short"):
             unframe_with_id(framed, crc=None)
 
+    def test_unframe_buffer_input_returns_bytes(self) -> None:
+        """Test mutable buffers are unframed in place and payloads come back as bytes."""
+        framed = bytearray(frame_with_id(b"Hello", 7, crc="crc32"))
+
+        msg_id, payload = unframe_with_id(framed, crc="crc32")
+        assert (msg_id, payload) == (7, b"Hello")
+        assert type(payload) is bytes
+        assert type(unframe_message(framed, crc="crc32")) is bytes
+
+        framed[6] ^= 0xFF
+        with pytest.raises(FramingError, match="CRC-32"):
+            unframe_with_id(framed, crc="crc32")
+
+
+class TestEncodeFramed:
+    """Test fused encode + frame_with_id."""
+
+    def test_matches_encode_then_frame(self) -> None:
+        """Test encode_framed equals frame_with_id(encode(msg)) for every CRC option."""
+
+        class Ping(BaseMessage):
+            seq: int = BoundedInt(ge=0, le=1000)
+            ok: bool
+
+            uwacomm_id: ClassVar[int | None] = 300
+
+        msg = Ping(seq=999, ok=True)
+        for crc in (None, "crc16", "crc32"):
+            expected = frame_with_id(encode(msg), 300, crc=crc)  # type: ignore[arg-type]
+            assert encode_framed(msg, crc=crc) == expected  # type: ignore[arg-type]
+            assert encode_framed(msg, 7, crc=crc)[4:6] == b"\x00\x07"  # type: ignore[arg-type]
+
+        msg_id, payload = unframe_with_id(encode_framed(msg, crc="crc32"), crc="crc32")
+        assert (msg_id, decode(Ping, payload)) == (300, msg)
+
+    def test_message_id_required(self) -> None:
+        """Test a missing or out-of-range message ID is rejected before encoding."""
+
+        class NoId(BaseMessage):
+            seq: int = BoundedInt(ge=0, le=10)
+
+        with pytest.raises(ValueError, match="no uwacomm_id"):
+            encode_framed(NoId(seq=1))
+        with pytest.raises(ValueError, match="Message ID must be"):
+            encode_framed(NoId(seq=1), 70000)
+
 
 class TestRoundTrip:
     """Test round-trip framing/unframing."""
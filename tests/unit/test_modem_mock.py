@@ -2,13 +2,42 @@
 
 from __future__ import annotations
 
+import dataclasses
+import logging
+import queue
+import random
+import threading
 import time
+from collections.abc import Iterator
 
 import pytest
 
 from uwacomm.modem import MockModemConfig, MockModemDriver
 
 
+@pytest.fixture(scope="module")
+def shared_modem() -> Iterator[MockModemDriver]:
+    """One connected modem reused by loopback tests; each test calls reset() first."""
+    modem = MockModemDriver()
+    modem.connect("/dev/null", 19200)
+    yield modem
+    modem.disconnect()
+
+
+# Zero delay, no loss, no bit errors: deterministic delivery for ordering tests
+_IDEAL = MockModemConfig(transmission_delay=0.0, packet_loss_probability=0.0, bit_error_rate=0.0)
+
+
+def _drain(modem: MockModemDriver) -> list[bytes | None]:
+    """Take whatever is currently in the modem's rx_queue."""
+    items: list[bytes | None] = []
+    while True:
+        try:
+            items.append(modem.rx_queue.get_nowait())
+        except queue.Empty:
+            return items
+
+
 class TestMockModemConfig:
     """Tests for MockModemConfig validation."""
 
@@ -81,6 +110,17 @@ class TestMockModemConfig:
         with pytest.raises(ValueError, match="data_rate must be > 0"):
             MockModemConfig(data_rate=-100)
 
+    def test_config_is_immutable(self) -> None:
+        """Test that config is frozen, slotted and hashable."""
+        config = MockModemConfig()
+        assert not hasattr(config, "__dict__")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_frame_size = 32  # type: ignore[misc]
+
+        assert hash(config) == hash(MockModemConfig())
+        assert dataclasses.replace(config, max_frame_size=32).max_frame_size == 32
+
 
 class TestMockModemDriver:
     """Tests for MockModemDriver."""
@@ -94,6 +134,14 @@ class TestMockModemDriver:
         assert len(modem.rx_callbacks) == 0
         assert modem._running is False
 
+    def test_driver_is_slotted(self) -> None:
+        """Test that driver state lives in slots, not a per-instance dict."""
+        modem = MockModemDriver()
+
+        assert not hasattr(modem, "__dict__")
+        with pytest.raises(AttributeError):
+            modem.unknown_attribute = 1  # type: ignore[attr-defined]
+
     def test_custom_config_initialization(self) -> None:
         """Test driver initialization with custom config."""
         config = MockModemConfig(transmission_delay=2.0, packet_loss_probability=0.2)
@@ -117,6 +165,24 @@ class TestMockModemDriver:
         modem.disconnect()
         assert modem._running is False
 
+    def test_disconnect_stops_background_threads(self) -> None:
+        """Test that disconnect wakes and joins the RX and scheduler threads."""
+        modem = MockModemDriver(MockModemConfig(transmission_delay=10.0))
+        modem.connect("/dev/null", 19200)
+        rx_thread = modem._rx_thread
+        sched_thread = modem._sched_thread
+        assert rx_thread is not None and rx_thread.is_alive()
+        assert sched_thread is not None and sched_thread.is_alive()
+
+        # A frame still in flight must not keep the scheduler alive
+        modem.send_frame(b"\x01", dest_id=0)
+        modem.disconnect()
+
+        assert not rx_thread.is_alive()
+        assert not sched_thread.is_alive()
+        assert modem._rx_thread is None
+        assert modem._sched_thread is None
+
     def test_double_connect_is_safe(self) -> None:
         """Test that double connect doesn't crash."""
         modem = MockModemDriver()
@@ -133,6 +199,68 @@ class TestMockModemDriver:
         modem.disconnect()  # Should be safe
         assert modem._running is False
 
+    def test_reset_drops_pending_state(self) -> None:
+        """Test that reset() clears callbacks and in-flight frames and swaps config."""
+        modem = MockModemDriver(MockModemConfig(transmission_delay=10.0))
+        modem.connect("/dev/null", 19200)
+        modem.attach_rx_callback(lambda data, src: None)
+        modem.send_frame(b"\x01", dest_id=0)
+
+        config = MockModemConfig(transmission_delay=0.0, max_frame_size=8)
+        modem.reset(config)
+
+        assert modem.config is config
+        assert modem.rx_callbacks == [] and modem._rx_callbacks_tuple == ()
+        assert modem._sched_heap == []
+        # Only reset()'s wake-up sentinel can remain for the RX thread
+        assert all(item is None for item in _drain(modem))
+        with pytest.raises(ValueError, match="max_frame_size 8"):
+            modem.send_frame(bytes(9), dest_id=0)
+        assert modem._sched_thread is not None and modem._sched_thread.is_alive()
+
+        modem.disconnect()
+
+    def test_reset_drops_batches_taken_before_it(self) -> None:
+        """Test a batch the RX thread took before reset() never reaches later callbacks."""
+        modem = MockModemDriver(_IDEAL)
+        modem.connect("/dev/null", 19200)
+        stale = modem._generation
+
+        modem.reset()
+        received: list[bytes] = []
+        modem.attach_rx_callback(lambda data, src: received.append(data))
+        modem._dispatch([b"\x00old"], stale)  # As if taken from rx_queue before reset()
+        modem.send_frame(b"new", dest_id=0)
+        time.sleep(0.2)
+
+        assert received == [b"new"]
+        modem.disconnect()
+
+    def test_reset_stops_lanes_still_draining(self) -> None:
+        """Test old callbacks stop receiving queued frames once reset() returns."""
+        modem = MockModemDriver(_IDEAL)
+        modem.connect("/dev/null", 19200)
+
+        entered = threading.Event()
+        release = threading.Event()
+        old: list[bytes] = []
+
+        def slow_callback(data: bytes, src: int) -> None:
+            entered.set()
+            release.wait(timeout=2.0)
+            old.append(data)
+
+        modem.attach_rx_callback(slow_callback)
+        modem.send_batch([(b"a", 0), (b"b", 0), (b"c", 0)])
+        assert entered.wait(timeout=2.0)
+
+        modem.reset()
+        release.set()
+        time.sleep(0.2)
+
+        assert old == [b"a"]  # The call in progress finishes; the rest are dropped
+        modem.disconnect()
+
     def test_send_frame_not_connected_raises(self) -> None:
         """Test that sending without connecting raises RuntimeError."""
         modem = MockModemDriver()
@@ -153,6 +281,23 @@ class TestMockModemDriver:
 
         modem.disconnect()
 
+    def test_send_frame_non_int_dest_id(self) -> None:
+        """Test non-int destination IDs are range-checked rather than rejected by type."""
+        modem = MockModemDriver(_IDEAL)
+        received: list[int] = []
+        modem.attach_rx_callback(lambda data, src: received.append(src))
+        modem.connect("/dev/null", 19200)
+
+        modem.send_frame(b"test", dest_id=3.0)  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="dest_id must be 0-255"):
+            modem.send_frame(b"test", dest_id=255.5)  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="dest_id must be 0-255"):
+            modem.send_batch([(b"test", -0.5)])  # type: ignore[list-item]
+        time.sleep(0.2)
+
+        assert received == [3]
+        modem.disconnect()
+
     def test_send_frame_too_large_raises(self) -> None:
         """Test that oversized frame raises ValueError."""
         config = MockModemConfig(max_frame_size=10)
@@ -164,15 +309,15 @@ class TestMockModemDriver:
 
         modem.disconnect()
 
-    def test_loopback_with_no_loss(self) -> None:
+    def test_loopback_with_no_loss(self, shared_modem: MockModemDriver) -> None:
         """Test loopback frame reception with 0% packet loss."""
         config = MockModemConfig(
             transmission_delay=0.1,  # Fast for testing
             packet_loss_probability=0.0,  # No loss
             bit_error_rate=0.0,  # No errors
         )
-        modem = MockModemDriver(config)
-        modem.connect("/dev/null", 19200)
+        modem = shared_modem
+        modem.reset(config)
 
         # Track received frames
         received: list[tuple[bytes, int]] = []
@@ -193,16 +338,14 @@ class TestMockModemDriver:
         assert len(received) == 1
         assert received[0] == (test_data, 42)
 
-        modem.disconnect()
-
-    def test_loopback_with_100_percent_loss(self) -> None:
+    def test_loopback_with_100_percent_loss(self, shared_modem: MockModemDriver) -> None:
         """Test that 100% packet loss prevents reception."""
         config = MockModemConfig(
             transmission_delay=0.1,
             packet_loss_probability=1.0,  # 100% loss
         )
-        modem = MockModemDriver(config)
-        modem.connect("/dev/null", 19200)
+        modem = shared_modem
+        modem.reset(config)
 
         # Track received frames
         received: list[tuple[bytes, int]] = []
@@ -221,16 +364,34 @@ class TestMockModemDriver:
         # Should not be received
         assert len(received) == 0
 
-        modem.disconnect()
-
-    def test_multiple_rx_callbacks(self) -> None:
+    def test_concurrent_attach_keeps_every_callback(self) -> None:
+        """Test callbacks attached from several threads at once are all kept."""
+        modem = MockModemDriver()
+        callbacks = [lambda data, src, i=i: None for i in range(400)]
+
+        threads = [
+            threading.Thread(
+                target=lambda chunk: [modem.attach_rx_callback(cb) for cb in chunk],
+                args=(callbacks[i::8],),
+            )
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(modem._rx_callbacks_tuple) == 400
+        assert modem._rx_callbacks_tuple == tuple(modem.rx_callbacks)
+
+    def test_multiple_rx_callbacks(self, shared_modem: MockModemDriver) -> None:
         """Test that multiple RX callbacks are all invoked."""
         config = MockModemConfig(
             transmission_delay=0.1,
             packet_loss_probability=0.0,
         )
-        modem = MockModemDriver(config)
-        modem.connect("/dev/null", 19200)
+        modem = shared_modem
+        modem.reset(config)
 
         # Register 3 callbacks
         received_1: list[bytes] = []
@@ -240,6 +401,7 @@ class TestMockModemDriver:
         modem.attach_rx_callback(lambda data, src: received_1.append(data))
         modem.attach_rx_callback(lambda data, src: received_2.append(data))
         modem.attach_rx_callback(lambda data, src: received_3.append(data))
+        assert modem._rx_callbacks_tuple == tuple(modem.rx_callbacks)
 
         # Send frame
         test_data = b"\xaa\xbb\xcc"
@@ -256,8 +418,6 @@ class TestMockModemDriver:
         assert received_2[0] == test_data
         assert received_3[0] == test_data
 
-        modem.disconnect()
-
     def test_rx_callback_exception_doesnt_crash(self) -> None:
         """Test that exception in RX callback doesn't crash modem."""
         config = MockModemConfig(
@@ -291,15 +451,15 @@ class TestMockModemDriver:
 
         modem.disconnect()
 
-    def test_bit_error_injection(self) -> None:
+    def test_bit_error_injection(self, shared_modem: MockModemDriver) -> None:
         """Test that bit errors are injected when BER > 0."""
         config = MockModemConfig(
             transmission_delay=0.1,
             packet_loss_probability=0.0,
             bit_error_rate=0.5,  # 50% BER (very high for testing)
         )
-        modem = MockModemDriver(config)
-        modem.connect("/dev/null", 19200)
+        modem = shared_modem
+        modem.reset(config)
 
         # Send same data multiple times
         test_data = b"\xff\xff\xff\xff"  # All 1s
@@ -319,17 +479,15 @@ class TestMockModemDriver:
         corrupted_count = sum(1 for data in received if data != test_data)
         assert corrupted_count > 0  # Should have at least some errors
 
-        modem.disconnect()
-
-    def test_no_bit_errors_when_ber_zero(self) -> None:
+    def test_no_bit_errors_when_ber_zero(self, shared_modem: MockModemDriver) -> None:
         """Test that no bit errors occur when BER is 0."""
         config = MockModemConfig(
             transmission_delay=0.1,
             packet_loss_probability=0.0,
             bit_error_rate=0.0,  # No errors
         )
-        modem = MockModemDriver(config)
-        modem.connect("/dev/null", 19200)
+        modem = shared_modem
+        modem.reset(config)
 
         test_data = b"\xaa\xbb\xcc\xdd"
         received: list[bytes] = []
@@ -347,7 +505,48 @@ class TestMockModemDriver:
         assert len(received) == 5
         assert all(data == test_data for data in received)
 
-        modem.disconnect()
+    def test_inject_bit_errors_full_ber_inverts_frame(self) -> None:
+        """Test that BER of 1.0 flips every bit of the frame."""
+        modem = MockModemDriver(MockModemConfig(bit_error_rate=1.0))
+
+        assert modem._inject_bit_errors(b"\x00\xff\x0f") == b"\xff\x00\xf0"
+
+    @pytest.mark.parametrize(("ber", "draws"), [(0.5, 1), (0.75, 2), (0.625, 3)])
+    def test_bulk_error_mask_draw_count(self, ber: float, draws: int) -> None:
+        """Test a dense-error frame costs one wide draw per binary digit of the BER."""
+        calls: list[int] = []
+
+        class CountingRandom(random.Random):
+            def getrandbits(self, k: int) -> int:
+                calls.append(k)
+                return super().getrandbits(k)
+
+        modem = MockModemDriver(MockModemConfig(bit_error_rate=ber))
+        modem._rng = CountingRandom()
+        modem._inject_bit_errors(b"\xff" * 64)
+
+        assert calls == [512] * draws
+
+    @pytest.mark.parametrize(
+        ("ber", "frames"),
+        [
+            (0.01, 2000),  # few errors per frame: geometric skip sampling
+            (0.1, 200),  # many errors per frame: bulk getrandbits() mask
+            (0.3, 200),
+        ],
+    )
+    def test_inject_bit_errors_rate_is_plausible(self, ber: float, frames: int) -> None:
+        """Test that the observed flip rate tracks the configured BER."""
+        modem = MockModemDriver(MockModemConfig(bit_error_rate=ber))
+        data = b"\x00" * 64
+        num_bits = len(data) * 8 * frames
+
+        flipped = sum(
+            bin(int.from_bytes(modem._inject_bit_errors(data), "big")).count("1")
+            for _ in range(frames)
+        )
+
+        assert 0.8 * ber < flipped / num_bits < 1.2 * ber
 
     def test_transmission_delay_is_respected(self) -> None:
         """Test that transmission delay is roughly correct."""
@@ -381,11 +580,159 @@ class TestMockModemDriver:
 
         modem.disconnect()
 
+    def test_slow_callback_does_not_block_others(self) -> None:
+        """Test that callbacks run in parallel but each sees frames in order."""
+        config = MockModemConfig(transmission_delay=0.0, packet_loss_probability=0.0)
+        modem = MockModemDriver(config)
+        modem.connect("/dev/null", 19200)
+
+        release = threading.Event()
+        slow: list[bytes] = []
+        fast: list[bytes] = []
+
+        def slow_callback(data: bytes, src: int) -> None:
+            release.wait(timeout=2.0)
+            slow.append(data)
+
+        modem.attach_rx_callback(slow_callback)
+        modem.attach_rx_callback(lambda data, src: fast.append(data))
+
+        for i in range(3):
+            modem.send_frame(bytes([i]), dest_id=0)
+        time.sleep(0.2)
+
+        # The fast callback got everything while the slow one is still blocked
+        assert fast == [bytes([i]) for i in range(3)]
+        assert slow == []
+
+        release.set()
+        time.sleep(0.2)
+        assert slow == [bytes([i]) for i in range(3)]
+
+        modem.disconnect()
+
+    def test_rx_burst_delivered_in_order(self) -> None:
+        """Test that a burst larger than one RX batch arrives complete and in order."""
+        modem = MockModemDriver()
+        received: list[bytes] = []
+        modem.attach_rx_callback(lambda data, src: received.append(data))
+        modem.connect("/dev/null", 19200)
+
+        for i in range(100):
+            modem.rx_queue.put(bytes([0, i]))
+        time.sleep(0.3)
+
+        assert received == [bytes([i]) for i in range(100)]
+
+        modem.disconnect()
+
+    def test_callback_error_is_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a failing callback is logged and does not affect others."""
+        config = MockModemConfig(transmission_delay=0.0, packet_loss_probability=0.0)
+        modem = MockModemDriver(config)
+        received: list[bytes] = []
+
+        def broken(data: bytes, src: int) -> None:
+            raise RuntimeError("boom")
+
+        modem.attach_rx_callback(broken)
+        modem.attach_rx_callback(lambda data, src: received.append(data))
+        modem.connect("/dev/null", 19200)
+
+        with caplog.at_level(logging.ERROR, logger="uwacomm.modem.mock"):
+            modem.send_frame(b"\x01", dest_id=0)
+            time.sleep(0.2)
+
+        assert received == [b"\x01"]
+        assert "RX callback error" in caplog.text
+        assert "boom" in caplog.text
+
+        modem.disconnect()
+
+    def test_ideal_channel_skips_rng(self) -> None:
+        """Test that a lossless, error-free channel never draws random numbers."""
+        config = MockModemConfig(packet_loss_probability=0.0, bit_error_rate=0.0)
+        assert not config._has_loss and not config._has_ber
+
+        class NoRandom(random.Random):
+            def random(self) -> float:
+                raise AssertionError("RNG used on an ideal channel")
+
+        modem = MockModemDriver(config)
+        modem._rng = NoRandom()
+        modem.connect("/dev/null", 19200)
+        modem.send_frame(b"\x01\x02", dest_id=0)
+        modem.disconnect()
+
+    def test_send_batch_delivers_in_order(self) -> None:
+        """Test that a batch is delivered in order with per-frame destinations."""
+        config = MockModemConfig(
+            transmission_delay=0.05, packet_loss_probability=0.0, bit_error_rate=0.0
+        )
+        modem = MockModemDriver(config)
+        received: list[tuple[bytes, int]] = []
+        modem.attach_rx_callback(lambda data, src: received.append((data, src)))
+        modem.connect("/dev/null", 19200)
+
+        frames = [(bytes([i]), i % 4) for i in range(10)]
+        modem.send_batch(frames)
+        time.sleep(0.3)
+
+        assert received == frames
+
+        modem.disconnect()
+
+    def test_send_batch_validates_before_sending(self) -> None:
+        """Test that one invalid frame rejects the whole batch."""
+        modem = MockModemDriver(MockModemConfig(transmission_delay=10.0))
+        modem.connect("/dev/null", 19200)
+
+        with pytest.raises(ValueError, match="dest_id must be 0-255"):
+            modem.send_batch([(b"\x01", 0), (b"\x02", 300)])
+        assert modem._sched_heap == []
+
+        modem.disconnect()
+
+    def test_send_batch_not_connected_raises(self) -> None:
+        """Test that batch sending without connecting raises RuntimeError."""
+        modem = MockModemDriver()
+
+        with pytest.raises(RuntimeError, match="MockModem not connected"):
+            modem.send_batch([(b"test", 0)])
+
+    def test_only_new_earliest_delivery_wakes_scheduler(self) -> None:
+        """Test that frames queued behind an earlier delivery do not wake the scheduler."""
+        notifies: list[int] = []
+
+        class CountingCondition(threading.Condition):
+            def notify(self, n: int = 1) -> None:
+                notifies.append(n)
+                super().notify(n)
+
+        config = MockModemConfig(
+            transmission_delay=0.2, packet_loss_probability=0.0, bit_error_rate=0.0
+        )
+        modem = MockModemDriver(config)
+        modem._sched_cv = CountingCondition()
+        received: list[bytes] = []
+        modem.attach_rx_callback(lambda data, src: received.append(data))
+        modem.connect("/dev/null", 19200)
+
+        for i in range(5):
+            modem.send_frame(bytes([i]), dest_id=0)
+        modem.send_batch([(b"\x05", 0), (b"\x06", 0)])
+        assert len(notifies) == 1
+
+        time.sleep(0.5)
+        assert received == [bytes([i]) for i in range(7)]
+        modem.disconnect()
+
     def test_multiple_frames_in_flight(self) -> None:
         """Test sending multiple frames before they're received (queue behavior)."""
         config = MockModemConfig(
             transmission_delay=0.2,
             packet_loss_probability=0.0,
+            bit_error_rate=0.0,
         )
         modem = MockModemDriver(config)
         modem.connect("/dev/null", 19200)
@@ -401,8 +748,9 @@ class TestMockModemDriver:
         # Wait for all to arrive
         time.sleep(0.5)
 
-        # All 5 should be received
+        # All 5 should be received, with no thread spawned per frame in flight
         assert len(received) == 5
         assert received == [bytes([i]) for i in range(5)]
+        assert not any(isinstance(t, threading.Timer) for t in threading.enumerate())
 
         modem.disconnect()
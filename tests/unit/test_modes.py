@@ -6,14 +6,28 @@ This test suite covers:
 - Mode 3: Multi-vehicle routing (to be added in Phase 3)
 """
 
+import dataclasses
+from types import SimpleNamespace
 from typing import ClassVar
 
 import pytest
 
 from uwacomm import BaseMessage, decode, encode
+from uwacomm.codec._fast import encode_routed
+from uwacomm.codec.encoder import _encode_generic
 from uwacomm.exceptions import DecodeError, EncodeError
 from uwacomm.models.fields import BoundedInt
-from uwacomm.routing import MESSAGE_REGISTRY, decode_by_id, register_message
+from uwacomm.routing import (
+    MESSAGE_REGISTRY,
+    RoutingHeader,
+    decode_by_id,
+    decode_with_routing,
+    encode_routing_batch,
+    encode_with_routing,
+    pack_routing_batch,
+    register_message,
+    unpack_routing_batch,
+)
 
 
 # Test message classes
@@ -153,6 +167,64 @@ class TestMode2SelfDescribing:
         assert decoded == original
         assert decoded.value == 175
 
+    def test_mode2_id_prefix_bytes(self):
+        """Mode 2: ID prefix is 0xxxxxxx or 1xxxxxxx xxxxxxxx ahead of the Mode 1 body."""
+        assert encode(SimpleMessage(value=7), include_id=True) == bytes([42, 7])
+        assert encode(LargeIdMessage(value=7), include_id=True) == bytes([0x80, 200, 7])
+
+        for msg in (SimpleMessage(value=7), LargeIdMessage(value=7)):
+            encoded = encode(msg, include_id=True)
+            assert decode(type(msg), encoded, include_id=True) == msg
+            with pytest.raises(DecodeError, match="[Tt]runcated"):
+                decode(type(msg), encoded[:-1], include_id=True)
+
+    def test_mode2_id_reassignment_takes_effect(self):
+        """Mode 2: the ID prefix follows uwacomm_id even if it changes after encoding."""
+
+        class Retagged(BaseMessage):
+            value: int = BoundedInt(ge=0, le=255)
+
+            uwacomm_id: ClassVar[int | None] = 5
+
+        assert encode(Retagged(value=1), include_id=True) == bytes([5, 1])
+        Retagged.uwacomm_id = 130
+        assert encode(Retagged(value=1), include_id=True) == bytes([0x80, 130, 1])
+        Retagged.uwacomm_id = None
+        with pytest.raises(EncodeError, match="has no uwacomm_id"):
+            encode(Retagged(value=1), include_id=True)
+
+    def test_mode2_id_width_boundaries(self):
+        """Mode 2: IDs switch from 1 to 2 bytes exactly at 128 and round-trip at the edges."""
+
+        class Edge(BaseMessage):
+            value: int = BoundedInt(ge=0, le=255)
+
+            uwacomm_id: ClassVar[int | None] = 0
+
+        for msg_id, prefix in (
+            (0, b"\x00"),
+            (127, b"\x7f"),
+            (128, b"\x80\x80"),
+            (32767, b"\xff\xff"),
+        ):
+            Edge.uwacomm_id = msg_id
+            data = encode(Edge(value=7), include_id=True)
+            assert data == prefix + b"\x07"
+            assert decode(Edge, data, include_id=True) == Edge(value=7)
+
+    def test_mode2_max_bytes_counts_id(self):
+        """Mode 2: uwacomm_max_bytes applies to the ID prefix plus payload."""
+
+        class Tight(BaseMessage):
+            value: int = BoundedInt(ge=0, le=255)
+
+            uwacomm_id: ClassVar[int | None] = 300
+            uwacomm_max_bytes: ClassVar[int | None] = 2
+
+        assert len(encode(Tight(value=1))) == 1
+        with pytest.raises(EncodeError, match="exceeds uwacomm_max_bytes"):
+            encode(Tight(value=1), include_id=True)
+
 
 # ============================================================================
 # Mode 2: Auto-Decode by ID (MESSAGE_REGISTRY)
@@ -178,6 +250,66 @@ class TestAutoDecodeById:
         register_message(SimpleMessage)  # Should not raise error
         assert MESSAGE_REGISTRY[SimpleMessage.uwacomm_id] is SimpleMessage
 
+    def test_register_after_registry_cleared(self):
+        """Re-registering after the registry is cleared stores the class again."""
+        register_message(SimpleMessage)
+        MESSAGE_REGISTRY.clear()
+        register_message(SimpleMessage)
+        assert MESSAGE_REGISTRY[SimpleMessage.uwacomm_id] is SimpleMessage
+
+    def test_decode_by_id_sees_registry_edits(self):
+        """Decoding looks IDs up in MESSAGE_REGISTRY itself, so direct edits apply."""
+        register_message(SimpleMessage)
+        encoded = encode(SimpleMessage(value=7), include_id=True)
+        MESSAGE_REGISTRY.clear()
+
+        with pytest.raises(DecodeError, match="Unknown message ID"):
+            decode_by_id(encoded)
+
+    def test_registry_behaves_like_dict(self):
+        """MESSAGE_REGISTRY keeps the dict interface on top of its ID-indexed table."""
+        register_message(LargeIdMessage)
+        register_message(SimpleMessage)
+
+        assert len(MESSAGE_REGISTRY) == 2
+        assert list(MESSAGE_REGISTRY) == [42, 200]  # ID order
+        assert dict(MESSAGE_REGISTRY) == {42: SimpleMessage, 200: LargeIdMessage}
+        assert 41 not in MESSAGE_REGISTRY and 40000 not in MESSAGE_REGISTRY
+        assert MESSAGE_REGISTRY.get(-1) is None and MESSAGE_REGISTRY.get("42") is None
+
+        del MESSAGE_REGISTRY[200]
+        assert dict(MESSAGE_REGISTRY) == {42: SimpleMessage}
+        with pytest.raises(KeyError):
+            del MESSAGE_REGISTRY[200]
+        with pytest.raises(ValueError, match="0-32767"):
+            MESSAGE_REGISTRY[32768] = SimpleMessage
+
+    def test_registry_keeps_high_ids_sparse(self):
+        """High IDs go in a side table: no 32768-slot list, same lookups and ordering."""
+        from uwacomm import routing
+
+        class TopId(BaseMessage):
+            value: int = BoundedInt(ge=0, le=255)
+
+            uwacomm_id: ClassVar[int | None] = 32767
+
+        register_message(TopId)
+        register_message(SimpleMessage)
+        MESSAGE_REGISTRY[5000] = LargeIdMessage
+
+        assert len(routing._MESSAGE_CLASSES) == SimpleMessage.uwacomm_id + 1
+        assert list(MESSAGE_REGISTRY) == [42, 5000, 32767]
+        assert MESSAGE_REGISTRY[32767] is TopId and 4096 not in MESSAGE_REGISTRY
+        assert decode_by_id(encode(TopId(value=3), include_id=True)) == TopId(value=3)
+
+        del MESSAGE_REGISTRY[5000]
+        assert len(MESSAGE_REGISTRY) == 2
+        with pytest.raises(KeyError):
+            del MESSAGE_REGISTRY[5000]
+        MESSAGE_REGISTRY.clear()
+        with pytest.raises(DecodeError, match="Unknown message ID: 32767"):
+            decode_by_id(encode(TopId(value=3), include_id=True))
+
     def test_register_conflict_raises_error(self):
         """Registering different classes with same ID raises error."""
         register_message(SimpleMessage)
@@ -250,6 +382,34 @@ class TestAutoDecodeById:
         with pytest.raises(DecodeError, match="Unknown message ID"):
             decode_by_id(encoded)
 
+    def test_decode_by_id_truncated_two_byte_id(self):
+        """Auto-decode of a lone 2-byte-ID prefix byte raises DecodeError."""
+        register_message(LargeIdMessage)
+        encoded = encode(LargeIdMessage(value=1), include_id=True)
+
+        with pytest.raises(DecodeError, match="Truncated"):
+            decode_by_id(encoded[:1])
+        with pytest.raises(DecodeError, match="empty"):
+            decode_by_id(b"")
+
+    def test_decode_by_id_body_errors_and_stale_registration(self):
+        """Auto-decode reports truncated bodies and classes whose ID changed after registering."""
+
+        class Moved(BaseMessage):
+            value: int = BoundedInt(ge=0, le=255)
+
+            uwacomm_id: ClassVar[int | None] = 77
+
+        register_message(Moved)
+        encoded = encode(Moved(value=9), include_id=True)
+        assert decode_by_id(bytearray(encoded)) == Moved(value=9)
+        with pytest.raises(DecodeError, match="[Tt]runcated"):
+            decode_by_id(encoded[:1])
+
+        Moved.uwacomm_id = 78  # Still registered under 77
+        with pytest.raises(DecodeError, match="Message ID mismatch"):
+            decode_by_id(encoded)
+
 
 # ============================================================================
 # Edge Cases and Error Handling
@@ -344,10 +504,13 @@ class TestBandwidthComparison:
 class TestMode3MultiVehicleRouting:
     """Test Mode 3: Multi-vehicle routing with RoutingHeader."""
 
+    def setup_method(self):
+        """Start each test with only SimpleMessage registered."""
+        MESSAGE_REGISTRY.clear()
+        register_message(SimpleMessage)
+
     def test_mode3_basic_routing(self):
         """Mode 3: Basic routing encode/decode."""
-        from uwacomm.routing import decode_with_routing, encode_with_routing
-
         msg = SimpleMessage(value=123)
 
         # Encode with routing (Vehicle 3 → Topside 0)
@@ -368,8 +531,6 @@ class TestMode3MultiVehicleRouting:
 
     def test_mode3_routing_header_validation(self):
         """RoutingHeader validates parameter ranges."""
-        from uwacomm.routing import RoutingHeader
-
         # Valid routing header
         header = RoutingHeader(source_id=10, dest_id=20, priority=3, ack_requested=False)
         assert header.source_id == 10
@@ -389,10 +550,74 @@ class TestMode3MultiVehicleRouting:
         with pytest.raises(ValueError, match="priority must be 0-3"):
             RoutingHeader(source_id=0, dest_id=0, priority=5)
 
+        # Negative values are rejected too
+        with pytest.raises(ValueError, match="source_id must be 0-255"):
+            RoutingHeader(source_id=-1, dest_id=0)
+
+    def test_mode3_routing_header_non_int_fields(self):
+        """RoutingHeader range-checks float and bool fields by comparison, as before."""
+        header = RoutingHeader(1.0, 2, 0)  # type: ignore[arg-type]
+        assert header.source_id == 1.0
+        assert RoutingHeader(True, False, True).priority is True
+
+        with pytest.raises(ValueError, match="source_id must be 0-255"):
+            RoutingHeader(255.5, 0)  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="priority must be 0-3"):
+            RoutingHeader(0, 0, 3.5)  # type: ignore[arg-type]
+
+    def test_encode_with_routing_validation(self):
+        """encode_with_routing() matches encode(routing=...) and rejects out-of-range fields."""
+        msg = SimpleMessage(value=7)
+        for args in ((0, 0, 0, False), (255, 255, 3, True), (3, 0, 2, True)):
+            assert encode_with_routing(msg, *args) == encode(msg, routing=RoutingHeader(*args))
+
+        for args, error in (
+            ((256, 0), "source_id must be 0-255"),
+            ((0, -1), "dest_id must be 0-255"),
+            ((0, 0, 4), "priority must be 0-3"),
+        ):
+            with pytest.raises(ValueError, match=error):
+                encode_with_routing(msg, *args)
+
+        # Values the compiled encoder defers on still reach the generic path's checks
+        with pytest.raises(EncodeError, match="out of bounds"):
+            encode_with_routing(SimpleMessage.model_construct(value=256), 3, 0)
+
+    def test_encode_rejects_out_of_range_routing_objects(self):
+        """encode(routing=...) range-checks header fields of objects that are not RoutingHeaders."""
+        msg = SimpleMessage(value=7)
+        for fields in (
+            {"source_id": 1, "dest_id": 2, "priority": 7},
+            {"source_id": 300, "dest_id": 2, "priority": 0},
+            {"source_id": 1, "dest_id": -1, "priority": 0},
+        ):
+            routing = SimpleNamespace(**fields, ack_requested=False)
+            with pytest.raises(EncodeError, match="Routing header out of range"):
+                encode(msg, routing=routing)
+
+    def test_mode3_routing_header_immutable(self):
+        """RoutingHeader is frozen and slotted."""
+        header = RoutingHeader(source_id=1, dest_id=2)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            header.priority = 3  # type: ignore[misc]
+        assert not hasattr(header, "__dict__")
+        assert dataclasses.replace(header, priority=3).priority == 3
+
+    def test_mode3_decoded_headers_shared(self):
+        """Mode 3: decoding the same header word returns one shared, equal RoutingHeader."""
+        frames = [
+            encode_with_routing(SimpleMessage(value=v), source_id=9, dest_id=255, priority=3)
+            for v in (1, 2)
+        ]
+        (first, _), (second, _) = (decode_with_routing(SimpleMessage, f) for f in frames)
+
+        assert first is second
+        assert first == RoutingHeader(source_id=9, dest_id=255, priority=3)
+        direct = decode(SimpleMessage, memoryview(frames[0]), routing=True)
+        assert isinstance(direct, tuple) and direct[0] is first
+
     def test_mode3_different_priorities(self):
         """Mode 3: Different priority levels work correctly."""
-        from uwacomm.routing import decode_with_routing, encode_with_routing
-
         msg = SimpleMessage(value=100)
 
         for priority in range(4):  # 0-3
@@ -404,8 +629,6 @@ class TestMode3MultiVehicleRouting:
 
     def test_mode3_broadcast_destination(self):
         """Mode 3: Broadcast destination (dest_id=255) works."""
-        from uwacomm.routing import decode_with_routing, encode_with_routing
-
         msg = SimpleMessage(value=99)
 
         # Broadcast to all vehicles (dest_id=255)
@@ -418,8 +641,6 @@ class TestMode3MultiVehicleRouting:
 
     def test_mode3_ack_requested_flag(self):
         """Mode 3: ACK requested flag works correctly."""
-        from uwacomm.routing import decode_with_routing, encode_with_routing
-
         msg = SimpleMessage(value=50)
 
         # ACK not requested
@@ -434,8 +655,6 @@ class TestMode3MultiVehicleRouting:
 
     def test_mode3_roundtrip_preserves_all_data(self):
         """Mode 3: Full roundtrip preserves routing and message data."""
-        from uwacomm.routing import decode_with_routing, encode_with_routing
-
         original_msg = SimpleMessage(value=175)
 
         encoded = encode_with_routing(
@@ -456,22 +675,12 @@ class TestMode3MultiVehicleRouting:
 
     def test_mode3_includes_message_id(self):
         """Mode 3: Routing mode automatically includes message ID."""
-        from uwacomm.routing import encode_with_routing
-
         msg = SimpleMessage(value=123)
 
         # Mode 3 should automatically include message ID
         encoded = encode_with_routing(msg, source_id=1, dest_id=2)
 
         # The message should be self-describing (includes ID)
-        # We can verify by checking that decode_by_id works
-        from uwacomm.routing import MESSAGE_REGISTRY
-
-        MESSAGE_REGISTRY.clear()
-        from uwacomm.routing import register_message
-
-        register_message(SimpleMessage)
-
         # Skip routing header to get to the message ID + payload
         # Routing: 19 bits = 3 bytes (rounded up)
         # But we need to skip exactly 19 bits, not 3 bytes
@@ -484,8 +693,6 @@ class TestMode3MultiVehicleRouting:
 
     def test_mode3_different_vehicles(self):
         """Mode 3: Multiple vehicles can send to each other."""
-        from uwacomm.routing import decode_with_routing, encode_with_routing
-
         msg1 = SimpleMessage(value=10)
         msg2 = SimpleMessage(value=20)
         msg3 = SimpleMessage(value=30)
@@ -505,6 +712,107 @@ class TestMode3MultiVehicleRouting:
         r3, d3 = decode_with_routing(SimpleMessage, enc3)
         assert r3.source_id == 3 and r3.dest_id == 0 and d3.value == 30
 
+    def test_routing_batch_pack_matches_wire(self):
+        """Batch-packed headers equal the 19-bit routing prefix on the wire."""
+        columns = ([3, 255, 0], [0, 7, 255], [2, 3, 0], [True, False, True])
+        packed = pack_routing_batch(*columns)
+
+        msg = SimpleMessage(value=1)
+        for word, src, dst, prio, ack in zip(packed, *columns):
+            wire = encode_with_routing(msg, src, dst, prio, ack)
+            assert word == int.from_bytes(wire[:3], "big") >> 5
+            header, _ = decode_with_routing(SimpleMessage, wire)
+            assert header == RoutingHeader(src, dst, prio, ack)
+
+        assert unpack_routing_batch(packed) == tuple(list(c) for c in columns)
+        assert unpack_routing_batch(iter(packed))[0] == [3, 255, 0]
+
+    def test_routing_batch_validation(self):
+        """Batch packing rejects ragged columns and out-of-range values."""
+        assert len(pack_routing_batch([], [], [], [])) == 0
+        with pytest.raises(ValueError, match="same length"):
+            pack_routing_batch([1, 2], [0], [0], [False])
+        with pytest.raises(ValueError, match="dest_id must be 0-255"):
+            pack_routing_batch([1], [256], [0], [False])
+        with pytest.raises(ValueError, match="priority must be 0-3"):
+            pack_routing_batch([1], [0], [4], [False])
+
+    def test_routing_batch_accepts_any_sequence(self):
+        """Batch packing takes array.array, range and array-like columns that refuse bool()."""
+        from array import array
+
+        class NoTruth(tuple):  # Like a NumPy array: bool() of many elements is an error
+            def __bool__(self):
+                raise ValueError("truth value is ambiguous")
+
+        expected = pack_routing_batch([250, 251], [0, 1], [3, 3], [True, False])
+        assert (
+            pack_routing_batch(
+                array("B", [250, 251]), range(2), NoTruth((3, 3)), NoTruth((True, False))
+            )
+            == expected
+        )
+        assert len(pack_routing_batch(NoTruth(), NoTruth(), NoTruth(), NoTruth())) == 0
+        with pytest.raises(ValueError, match="source_id must be 0-255"):
+            pack_routing_batch(NoTruth((256, 0)), range(2), range(2), range(2))
+
+    def test_mode3_compiled_matches_generic(self):
+        """The compiled Mode 3 paths match the bit packer for unaligned bodies."""
+
+        class Odd(BaseMessage):
+            flag: bool
+            level: int = BoundedInt(ge=0, le=100)  # 1 + 7 bits, then 12 more below
+            depth: int = BoundedInt(ge=-1000, le=3000)
+
+            uwacomm_id: ClassVar[int | None] = 5000
+
+        messages = [SimpleMessage(value=0xA5), LargeIdMessage(value=1)]
+        messages += [
+            Odd(flag=f, level=lv, depth=d) for f, lv, d in ((True, 99, -1), (False, 0, 3000))
+        ]
+        for msg in messages:
+            for header in (0, 0x7FFFF, 0x5A5A5):
+                data = encode_routed(msg, header)
+                assert data == _encode_generic(msg, True, header)
+
+                routing = RoutingHeader(
+                    header >> 11, (header >> 3) & 0xFF, (header >> 1) & 3, bool(header & 1)
+                )
+                expected = (routing, msg)
+                assert decode(type(msg), data, routing=True) == expected
+                assert decode(type(msg), data + b"\xff", routing=True) == expected
+                with pytest.raises(DecodeError, match="Truncated"):
+                    decode(type(msg), data[:-1], routing=True)
+
+        wrong = encode(SimpleMessage(value=1), routing=RoutingHeader(0, 0, 0))
+        with pytest.raises(DecodeError, match="Message ID mismatch"):
+            decode(LargeIdMessage, wrong, routing=True)
+
+    def test_encode_routing_batch(self):
+        """Batch Mode 3 encode equals encode_with_routing() message by message."""
+        messages = [SimpleMessage(value=7), LargeIdMessage(value=9), SimpleMessage(value=255)]
+        columns = ([3, 4, 5], [0, 255, 1], [2, 0, 3], [True, False, True])
+        frames = encode_routing_batch(messages, pack_routing_batch(*columns))
+
+        assert frames == [
+            encode_with_routing(msg, *route) for msg, *route in zip(messages, *columns)
+        ]
+        assert encode_routing_batch([], []) == []
+
+        class NoTruth(tuple):  # Like a NumPy array: bool() of many elements is an error
+            def __bool__(self):
+                raise ValueError("truth value is ambiguous")
+
+        assert encode_routing_batch(messages, NoTruth(pack_routing_batch(*columns))) == frames
+        with pytest.raises(ValueError, match="19-bit"):
+            encode_routing_batch(messages[:2], NoTruth((0, 1 << 19)))
+        with pytest.raises(ValueError, match="same length"):
+            encode_routing_batch(messages, [0])
+        with pytest.raises(ValueError, match="19-bit"):
+            encode_routing_batch([messages[0]], [1 << 19])
+        with pytest.raises(EncodeError, match="uwacomm_id"):
+            encode_routing_batch([NoIdMessage(value=1)], [0])
+
 
 # ============================================================================
 # All Modes Comparison
@@ -516,8 +824,6 @@ class TestAllModesComparison:
 
     def test_mode_size_progression(self):
         """Compare sizes across all three modes."""
-        from uwacomm.routing import encode_with_routing
-
         msg = SimpleMessage(value=100)
 
         # Mode 1: Point-to-point (minimal)
@@ -540,8 +846,6 @@ class TestAllModesComparison:
 
     def test_all_modes_preserve_data(self):
         """All three modes correctly preserve message data."""
-        from uwacomm.routing import decode_with_routing, encode_with_routing
-
         original = SimpleMessage(value=123)
 
         # Mode 1
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import re
+from typing import ClassVar
+
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 from pydantic import Field
 
-from uwacomm import BaseMessage, decode, encode
+from uwacomm import BaseMessage, DecodeError, decode, encode
 from uwacomm.framing import frame_message, unframe_message
+from uwacomm.routing import encode_with_routing
 from uwacomm.utils.crc import crc16, crc32, verify_crc16, verify_crc32
 
+# Compiled once for the many examples that hit it
+_TRUNCATED = re.compile("Truncated")
+
 
 class BoundedMessage(BaseMessage):
     """Message for property testing."""
@@ -18,6 +26,15 @@ class BoundedMessage(BaseMessage):
     flag: bool
 
 
+class RoutedMessage(BaseMessage):
+    """Message with a 2-byte ID, so Mode 3 bodies start unaligned."""
+
+    value: int = Field(ge=0, le=1000)
+    flag: bool
+
+    uwacomm_id: ClassVar[int | None] = 300
+
+
 class TestCodecProperties:
     """Property-based tests for codec."""
 
@@ -49,6 +66,20 @@ class TestCodecProperties:
             msg2 = BoundedMessage(value=value2, flag=flag2)
             assert encode(msg1a) != encode(msg2)
 
+    @given(
+        value=st.integers(min_value=0, max_value=1000),
+        flag=st.booleans(),
+        source=st.integers(min_value=0, max_value=255),
+        cut=st.integers(min_value=0, max_value=6),
+    )
+    def test_truncated_routed_data_raises(
+        self, value: int, flag: bool, source: int, cut: int
+    ) -> None:
+        """Test every strict prefix of a Mode 3 frame is reported as truncated."""
+        data = encode_with_routing(RoutedMessage(value=value, flag=flag), source, 0)
+        with pytest.raises(DecodeError, match=_TRUNCATED):
+            decode(RoutedMessage, data[: min(cut, len(data) - 1)], routing=True)
+
 
 class TestFramingProperties:
     """Property-based tests for framing."""
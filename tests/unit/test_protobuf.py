@@ -73,6 +73,34 @@ class TestProtoSchemaGeneration:
         assert "ACTIVE = 1;" in proto
         assert "ERROR = 2;" in proto
 
+    def test_unsupported_field_has_no_bit_comment(self) -> None:
+        """Test fields the compact encoder cannot size still appear without a bit count."""
+
+        class Unbounded(BaseMessage):
+            value: int
+
+        proto = to_proto_schema(Unbounded)
+
+        assert "int32 value = 1;" in proto
+        assert "uwacomm:" not in proto
+
+    def test_enum_order_follows_fields(self) -> None:
+        """Test enum definitions are emitted once each, in field order."""
+
+        class Mode(enum.Enum):
+            OFF = 0
+            ON = 1
+
+        class TwoEnums(BaseMessage):
+            mode: Mode
+            status: Status
+            backup_mode: Mode
+
+        proto = to_proto_schema(TwoEnums)
+
+        assert proto.count("enum Mode {") == 1
+        assert proto.index("enum Mode {") < proto.index("enum Status {")
+
     def test_proto_comments(self) -> None:
         """Test that field comments are generated."""
         proto = to_proto_schema(ComplexProtoMessage)